@@ -36,6 +36,8 @@ from .helpers import (
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.import_planner import ImportPlanner
+from .helpers.startup_trace import async_start_trace
 from .helpers.typing import ConfigType
 from .setup import (
     DATA_SETUP,
@@ -62,6 +64,7 @@ DATA_REGISTRIES_LOADED = "bootstrap_registries_loaded"
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
+IMPORT_TIMEOUT = 60
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
@@ -134,6 +137,7 @@ async def async_setup_hass(
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
     loader.async_setup(hass)
+    await loader.async_load_manifest_snapshot(hass)
     config_dict = None
     basic_setup_success = False
 
@@ -186,6 +190,7 @@ async def async_setup_hass(
         hass.config.external_url = old_config.external_url
         # Setup loader cache after the config dir has been set
         loader.async_setup(hass)
+        await loader.async_load_manifest_snapshot(hass)
 
     if safe_mode:
         _LOGGER.info("Starting in safe mode")
@@ -543,6 +548,9 @@ async def _async_set_up_integrations(
     hass.data[DATA_SETUP_STARTED] = {}
     setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
 
+    startup_trace = async_start_trace(hass)
+    startup_trace.async_start_loop_monitor()
+
     watch_task = asyncio.create_task(_async_watch_pending_setups(hass))
 
     domains_to_setup = _get_domains(hass, config)
@@ -583,30 +591,6 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
-    # Initialize recorder
-    if "recorder" in domains_to_setup:
-        recorder.async_initialize_recorder(hass)
-
-    # Load logging as soon as possible
-    if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
-        _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
-
-    # Setup frontend
-    if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
-        _LOGGER.info("Setting up frontend: %s", frontend_domains)
-        await async_setup_multi_components(hass, frontend_domains, config)
-
-    # Setup recorder
-    if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
-        _LOGGER.info("Setting up recorder: %s", recorder_domains)
-        await async_setup_multi_components(hass, recorder_domains, config)
-
-    # Start up debuggers. Start these first in case they want to wait.
-    if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
-        _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
-
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
 
@@ -631,13 +615,57 @@ async def _async_set_up_integrations(
 
     stage_2_domains = (
         domains_to_setup
-        - logging_domains
-        - frontend_domains
-        - recorder_domains
-        - debuggers
+        - LOGGING_INTEGRATIONS
+        - FRONTEND_INTEGRATIONS
+        - RECORDER_INTEGRATIONS
+        - DEBUGGER_INTEGRATIONS
         - stage_1_domains
     )
 
+    # Import the integrations of the stages in worker threads
+    # while the integrations that come before them are set up
+    import_planner = ImportPlanner(hass)
+    await import_planner.async_load()
+    import_planner.async_start(
+        [
+            integration_cache[domain]
+            for domain in stage_domains
+            - LOGGING_INTEGRATIONS
+            - FRONTEND_INTEGRATIONS
+            - RECORDER_INTEGRATIONS
+            - DEBUGGER_INTEGRATIONS
+            if domain in integration_cache
+        ]
+        for stage_domains in (stage_1_domains, stage_2_domains)
+    )
+
+    # Initialize recorder
+    if "recorder" in domains_to_setup:
+        recorder.async_initialize_recorder(hass)
+
+    # Load logging as soon as possible
+    if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
+        _LOGGER.info("Setting up logging: %s", logging_domains)
+        await async_setup_multi_components(hass, logging_domains, config)
+
+    # Setup frontend
+    if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
+        _LOGGER.info("Setting up frontend: %s", frontend_domains)
+        await async_setup_multi_components(hass, frontend_domains, config)
+
+    # Setup recorder
+    if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
+        _LOGGER.info("Setting up recorder: %s", recorder_domains)
+        await async_setup_multi_components(hass, recorder_domains, config)
+
+    # Start up debuggers. Start these first in case they want to wait.
+    if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
+        _LOGGER.debug("Setting up debuggers: %s", debuggers)
+        await async_setup_multi_components(hass, debuggers, config)
+
+    if not await import_planner.async_wait_imported(stage_1_domains, IMPORT_TIMEOUT):
+        _LOGGER.warning("Importing integrations timed out for stage 1 - moving forward")
+
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
 
@@ -656,6 +684,12 @@ async def _async_set_up_integrations(
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
+        if not await import_planner.async_wait_imported(
+            stage_2_domains, IMPORT_TIMEOUT
+        ):
+            _LOGGER.warning(
+                "Importing integrations timed out for stage 2 - moving forward"
+            )
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
             async with hass.timeout.async_timeout(
@@ -674,6 +708,7 @@ async def _async_set_up_integrations(
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
     watch_task.cancel()
+    startup_trace.async_stop_loop_monitor()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
 
     _LOGGER.debug(
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+import math
+from typing import Any, cast
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -21,3 +24,83 @@ def entities_may_have_state_changes_after(
             return True
 
     return False
+
+
+def _float_or_none(state: str) -> float | None:
+    """Return the value of a numeric state, NaN and infinity are not numeric."""
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _bucket_states(
+    values: list[float | None], states: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Return at most two states of a bucket in their order.
+
+    A bucket with only numeric states keeps the states with the lowest
+    and the highest value. Otherwise the first state that is not numeric
+    is kept, so gaps show up in graphs, together with the last state of
+    the bucket if it differs from that one.
+    """
+    if not values:
+        return []
+    if None not in values:
+        numeric = cast(list[float], values)
+        lowest = min(range(len(numeric)), key=numeric.__getitem__)
+        highest = max(range(len(numeric)), key=numeric.__getitem__)
+        return [states[idx] for idx in sorted({lowest, highest})]
+    first = values.index(None)
+    last = len(values) - 1
+    if (
+        last == first
+        or states[last][COMPRESSED_STATE_STATE] == states[first][COMPRESSED_STATE_STATE]
+    ):
+        return [states[first]]
+    return [states[first], states[last]]
+
+
+def downsample_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Downsample compressed states to at most max_points.
+
+    The period between the first and the last state is split into
+    buckets that keep at most two states each, see _bucket_states, so
+    peaks and unavailable periods still show up in graphs. The first
+    and last states are always kept. NaN and infinite states are
+    handled like other states that are not numeric.
+    """
+    if len(states) <= max_points:
+        return states
+    first_state = states[0]
+    last_state = states[-1]
+    start_ts: float = first_state[COMPRESSED_STATE_LAST_UPDATED]
+    end_ts: float = last_state[COMPRESSED_STATE_LAST_UPDATED]
+    bucket_count = max(max_points // 2 - 1, 1)
+    bucket_width = (end_ts - start_ts) / bucket_count
+    downsampled = [first_state]
+    bucket: int | None = None
+    bucket_values: list[float | None] = []
+    bucket_states: list[dict[str, Any]] = []
+    for state in states[1:-1]:
+        if bucket_width:
+            # The last bucket includes states at the end of the period
+            state_bucket = min(
+                int((state[COMPRESSED_STATE_LAST_UPDATED] - start_ts) / bucket_width),
+                bucket_count - 1,
+            )
+        else:
+            state_bucket = 0
+        if state_bucket != bucket:
+            downsampled.extend(_bucket_states(bucket_values, bucket_states))
+            bucket = state_bucket
+            bucket_values = []
+            bucket_states = []
+        bucket_values.append(_float_or_none(state[COMPRESSED_STATE_STATE]))
+        bucket_states.append(state)
+    downsampled.extend(_bucket_states(bucket_values, bucket_states))
+    downsampled.append(last_state)
+    return downsampled
@@ -17,7 +17,7 @@ import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, State, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
@@ -35,6 +35,9 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_LOG_STATE_MEMORY = "log_state_memory"
+SERVICE_START_LOG_EVENT_DISPATCH = "start_log_event_dispatch"
+SERVICE_STOP_LOG_EVENT_DISPATCH = "stop_log_event_dispatch"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -57,6 +60,9 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_STATE_MEMORY,
+    SERVICE_START_LOG_EVENT_DISPATCH,
+    SERVICE_STOP_LOG_EVENT_DISPATCH,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -67,6 +73,7 @@ CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+LOG_EVENT_DISPATCH_SUB = "log_event_dispatch_subscription"
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -254,6 +261,83 @@ async def async_setup_entry(  # noqa: C901
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
 
+    @callback
+    def _async_log_state_memory(call: ServiceCall) -> None:
+        """Log the approximate memory used by the state machine per domain."""
+        usage = _state_memory_by_domain(hass.states.async_all())
+        for domain, (count, size) in sorted(
+            usage.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            _LOGGER.critical(
+                "State memory for domain %s: %s states using %s bytes",
+                domain,
+                count,
+                size,
+            )
+        _LOGGER.critical(
+            "State memory total: %s states using %s bytes",
+            sum(count for count, _ in usage.values()),
+            sum(size for _, size in usage.values()),
+        )
+        persistent_notification.async_create(
+            hass,
+            (
+                "State memory usage has been dumped to the log. See [the"
+                " logs](/config/logs) to review the usage per domain."
+            ),
+            title="State memory usage",
+            notification_id="profile_state_memory",
+        )
+
+    @callback
+    def _async_log_event_dispatch(*_: Any) -> None:
+        """Log the dispatch statistics of the event bus per event type."""
+        for event_type, stats in sorted(
+            hass.bus.async_dispatch_stats().items(),
+            key=lambda item: item[1]["dispatch_time"],
+            reverse=True,
+        ):
+            _LOGGER.critical(
+                (
+                    "Event dispatch for %s: fired %s times to %s listeners in"
+                    " %.6f seconds, the slowest dispatch took %.6f seconds"
+                ),
+                event_type,
+                stats["fired"],
+                stats["listeners"],
+                stats["dispatch_time"],
+                stats["max_dispatch_time"],
+            )
+
+    @callback
+    def _async_start_log_event_dispatch(call: ServiceCall) -> None:
+        if LOG_EVENT_DISPATCH_SUB in domain_data:
+            raise HomeAssistantError("Event dispatch logging already started")
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Event dispatch logging has started. See [the logs](/config/logs) to"
+                " review the listeners and dispatch time per event type."
+            ),
+            title="Event dispatch logging started",
+            notification_id="profile_event_dispatch_logging",
+        )
+        hass.bus.async_set_dispatch_stats(True)
+        domain_data[LOG_EVENT_DISPATCH_SUB] = async_track_time_interval(
+            hass, _async_log_event_dispatch, call.data[CONF_SCAN_INTERVAL]
+        )
+
+    @callback
+    def _async_stop_log_event_dispatch(call: ServiceCall) -> None:
+        if LOG_EVENT_DISPATCH_SUB not in domain_data:
+            raise HomeAssistantError("Event dispatch logging not running")
+
+        persistent_notification.async_dismiss(hass, "profile_event_dispatch_logging")
+        domain_data.pop(LOG_EVENT_DISPATCH_SUB)()
+        _async_log_event_dispatch()
+        hass.bus.async_set_dispatch_stats(False)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -348,6 +432,34 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_STATE_MEMORY,
+        _async_log_state_memory,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LOG_EVENT_DISPATCH,
+        _async_start_log_event_dispatch,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
+                ): cv.time_period
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LOG_EVENT_DISPATCH,
+        _async_stop_log_event_dispatch,
+    )
+
     return True
 
 
@@ -357,6 +469,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    if LOG_EVENT_DISPATCH_SUB in hass.data[DOMAIN]:
+        hass.data[DOMAIN][LOG_EVENT_DISPATCH_SUB]()
+        hass.bus.async_set_dispatch_stats(False)
     hass.data.pop(DOMAIN)
     return True
 
@@ -453,6 +568,39 @@ def _log_objects(*_):
     _LOGGER.critical("Memory Growth: %s", objgraph.growth(limit=1000))
 
 
+def _state_memory_by_domain(states: list[State]) -> dict[str, tuple[int, int]]:
+    """Return the number of states and their approximate size per domain.
+
+    Objects shared between states, such as unchanged attributes or
+    contexts, are only counted once for the first domain they are seen in.
+    """
+    seen: set[int] = set()
+    usage: dict[str, tuple[int, int]] = {}
+
+    def _sizeof(obj: Any) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        return sys.getsizeof(obj)
+
+    for state in states:
+        size = (
+            _sizeof(state)
+            + _sizeof(state.state)
+            + _sizeof(state.last_changed)
+            + _sizeof(state.last_updated)
+            + _sizeof(state.context)
+        )
+        if attributes_size := _sizeof(state.attributes):
+            size += attributes_size
+            for key, value in state.attributes.items():
+                size += _sizeof(key) + _sizeof(value)
+        count, domain_size = usage.get(state.domain, (0, 0))
+        usage[state.domain] = (count + 1, domain_size + size)
+
+    return usage
+
+
 def _get_function_absfile(func: Any) -> str | None:
     """Get the absolute file path of a function."""
     import inspect  # pylint: disable=import-outside-toplevel
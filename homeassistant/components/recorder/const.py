@@ -19,6 +19,9 @@ EVENT_RECORDER_HOURLY_STATISTICS_GENERATED = "recorder_hourly_statistics_generat
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
+# The maximum number of queued tasks taken from the backlog at once
+# so the ids they reference can be resolved with a single query per table
+MAX_TASKS_PER_BATCH = 1000
 ESTIMATED_QUEUE_ITEM_SIZE = 10240
 QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
 
@@ -45,6 +48,7 @@ EXCLUDE_ATTRIBUTES = f"{DOMAIN}_exclude_attributes_by_domain"
 
 
 STATISTICS_ROWS_SCHEMA_VERSION = 23
+STATE_ATTRIBUTES_SCHEMA_VERSION = 25
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
@@ -52,10 +52,12 @@ from .const import (
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
+    MAX_TASKS_PER_BATCH,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
     SQLITE_URL_PREFIX,
+    STATE_ATTRIBUTES_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
     SupportedDialect,
@@ -76,8 +78,10 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.cache import HistoryCache
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -107,6 +111,7 @@ from .tasks import (
     EventTypeIDMigrationTask,
     ImportStatisticsTask,
     KeepAliveTask,
+    LoadStateAttributesHashFilterTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
@@ -171,6 +176,7 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         auto_repack: bool,
         keep_days: int,
+        purge_time_budget: float,
         commit_interval: int,
         uri: str,
         db_max_retries: int,
@@ -187,6 +193,8 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_time_budget = purge_time_budget
+        self.purge_progress: PurgeProgress | None = None
         self._hass_started: asyncio.Future[object] = asyncio.Future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
@@ -225,6 +233,7 @@ class Recorder(threading.Thread):
             self, exclude_attributes_by_domain
         )
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.history_cache = HistoryCache()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -865,16 +874,67 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_recover(queue_.get())
+            task = queue_.get()
+            if queue_.empty():
+                self._guarded_process_one_task_or_recover(task)
+                continue
+            # Events are arriving faster than we write them so take a batch
+            # from the backlog and resolve the ids it needs in bulk instead
+            # of selecting them one event at a time
+            tasks = [task]
+            while len(tasks) < MAX_TASKS_PER_BATCH and not queue_.empty():
+                tasks.append(queue_.get_nowait())
+            self._process_task_batch(tasks)
+
+    def _process_task_batch(self, tasks: list[RecorderTask]) -> None:
+        """Process a batch of tasks taken from the backlog."""
+        self._guarded_pre_process_tasks(tasks)
+        for task in tasks:
+            self._guarded_process_one_task_or_recover(task)
+            if self.stop_requested:
+                return
 
     def _pre_process_startup_tasks(self, startup_tasks: list[RecorderTask]) -> None:
         """Pre process startup tasks."""
+        if self.schema_version >= STATE_ATTRIBUTES_SCHEMA_VERSION:
+            self._guarded_load_recent_state_attributes()
+            self.queue_task(LoadStateAttributesHashFilterTask())
+        self._pre_process_tasks(startup_tasks)
+
+    def _guarded_load_recent_state_attributes(self) -> None:
+        """Warm up the state attributes cache, guarding against exceptions.
+
+        Failing to warm up only means the attributes of the current
+        states are selected when they are written for the first time.
+        """
+        if not self.enabled or self.event_session is None:
+            return
+        try:
+            self.state_attributes_manager.load_recent(self.event_session)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Error while loading recent state attributes: %s", err)
+
+    def _guarded_pre_process_tasks(self, tasks: list[RecorderTask]) -> None:
+        """Pre process tasks, guarding against exceptions.
+
+        Failing to pre process only means the ids will be
+        resolved one event at a time when the tasks are processed.
+        """
+        if not self.enabled or self.event_session is None:
+            return
+        try:
+            self._pre_process_tasks(tasks)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Error while pre processing tasks: %s", err)
+
+    def _pre_process_tasks(self, tasks: list[RecorderTask]) -> None:
+        """Prime the id caches for the events in tasks."""
         # Prime all the state_attributes and event_data caches
         # before we start processing events
         state_change_events: list[Event] = []
         non_state_change_events: list[Event] = []
 
-        for task in startup_tasks:
+        for task in tasks:
             if isinstance(task, EventTask):
                 event_ = task.event
                 if event_.event_type == EVENT_STATE_CHANGED:
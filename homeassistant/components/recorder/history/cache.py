@@ -0,0 +1,93 @@
+"""Cache for history queries over past time windows."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from datetime import timedelta
+import threading
+from typing import Any
+
+from homeassistant.core import State
+
+# Only windows that ended at least this long plus the commit interval
+# ago are cached since no more states can be recorded in them
+HISTORY_CACHE_MIN_AGE = timedelta(minutes=5)
+
+# The maximum estimated size of all cached results
+HISTORY_CACHE_MAX_SIZE = 32 * 1024 * 1024
+
+# Rough size estimates of a cached state, including the
+# row it holds a reference to and its attributes
+ESTIMATED_STATE_SIZE = 1024
+ESTIMATED_MINIMAL_STATE_SIZE = 256
+
+HistoryCacheKey = tuple[tuple[str, ...], float, float, bool, bool, bool, bool, bool]
+HistoryResult = MutableMapping[str, list[State | dict[str, Any]]]
+
+
+def _estimate_size(result: HistoryResult) -> int:
+    """Estimate the memory used by a history result."""
+    size = 0
+    for states in result.values():
+        # With minimal_response only the first state is a full state
+        if states and isinstance(states[-1], dict):
+            size += ESTIMATED_STATE_SIZE
+            size += (len(states) - 1) * ESTIMATED_MINIMAL_STATE_SIZE
+        else:
+            size += len(states) * ESTIMATED_STATE_SIZE
+    return size
+
+
+class HistoryCache:
+    """LRU cache of history results bounded by their estimated size.
+
+    Queries run in the database executor, while the recorder thread
+    invalidates the cache when it removes or renames states, so all
+    access is guarded by a lock. Every invalidation starts a new
+    generation to prevent results of a query that was already running
+    from being stored after the data changed.
+    """
+
+    def __init__(self, max_size: int = HISTORY_CACHE_MAX_SIZE) -> None:
+        """Initialize the history cache."""
+        self._lock = threading.Lock()
+        self._results: OrderedDict[
+            HistoryCacheKey, tuple[HistoryResult, int]
+        ] = OrderedDict()
+        self._max_size = max_size
+        self.size = 0
+        self.generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._results)
+
+    def get(self, key: HistoryCacheKey) -> HistoryResult | None:
+        """Return a copy of a cached result."""
+        with self._lock:
+            if (cached := self._results.get(key)) is None:
+                return None
+            self._results.move_to_end(key)
+        # Callers may modify the lists they get back
+        return {entity_id: list(states) for entity_id, states in cached[0].items()}
+
+    def put(self, key: HistoryCacheKey, generation: int, result: HistoryResult) -> None:
+        """Cache a result of a query that started in generation."""
+        if (size := _estimate_size(result)) > self._max_size:
+            return
+        result = {entity_id: list(states) for entity_id, states in result.items()}
+        with self._lock:
+            if generation != self.generation or key in self._results:
+                return
+            self._results[key] = (result, size)
+            self.size += size
+            while self.size > self._max_size:
+                _, (_, evicted_size) = self._results.popitem(last=False)
+                self.size -= evicted_size
+
+    def clear(self) -> None:
+        """Invalidate all cached results."""
+        with self._lock:
+            self._results.clear()
+            self.size = 0
+            self.generation += 1
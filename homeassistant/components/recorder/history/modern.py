@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import groupby
 from operator import itemgetter
 from typing import Any, cast
@@ -36,6 +36,7 @@ from ..models import (
     row_to_compressed_state,
 )
 from ..util import execute_stmt_lambda_element, session_scope
+from .cache import HISTORY_CACHE_MIN_AGE, HistoryCacheKey
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -214,6 +215,31 @@ def get_significant_states_with_session(
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    cache = instance.history_cache
+    cache_key: HistoryCacheKey | None = None
+    if (
+        end_time is not None
+        and not instance.backlog
+        and end_time
+        < dt_util.utcnow()
+        - HISTORY_CACHE_MIN_AGE
+        - timedelta(seconds=instance.commit_interval)
+    ):
+        cache_key = (
+            tuple(entity_ids),
+            start_time_ts,
+            cast(float, end_time_ts),
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+        if (cached := cache.get(cache_key)) is not None:
+            return cached
+        generation = cache.generation
     if not (
         entity_id_to_metadata_id := instance.states_meta_manager.get_many(
             entity_ids, session, False
@@ -233,8 +259,6 @@ def get_significant_states_with_session(
         run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
     ):
         include_start_time_state = False
-    start_time_ts = dt_util.utc_to_timestamp(start_time)
-    end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
@@ -257,7 +281,7 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    result = _sorted_states_to_dict(
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
         entity_ids,
@@ -266,6 +290,9 @@ def get_significant_states_with_session(
         compressed_state_format,
         no_attributes=no_attributes,
     )
+    if cache_key is not None:
+        cache.put(cache_key, generation, result)
+    return result
 
 
 def get_full_significant_states_with_session(
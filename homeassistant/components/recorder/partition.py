@@ -0,0 +1,195 @@
+"""Support for purging range partitioned tables.
+
+Only PostgreSQL is supported. MySQL and MariaDB can't range partition
+on the DOUBLE timestamp columns and don't allow foreign keys on
+partitioned tables. The recorder does not partition any tables by
+itself; they have to be partitioned on the timestamp column by the
+database administrator, which requires the primary key to include it.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import re
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text, update
+from sqlalchemy.orm.session import Session
+
+from .const import SupportedDialect
+from .db_schema import TABLE_EVENTS, TABLE_STATES, TABLE_STATISTICS_SHORT_TERM, States
+
+if TYPE_CHECKING:
+    from . import Recorder
+    from .purge import PurgeDeadline, PurgeProgress
+
+_LOGGER = logging.getLogger(__name__)
+
+# The tables that can be partitioned by range on their timestamp column
+# so expired partitions can be dropped instead of deleting their rows
+PARTITIONED_TABLE_COLUMNS = {
+    TABLE_STATES: "last_updated_ts",
+    TABLE_EVENTS: "time_fired_ts",
+    TABLE_STATISTICS_SHORT_TERM: "start_ts",
+}
+
+PARTITIONED_TABLE_DIALECTS = {SupportedDialect.POSTGRESQL}
+
+# FOR VALUES FROM ('1693526400') TO ('1693612800')
+_POSTGRESQL_UPPER_BOUND = re.compile(r"\bTO \(\s*'?([^')]+?)'?\s*\)")
+
+
+@dataclass(slots=True, frozen=True)
+class RangePartition:
+    """A partition holding the rows of a table up to an upper bound."""
+
+    table: str
+    name: str
+    # The exclusive upper bound of the timestamp column
+    upper_bound: float
+
+
+def _parse_postgresql_upper_bound(bound: str) -> float | None:
+    """Return the upper bound of a PostgreSQL partition bound expression."""
+    if not (match := _POSTGRESQL_UPPER_BOUND.search(bound)):
+        return None
+    try:
+        return float(match.group(1))
+    except ValueError:
+        # MAXVALUE
+        return None
+
+
+def _find_postgresql_partitions(session: Session, table: str) -> list[RangePartition]:
+    """Find the range partitions of a PostgreSQL table."""
+    column = PARTITIONED_TABLE_COLUMNS[table]
+    partition_key = session.execute(
+        text(
+            "SELECT pg_get_partkeydef(oid) FROM pg_class"
+            " WHERE relname = :table AND relkind = 'p'"
+            " AND relnamespace = to_regnamespace(current_schema())"
+        ),
+        {"table": table},
+    ).scalar()
+    if partition_key != f"RANGE ({column})":
+        return []
+    partitions: list[RangePartition] = []
+    for name, bound in session.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)"
+            " FROM pg_inherits"
+            " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE parent.relname = :table"
+            " AND parent.relnamespace = to_regnamespace(current_schema())"
+        ),
+        {"table": table},
+    ):
+        if (upper_bound := _parse_postgresql_upper_bound(bound)) is not None:
+            partitions.append(RangePartition(table, name, upper_bound))
+    return partitions
+
+
+def find_expired_partitions(
+    session: Session, dialect_name: SupportedDialect | None, purge_before: float
+) -> list[RangePartition]:
+    """Return the partitions that only hold rows older than purge_before."""
+    if dialect_name not in PARTITIONED_TABLE_DIALECTS:
+        return []
+    return [
+        partition
+        for table in PARTITIONED_TABLE_COLUMNS
+        for partition in sorted(
+            _find_postgresql_partitions(session, table),
+            key=lambda part: part.upper_bound,
+        )
+        if partition.upper_bound <= purge_before
+    ]
+
+
+def _partition_rows(session: Session, partition: RangePartition) -> str:
+    """Return the FROM clause selecting the rows of a partition."""
+    return session.get_bind().dialect.identifier_preparer.quote(partition.name)
+
+
+def _drop_partition(session: Session, partition: RangePartition) -> None:
+    """Drop a partition and all its rows."""
+    quote = session.get_bind().dialect.identifier_preparer.quote
+    session.execute(text(f"DROP TABLE {quote(partition.name)}"))
+    _LOGGER.debug("Dropped partition %s of %s", partition.name, partition.table)
+
+
+def purge_expired_partitions(
+    instance: Recorder,
+    session: Session,
+    purge_before: float,
+    progress: PurgeProgress,
+    deadline: PurgeDeadline,
+) -> tuple[set[int], set[int]]:
+    """Drop the partitions that only hold rows older than purge_before.
+
+    The expired partitions are looked up once per purge and kept in
+    the progress, so a purge that is continued after the deadline does
+    not query the catalog again.
+
+    Returns the attributes_ids and data_ids referenced by the dropped
+    rows so the ones no longer in use can be purged.
+    """
+    attributes_ids: set[int] = set()
+    data_ids: set[int] = set()
+    if progress.expired_partitions is None:
+        progress.expired_partitions = find_expired_partitions(
+            session, instance.dialect_name, purge_before
+        )
+    expired_partitions = progress.expired_partitions
+    while expired_partitions and not deadline.reached():
+        partition = expired_partitions[0]
+        rows = _partition_rows(session, partition)
+        if partition.table == TABLE_STATES:
+            first_state_id, last_state_id, count = session.execute(
+                text(
+                    f"SELECT MIN(state_id), MAX(state_id), COUNT(*) FROM {rows}"  # noqa: S608
+                )
+            ).one()
+            attributes_ids.update(
+                attributes_id
+                for (attributes_id,) in session.execute(
+                    text(f"SELECT DISTINCT attributes_id FROM {rows}")  # noqa: S608
+                )
+                if attributes_id
+            )
+            if count:
+                # Newer states can link to the states we are about to drop
+                session.execute(
+                    update(States)
+                    .where(
+                        States.old_state_id.between(first_state_id, last_state_id),
+                        States.last_updated_ts >= partition.upper_bound,
+                    )
+                    .values(old_state_id=None)
+                    .execution_options(synchronize_session=False)
+                )
+            _drop_partition(session, partition)
+            if count:
+                instance.states_manager.evict_purged_state_id_range(
+                    first_state_id, last_state_id
+                )
+            progress.states_purged += count
+        elif partition.table == TABLE_EVENTS:
+            count = session.execute(
+                text(f"SELECT COUNT(*) FROM {rows}")  # noqa: S608
+            ).scalar()
+            data_ids.update(
+                data_id
+                for (data_id,) in session.execute(
+                    text(f"SELECT DISTINCT data_id FROM {rows}")  # noqa: S608
+                )
+                if data_id
+            )
+            _drop_partition(session, partition)
+            progress.events_purged += count or 0
+        else:
+            _drop_partition(session, partition)
+        del expired_partitions[0]
+        deadline.purged = True
+    return attributes_ids, data_ids
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -15,6 +16,11 @@ import homeassistant.util.dt as dt_util
 from .const import SQLITE_MAX_BIND_VARS
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partition import (
+    PARTITIONED_TABLE_DIALECTS,
+    RangePartition,
+    purge_expired_partitions,
+)
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -54,6 +60,58 @@ DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
 
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge that is spread over multiple purge tasks."""
+
+    purge_before: datetime
+    start_time: datetime = field(default_factory=dt_util.utcnow)
+    end_time: datetime | None = None
+    runs: int = 0
+    run_time: float = 0.0
+    states_purged: int = 0
+    events_purged: int = 0
+    # The expired partitions that still have to be dropped
+    expired_partitions: list[RangePartition] | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        rows_purged = self.states_purged + self.events_purged
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "start_time": self.start_time.isoformat(),
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "in_progress": self.end_time is None,
+            "runs": self.runs,
+            "run_time": round(self.run_time, 3),
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "rows_per_second": round(rows_purged / self.run_time, 1)
+            if self.run_time
+            else 0.0,
+        }
+
+
+class PurgeDeadline:
+    """Time budget of a single purge run.
+
+    The deadline is checked before every batch. It is only enforced
+    once rows have been purged, so every run makes progress however
+    small the budget is.
+    """
+
+    __slots__ = ("_deadline", "purged")
+
+    def __init__(self, budget: float) -> None:
+        """Initialize the deadline."""
+        self._deadline = time.monotonic() + budget
+        self.purged = False
+
+    def reached(self) -> bool:
+        """Return if no more batches should be purged in this run."""
+        return self.purged and time.monotonic() >= self._deadline
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder,
@@ -66,11 +124,80 @@ def purge_old_data(
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    Each call stops before the next batch once the purge time budget
+    of the recorder is used up and returns False so the purge can be
+    continued by a new task after the events that queued up in the
+    meantime have been written. Since every batch selects the oldest
+    rows before purge_before, the database itself is the cursor the
+    next call resumes from.
     """
+    progress = instance.purge_progress
+    if (
+        progress is None
+        or progress.end_time is not None
+        or progress.purge_before != purge_before
+    ):
+        progress = instance.purge_progress = PurgeProgress(purge_before)
+    start = time.monotonic()
+    try:
+        finished = _purge_old_data(
+            instance,
+            progress,
+            PurgeDeadline(instance.purge_time_budget),
+            purge_before,
+            repack,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+        )
+    finally:
+        progress.runs += 1
+        progress.run_time += time.monotonic() - start
+    if finished:
+        progress.end_time = dt_util.utcnow()
+    return finished
+
+
+def _purge_old_data(
+    instance: Recorder,
+    progress: PurgeProgress,
+    deadline: PurgeDeadline,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+) -> bool:
+    """Purge events and states older than purge_before until the deadline."""
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    if (
+        instance.dialect_name in PARTITIONED_TABLE_DIALECTS
+        and not instance.use_legacy_events_index
+    ):
+        # Tables that are partitioned by time can drop whole partitions
+        # of expired rows instead of deleting them in batches
+        with session_scope(session=instance.get_session()) as session:
+            attributes_ids, data_ids = purge_expired_partitions(
+                instance,
+                session,
+                dt_util.utc_to_timestamp(purge_before),
+                progress,
+                deadline,
+            )
+            for attributes_ids_chunk in chunked(attributes_ids, SQLITE_MAX_BIND_VARS):
+                _purge_unused_attributes_ids(
+                    instance, session, set(attributes_ids_chunk)
+                )
+            for data_ids_chunk in chunked(data_ids, SQLITE_MAX_BIND_VARS):
+                _purge_unused_data_ids(instance, session, set(data_ids_chunk))
+        if progress.expired_partitions:
+            _LOGGER.debug("Dropping expired partitions hasn't fully completed yet")
+            return False
+
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of SQLITE_MAX_BIND_VARS, based on the oldest states or events record
         has_more_to_purge = False
@@ -79,7 +206,10 @@ def purge_old_data(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
             )
+            if deadline.reached():
+                return False
             has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            deadline.purged |= has_more_to_purge
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -87,29 +217,39 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress, deadline
             )
 
-        statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before
-        )
-        if statistics_runs:
+        if deadline.reached():
+            return False
+        if statistics_runs := _select_statistics_runs_to_purge(session, purge_before):
             _purge_statistics_runs(session, statistics_runs)
+            deadline.purged = True
 
-        if short_term_statistics:
+        if deadline.reached():
+            return False
+        if short_term_statistics := _select_short_term_statistics_to_purge(
+            session, purge_before
+        ):
             _purge_short_term_statistics(session, short_term_statistics)
+            deadline.purged = True
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
 
-        if apply_filter and _purge_filtered_data(instance, session) is False:
-            _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
+        if apply_filter:
+            if deadline.reached():
+                return False
+            if _purge_filtered_data(instance, session) is False:
+                _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
+                return False
+
+        if deadline.reached():
             return False
 
         # This purge cycle is finished, clean up old event types and
@@ -176,6 +316,8 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: PurgeDeadline,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -190,6 +332,8 @@ def _purge_states_and_attributes_ids(
     # SQLITE_MAX_BIND_VARS
     attributes_ids_batch: set[int] = set()
     for _ in range(states_batch_size):
+        if deadline.reached():
+            break
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before
         )
@@ -197,6 +341,8 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.states_purged += len(state_ids)
+        deadline.purged = True
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -212,6 +358,8 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: PurgeDeadline,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -224,11 +372,15 @@ def _purge_events_and_data_ids(
     # SQLITE_MAX_BIND_VARS
     data_ids_batch: set[int] = set()
     for _ in range(events_batch_size):
+        if deadline.reached():
+            break
         event_ids, data_ids = _select_event_data_ids_to_purge(session, purge_before)
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.events_purged += len(event_ids)
+        deadline.purged = True
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
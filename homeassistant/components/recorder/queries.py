@@ -42,6 +42,38 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def get_recent_shared_attributes(limit: int) -> StatementLambdaElement:
+    """Load the shared attributes of the most recently recorded states."""
+    # Join instead of IN because MariaDB does not support LIMIT in IN subqueries
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).join(
+            recent_states := select(States.attributes_id.label("recent_attributes_id"))
+            .filter(States.attributes_id.is_not(None))
+            .order_by(States.state_id.desc())
+            .limit(limit)
+            .subquery(),
+            StateAttributes.attributes_id == recent_states.c.recent_attributes_id,
+        )
+    )
+
+
+def get_state_attributes_count() -> StatementLambdaElement:
+    """Count the rows in the state attributes table."""
+    return lambda_stmt(lambda: select(func.count(StateAttributes.attributes_id)))
+
+
+def get_state_attributes_hashes(after_id: int, limit: int) -> StatementLambdaElement:
+    """Load the hashes of the shared attributes after an attributes_id."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id, StateAttributes.hash)
+        .filter(StateAttributes.attributes_id > after_id)
+        .order_by(StateAttributes.attributes_id)
+        .limit(limit)
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -32,9 +32,19 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
         self.active = True  # always active
+        self._serialized: dict[Event, bytes | None] = {}
 
     def serialize_from_event(self, event: Event) -> bytes | None:
-        """Serialize event data."""
+        """Serialize event data.
+
+        Events that were serialized by load are only serialized once.
+        """
+        if event in self._serialized:
+            return self._serialized.pop(event)
+        return self._serialize_from_event(event)
+
+    def _serialize_from_event(self, event: Event) -> bytes | None:
+        """Serialize event data without using the results of load."""
         try:
             return EventData.shared_data_bytes_from_event(
                 event, self.recorder.dialect_name
@@ -46,14 +56,29 @@ class EventDataManager(BaseLRUTableManager[EventData]):
     def load(self, events: list[Event], session: Session) -> None:
         """Load the shared_datas to data_ids mapping into memory from events.
 
+        Only shared_datas that are not already known are loaded. The
+        serialized data is kept until the events are processed so it
+        does not have to be serialized again.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
-            EventData.hash_shared_data_bytes(shared_event_bytes)
-            for event in events
-            if (shared_event_bytes := self.serialize_from_event(event))
-        }:
+        serialized = self._serialized
+        serialized.clear()
+        id_map = self._id_map
+        pending = self._pending
+        hashes: set[int] = set()
+        for event in events:
+            if not event.data:
+                # Events without data are not stored in the EventData table
+                continue
+            shared_data_bytes = serialized[event] = self._serialize_from_event(event)
+            if not shared_data_bytes:
+                continue
+            shared_data = shared_data_bytes.decode("utf-8")
+            if shared_data not in id_map and shared_data not in pending:
+                hashes.add(EventData.hash_shared_data_bytes(shared_data_bytes))
+        if hashes:
             self._load_from_hashes(hashes, session)
 
     def get(self, shared_data: str, data_hash: int, session: Session) -> int | None:
@@ -115,6 +140,15 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         shared_data: str = db_event_data.shared_data
         self._pending[shared_data] = db_event_data
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the data_ids of the new EventData into the LRU.
 
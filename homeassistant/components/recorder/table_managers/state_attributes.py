@@ -5,6 +5,7 @@ from collections.abc import Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
@@ -13,7 +14,13 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import (
+    get_recent_shared_attributes,
+    get_shared_attributes,
+    get_state_attributes_count,
+    get_state_attributes_hashes,
+)
+from ..tasks import LoadStateAttributesHashFilterTask
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -28,9 +35,58 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The hash filter is sized for this many times the number of
+# attributes in the database so it does not have to be rebuilt
+# every time new attributes are added.
+HASH_FILTER_HEADROOM = 2
+HASH_FILTER_MIN_CAPACITY = 65536
+HASH_FILTER_BITS_PER_ITEM = 10
+HASH_FILTER_HASH_COUNT = 7
+# The hashes are loaded in chunks by separate tasks so
+# events are still written while the filter is loaded
+HASH_FILTER_CHUNK_SIZE = 10000
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class HashFilter:
+    """Bloom filter of 32-bit attribute hashes.
+
+    might_contain returns False if the hash was definitely never added
+    and True if it probably was.
+    """
+
+    __slots__ = ("_bits", "_size", "capacity", "count")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the filter for capacity hashes."""
+        self.capacity = max(capacity, HASH_FILTER_MIN_CAPACITY)
+        self._size = self.capacity * HASH_FILTER_BITS_PER_ITEM
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, hash_: int) -> list[int]:
+        """Return the bit positions for a hash using double hashing."""
+        size = self._size
+        step = (((hash_ >> 16) | (hash_ << 16)) & 0xFFFFFFFF) | 1
+        return [(hash_ + idx * step) % size for idx in range(HASH_FILTER_HASH_COUNT)]
+
+    def add(self, hash_: int) -> None:
+        """Add a hash to the filter."""
+        bits = self._bits
+        for position in self._positions(hash_):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, hash_: int) -> bool:
+        """Return if the hash might have been added to the filter."""
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(hash_)
+        )
+
+
 class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
@@ -42,9 +98,21 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         self.active = True  # always active
         self._exclude_attributes_by_domain = exclude_attributes_by_domain
         self._entity_sources = entity_sources(recorder.hass)
+        self._serialized: dict[Event, bytes | None] = {}
+        self._hash_filter: HashFilter | None = None
+        self._loading_hash_filter: HashFilter | None = None
 
     def serialize_from_event(self, event: Event) -> bytes | None:
-        """Serialize event data."""
+        """Serialize event data.
+
+        Events that were serialized by load are only serialized once.
+        """
+        if event in self._serialized:
+            return self._serialized.pop(event)
+        return self._serialize_from_event(event)
+
+    def _serialize_from_event(self, event: Event) -> bytes | None:
+        """Serialize event data without using the results of load."""
         try:
             return StateAttributes.shared_attrs_bytes_from_event(
                 event,
@@ -63,16 +131,82 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def load(self, events: list[Event], session: Session) -> None:
         """Load the shared_attrs to attributes_ids mapping into memory from events.
 
+        Only shared_attrs that are not already known are loaded. The
+        serialized attributes are kept until the events are processed
+        so they do not have to be serialized again.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
-            StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
-            for event in events
-            if (shared_attrs_bytes := self.serialize_from_event(event))
-        }:
+        serialized = self._serialized
+        serialized.clear()
+        id_map = self._id_map
+        pending = self._pending
+        hashes: set[int] = set()
+        for event in events:
+            shared_attrs_bytes = serialized[event] = self._serialize_from_event(event)
+            if not shared_attrs_bytes:
+                continue
+            shared_attrs = shared_attrs_bytes.decode("utf-8")
+            if shared_attrs not in id_map and shared_attrs not in pending:
+                hashes.add(StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+        if hashes:
             self._load_from_hashes(hashes, session)
 
+    def load_recent(self, session: Session) -> None:
+        """Load the attributes_ids of the most recently recorded states.
+
+        This warms up the cache after a restart so the attributes of
+        the current states do not have to be selected one at a time.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = cast(LRU, self._id_map)
+        with session.no_autoflush:
+            for attributes_id, shared_attrs in execute_stmt_lambda_element(
+                session, get_recent_shared_attributes(id_map.get_size()), orm_rows=False
+            ):
+                id_map[shared_attrs] = cast(int, attributes_id)
+
+    def load_hash_filter(self, session: Session, after_id: int | None) -> int | None:
+        """Load a chunk of the hashes of the attributes in the database.
+
+        Loading starts with after_id None and continues with the returned
+        attributes_id until None is returned. The filter is used once all
+        hashes are loaded; attributes whose hash is not in the filter are
+        then known to be new and are not looked up in the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            connection = session.connection()
+            if after_id is None:
+                count = cast(
+                    int, connection.execute(get_state_attributes_count()).scalar()
+                )
+                self._hash_filter = None
+                self._loading_hash_filter = HashFilter(count * HASH_FILTER_HEADROOM)
+                after_id = 0
+            if (hash_filter := self._loading_hash_filter) is None:
+                # The manager was reset while loading
+                return None
+            rows = connection.execute(
+                get_state_attributes_hashes(after_id, HASH_FILTER_CHUNK_SIZE)
+            ).all()
+        for _, hash_ in rows:
+            if hash_ is not None:
+                hash_filter.add(hash_)
+        if len(rows) == HASH_FILTER_CHUNK_SIZE:
+            return cast(int, rows[-1][0])
+        for db_state_attributes in self._pending.values():
+            if db_state_attributes.hash is not None:
+                hash_filter.add(db_state_attributes.hash)
+        self._hash_filter = hash_filter
+        self._loading_hash_filter = None
+        return None
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -111,6 +245,10 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
+        if (hash_filter := self._hash_filter) is not None:
+            hashes = [hash_ for hash_ in hashes if hash_filter.might_contain(hash_)]
+            if not hashes:
+                return results
         with session.no_autoflush:
             for hashs_chunk in chunked(hashes, SQLITE_MAX_BIND_VARS):
                 for attributes_id, shared_attrs in execute_stmt_lambda_element(
@@ -132,15 +270,39 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         shared_attrs: str = db_state_attributes.shared_attrs
         self._pending[shared_attrs] = db_state_attributes
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
+        self._hash_filter = None
+        self._loading_hash_filter = None
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the attributes_ids of the new StateAttributes into the LRU.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        hash_filter = self._hash_filter or self._loading_hash_filter
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            if hash_filter is not None and db_state_attributes.hash is not None:
+                hash_filter.add(db_state_attributes.hash)
         self._pending.clear()
+        if (
+            hash_filter is not None
+            and hash_filter is self._hash_filter
+            and hash_filter.count > hash_filter.capacity
+        ):
+            # The false positive rate grows once the filter is over
+            # capacity so stop using it until it is loaded again
+            # with a larger capacity.
+            self._hash_filter = None
+            self.recorder.queue_task(LoadStateAttributesHashFilterTask())
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
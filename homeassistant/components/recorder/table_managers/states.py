@@ -80,6 +80,19 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_id_range(
+        self, first_state_id: int, last_state_id: int
+    ) -> None:
+        """Evict a purged range of states from the committed states.
+
+        Used when a whole partition of states is dropped at once and the
+        individual state_ids were never loaded.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id, state_id in list(last_committed_ids.items()):
+            if first_state_id <= state_id <= last_state_id:
+                del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -98,6 +98,7 @@ class UpdateStatesMetadataTask(RecorderTask):
             self.entity_id,
             self.new_entity_id,
         )
+        instance.history_cache.clear()
 
 
 @dataclass(slots=True)
@@ -110,9 +111,11 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        instance.history_cache.clear()
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -135,7 +138,11 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
-        if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
+        finished = purge.purge_entity_data(
+            instance, self.entity_filter, self.purge_before
+        )
+        instance.history_cache.clear()
+        if finished:
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(PurgeEntitiesTask(self.entity_filter, self.purge_before))
@@ -480,3 +487,23 @@ class RefreshEventTypesTask(RecorderTask):
             instance.event_type_manager.get_many(
                 self.event_types, session, from_recorder=True
             )
+
+
+@dataclass(slots=True)
+class LoadStateAttributesHashFilterTask(RecorderTask):
+    """An object to insert into the recorder queue to load the state attributes hash filter.
+
+    Each task loads one chunk of the hashes and queues
+    the task for the next chunk.
+    """
+
+    after_id: int | None = None
+
+    def run(self, instance: Recorder) -> None:
+        """Load a chunk of the state attributes hash filter."""
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            after_id = instance.state_attributes_manager.load_hash_filter(
+                session, self.after_id
+            )
+        if after_id is not None:
+            instance.queue_task(LoadStateAttributesHashFilterTask(after_id))
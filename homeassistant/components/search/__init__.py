@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
 import logging
 from typing import Any
 
@@ -9,16 +10,19 @@ import voluptuous as vol
 
 from homeassistant.components import automation, group, person, script, websocket_api
 from homeassistant.components.homeassistant import scene
-from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback, split_entity_id
 from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
 )
 from homeassistant.helpers.entity import entity_sources as get_entity_sources
+from homeassistant.helpers.registry import RegistryIndexType, update_index
 from homeassistant.helpers.typing import ConfigType
 
 DOMAIN = "search"
+DATA_SEARCH_GRAPH = "search_graph"
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -26,10 +30,135 @@ CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Search component."""
+    async_get_graph(hass)
     websocket_api.async_register_command(hass, websocket_search_related)
     return True
 
 
+def _blueprint(blueprint_path: str | None) -> list[str]:
+    """Return the blueprint as a list of references."""
+    return [blueprint_path] if blueprint_path else []
+
+
+# The items referenced by the entities of each domain
+_REFERENCES: dict[str, dict[str, Callable[[HomeAssistant, str], Iterable[str]]]] = {
+    "automation": {
+        "area": automation.areas_in_automation,
+        "automation_blueprint": lambda hass, entity_id: _blueprint(
+            automation.blueprint_in_automation(hass, entity_id)
+        ),
+        "device": automation.devices_in_automation,
+        "entity": automation.entities_in_automation,
+    },
+    "group": {"entity": group.get_entity_ids},
+    "person": {"entity": person.entities_in_person},
+    "scene": {"entity": scene.entities_in_scene},
+    "script": {
+        "area": script.areas_in_script,
+        "device": script.devices_in_script,
+        "entity": script.entities_in_script,
+        "script_blueprint": lambda hass, entity_id: _blueprint(
+            script.blueprint_in_script(hass, entity_id)
+        ),
+    },
+}
+
+
+class SearchGraph:
+    """Relations between the items that reference other items.
+
+    Automations, scripts, scenes, groups and persons reference entities,
+    devices, areas and blueprints. The graph keeps the references in
+    both directions, so finding what references an item doesn't scan
+    every automation and script. The references of an entity are read
+    again whenever its state changes, which happens when it is added,
+    reloaded or removed. The registries index their entries themselves.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the search graph."""
+        self.hass = hass
+        self._references: dict[str, dict[str, list[str]]] = {}
+        self._referenced_by: defaultdict[str, RegistryIndexType] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+
+    @callback
+    def async_setup(self) -> None:
+        """Add the current entities and follow their changes."""
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_state_changed_filter,
+            run_immediately=True,
+        )
+        for entity_id in self.hass.states.async_entity_ids(_REFERENCES):
+            self._async_update_entity(entity_id)
+
+    @callback
+    def _async_state_changed_filter(self, event: Event) -> bool:
+        """Filter state changes of entities that reference other items."""
+        return split_entity_id(event.data["entity_id"])[0] in _REFERENCES
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the references of an entity when its state changed."""
+        if event.data["new_state"] is None:
+            self._async_set_references(event.data["entity_id"], {})
+        else:
+            self._async_update_entity(event.data["entity_id"])
+
+    @callback
+    def _async_update_entity(self, entity_id: str) -> None:
+        """Read the references of an entity."""
+        self._async_set_references(
+            entity_id,
+            {
+                item_type: list(get_references(self.hass, entity_id))
+                for item_type, get_references in _REFERENCES[
+                    split_entity_id(entity_id)[0]
+                ].items()
+            },
+        )
+
+    @callback
+    def _async_set_references(
+        self, entity_id: str, references: dict[str, list[str]]
+    ) -> None:
+        """Replace the references of an entity."""
+        old_references = self._references.pop(entity_id, {})
+        if references:
+            self._references[entity_id] = references
+        for item_type in old_references.keys() | references.keys():
+            update_index(
+                self._referenced_by[item_type],
+                entity_id,
+                old_references.get(item_type, ()),
+                references.get(item_type, ()),
+            )
+
+    @callback
+    def async_references(self, entity_id: str, item_type: str) -> list[str]:
+        """Return the items of a type referenced by an entity."""
+        return self._references.get(entity_id, {}).get(item_type, [])
+
+    @callback
+    def async_referenced_by(self, item_type: str, item_id: str) -> list[str]:
+        """Return the entities that reference an item."""
+        if (entity_ids := self._referenced_by[item_type].get(item_id)) is None:
+            return []
+        return list(entity_ids)
+
+
+@callback
+def async_get_graph(hass: HomeAssistant) -> SearchGraph:
+    """Return the search graph, building it the first time."""
+    if (graph := hass.data.get(DATA_SEARCH_GRAPH)) is None:
+        graph = hass.data[DATA_SEARCH_GRAPH] = SearchGraph(hass)
+        graph.async_setup()
+    return graph
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "search/related",
@@ -104,6 +233,7 @@ class Searcher:
         self._device_reg = device_reg
         self._entity_reg = entity_reg
         self._sources = entity_sources
+        self._graph = async_get_graph(hass)
         self.results: defaultdict[str, set[str]] = defaultdict(set)
         self._to_resolve: deque[tuple[str, str]] = deque()
 
@@ -147,6 +277,13 @@ class Searcher:
         if item_type not in self.DONT_RESOLVE:
             self._to_resolve.append((item_type, item_id))
 
+    @callback
+    def _resolve_references(self, entity_id: str, item_types: Iterable[str]) -> None:
+        """Add the items referenced by an entity."""
+        for item_type in item_types:
+            for item_id in self._graph.async_references(entity_id, item_type):
+                self._add_or_resolve(item_type, item_id)
+
     @callback
     def _resolve_area(self, area_id) -> None:
         """Resolve an area."""
@@ -156,10 +293,8 @@ class Searcher:
         for entity_entry in er.async_entries_for_area(self._entity_reg, area_id):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_area(self.hass, area_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_area(self.hass, area_id):
+        # Automations and scripts
+        for entity_id in self._graph.async_referenced_by("area", area_id):
             self._add_or_resolve("entity", entity_id)
 
     @callback
@@ -168,21 +303,10 @@ class Searcher:
 
         Will only be called if automation is an entry point.
         """
-        for entity in automation.entities_in_automation(
-            self.hass, automation_entity_id
-        ):
-            self._add_or_resolve("entity", entity)
-
-        for device in automation.devices_in_automation(self.hass, automation_entity_id):
-            self._add_or_resolve("device", device)
-
-        for area in automation.areas_in_automation(self.hass, automation_entity_id):
-            self._add_or_resolve("area", area)
-
-        if blueprint := automation.blueprint_in_automation(
-            self.hass, automation_entity_id
-        ):
-            self._add_or_resolve("automation_blueprint", blueprint)
+        self._resolve_references(
+            automation_entity_id,
+            ("entity", "device", "area", "automation_blueprint"),
+        )
 
     @callback
     def _resolve_automation_blueprint(self, blueprint_path) -> None:
@@ -190,8 +314,8 @@ class Searcher:
 
         Will only be called if blueprint is an entry point.
         """
-        for entity_id in automation.automations_with_blueprint(
-            self.hass, blueprint_path
+        for entity_id in self._graph.async_referenced_by(
+            "automation_blueprint", blueprint_path
         ):
             self._add_or_resolve("automation", entity_id)
 
@@ -229,30 +353,16 @@ class Searcher:
         for entity_entry in er.async_entries_for_device(self._entity_reg, device_id):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_device(self.hass, device_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_device(self.hass, device_id):
+        # Automations and scripts
+        for entity_id in self._graph.async_referenced_by("device", device_id):
             self._add_or_resolve("entity", entity_id)
 
     @callback
     def _resolve_entity(self, entity_id) -> None:
         """Resolve an entity."""
-        # Extra: Find automations and scripts that reference this entity.
-
-        for entity in scene.scenes_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in group.groups_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in automation.automations_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in script.scripts_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in person.persons_with_entity(self.hass, entity_id):
+        # Extra: Find automations, scripts, scenes, groups and persons
+        # that reference this entity.
+        for entity in self._graph.async_referenced_by("entity", entity_id):
             self._add_or_resolve("entity", entity)
 
         # Find devices
@@ -279,8 +389,7 @@ class Searcher:
 
         Will only be called if group is an entry point.
         """
-        for entity_id in group.get_entity_ids(self.hass, group_entity_id):
-            self._add_or_resolve("entity", entity_id)
+        self._resolve_references(group_entity_id, ("entity",))
 
     @callback
     def _resolve_person(self, person_entity_id) -> None:
@@ -288,8 +397,7 @@ class Searcher:
 
         Will only be called if person is an entry point.
         """
-        for entity in person.entities_in_person(self.hass, person_entity_id):
-            self._add_or_resolve("entity", entity)
+        self._resolve_references(person_entity_id, ("entity",))
 
     @callback
     def _resolve_scene(self, scene_entity_id) -> None:
@@ -297,8 +405,7 @@ class Searcher:
 
         Will only be called if scene is an entry point.
         """
-        for entity in scene.entities_in_scene(self.hass, scene_entity_id):
-            self._add_or_resolve("entity", entity)
+        self._resolve_references(scene_entity_id, ("entity",))
 
     @callback
     def _resolve_script(self, script_entity_id) -> None:
@@ -306,17 +413,9 @@ class Searcher:
 
         Will only be called if script is an entry point.
         """
-        for entity in script.entities_in_script(self.hass, script_entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for device in script.devices_in_script(self.hass, script_entity_id):
-            self._add_or_resolve("device", device)
-
-        for area in script.areas_in_script(self.hass, script_entity_id):
-            self._add_or_resolve("area", area)
-
-        if blueprint := script.blueprint_in_script(self.hass, script_entity_id):
-            self._add_or_resolve("script_blueprint", blueprint)
+        self._resolve_references(
+            script_entity_id, ("entity", "device", "area", "script_blueprint")
+        )
 
     @callback
     def _resolve_script_blueprint(self, blueprint_path) -> None:
@@ -324,5 +423,7 @@ class Searcher:
 
         Will only be called if blueprint is an entry point.
         """
-        for entity_id in script.scripts_with_blueprint(self.hass, blueprint_path):
+        for entity_id in self._graph.async_referenced_by(
+            "script_blueprint", blueprint_path
+        ):
             self._add_or_resolve("script", entity_id)
@@ -0,0 +1,31 @@
+"""Diagnostics support for Template."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_get_tracked_template_stats
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Only the render statistics of the templates of the entry are included,
+    the other templates of the installation are left to the admin only
+    template/render_stats websocket command.
+    """
+    template_stats = async_get_tracked_template_stats(hass)
+    entry_templates = {
+        value.strip()
+        for value in config_entry.options.values()
+        if isinstance(value, str)
+    }
+    return {
+        "options": dict(config_entry.options),
+        "templates": [
+            stats for stats in template_stats if stats["template"] in entry_templates
+        ],
+    }
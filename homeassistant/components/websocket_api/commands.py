@@ -27,9 +27,11 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
+    TEMPLATE_STATS_ORDER,
     EventStateChangedData,
     TrackTemplate,
     TrackTemplateResult,
+    async_get_tracked_template_stats,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -39,6 +41,7 @@ from homeassistant.helpers.json import (
     json_dumps,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.startup_trace import DATA_STARTUP_TRACE
 from homeassistant.helpers.typing import EventType
 from homeassistant.loader import (
     Integration,
@@ -54,6 +57,7 @@ from . import const, decorators, messages
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
 from .messages import construct_event_message, construct_result_message
+from .subscriptions import async_get_entity_subscription_hub
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -73,9 +77,12 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_render_stats)
+    async_reg(hass, handle_subscribe_entities_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -93,7 +100,8 @@ def pong_message(iden: int) -> dict[str, Any]:
 
 
 def _forward_events_check_permissions(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+    send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
+    event_message: Callable[[int, Event], str | bytes],
     user: User,
     msg_id: int,
     event: Event,
@@ -106,16 +114,17 @@ def _forward_events_check_permissions(
         POLICY_READ
     ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
         return
-    send_message(messages.cached_event_message(msg_id, event))
+    send_message(event_message(msg_id, event))
 
 
 def _forward_events_unconditional(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+    send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
+    event_message: Callable[[int, Event], str | bytes],
     msg_id: int,
     event: Event,
 ) -> None:
     """Forward events to websocket."""
-    send_message(messages.cached_event_message(msg_id, event))
+    send_message(event_message(msg_id, event))
 
 
 @callback
@@ -138,18 +147,29 @@ def handle_subscribe_events(
     if event_type not in SUBSCRIBE_ALLOWLIST and not connection.user.is_admin:
         raise Unauthorized
 
+    event_message = (
+        messages.deflated_event_message
+        if connection.can_deflate
+        else messages.cached_event_message
+    )
     if event_type == EVENT_STATE_CHANGED:
         forward_events = callback(
             partial(
                 _forward_events_check_permissions,
                 connection.send_message,
+                event_message,
                 connection.user,
                 msg["id"],
             )
         )
     else:
         forward_events = callback(
-            partial(_forward_events_unconditional, connection.send_message, msg["id"])
+            partial(
+                _forward_events_unconditional,
+                connection.send_message,
+                event_message,
+                msg["id"],
+            )
         )
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
@@ -302,27 +322,6 @@ def _send_handle_get_states_response(
     connection.send_message(construct_result_message(msg_id, f"[{joined_states}]"))
 
 
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
-
-
 @callback
 @decorators.websocket_command(
     {
@@ -339,19 +338,9 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        callback(
-            partial(
-                _forward_entity_changes,
-                connection.send_message,
-                entity_ids,
-                connection.user,
-                msg["id"],
-            )
-        ),
-        run_immediately=True,
-    )
+    connection.subscriptions[msg["id"]] = async_get_entity_subscription_hub(
+        hass
+    ).async_subscribe(connection, msg["id"], entity_ids)
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -483,6 +472,19 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/startup_trace"})
+@decorators.require_admin
+def handle_integration_startup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration startup trace command."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is None:
+        connection.send_error(msg["id"], const.ERR_NOT_FOUND, "No startup trace")
+        return
+    connection.send_result(msg["id"], trace.async_as_chrome_trace())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -596,6 +598,37 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "template/render_stats",
+        vol.Optional("order_by", default="total_time"): vol.In(TEMPLATE_STATS_ORDER),
+        vol.Optional("limit", default=20): vol.All(int, vol.Range(min=1)),
+    }
+)
+@decorators.require_admin
+def handle_template_render_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template render stats command."""
+    connection.send_result(
+        msg["id"],
+        async_get_tracked_template_stats(hass, msg["order_by"], msg["limit"]),
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "subscribe_entities/stats"})
+@decorators.require_admin
+def handle_subscribe_entities_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities stats command."""
+    connection.send_result(
+        msg["id"], async_get_entity_subscription_hub(hass).async_stats()
+    )
+
+
 @callback
 @decorators.websocket_command(
     {vol.Required("type"): "entity/source", vol.Optional("entity_id"): [cv.entity_id]}
@@ -25,6 +25,10 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Once this many messages are pending, queued state changes of
+# subscribe_entities subscriptions are replaced by the latest state
+# of their entity instead of queueing every change.
+PENDING_MSG_COALESCE: Final = 256
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -48,4 +52,8 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the hub of subscribe_entities subscriptions
+DATA_ENTITY_SUBSCRIPTIONS: Final = f"{DOMAIN}.entity_subscriptions"
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_DEFLATE_MESSAGES = "deflate_messages"
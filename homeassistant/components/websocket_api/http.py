@@ -21,6 +21,7 @@ from .auth import AuthPhase, auth_required_message
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -28,7 +29,14 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import (
+    DEFLATE_FINAL_BLOCK,
+    EntityStateMessage,
+    deflate_segment,
+    entity_state_message,
+    inflate_segment,
+    message_to_json,
+)
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -37,6 +45,13 @@ if TYPE_CHECKING:
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
+# Messages of at least this size are compressed in the executor
+DEFLATE_EXECUTOR_MIN_SIZE: Final = 256 * 1024
+
+_DEFLATED_ARRAY_START: Final = deflate_segment("[")
+_DEFLATED_ARRAY_SEPARATOR: Final = deflate_segment(",")
+_DEFLATED_ARRAY_END: Final = deflate_segment("]")
+
 
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
@@ -59,6 +74,29 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+def _as_str(message: str | bytes) -> str:
+    """Return a message as text.
+
+    Messages are only queued as deflate segments when the
+    connection negotiated deflate, but the feature can be
+    turned off again while subscriptions are active.
+    """
+    if isinstance(message, bytes):
+        return inflate_segment(message)
+    return message
+
+
+class _PendingEntityMessage:
+    """A queued state change message that can be replaced."""
+
+    __slots__ = ("key", "message")
+
+    def __init__(self, key: tuple[int, str], message: str | bytes) -> None:
+        """Initialize the pending entity message."""
+        self.key = key
+        self.message = message
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -74,6 +112,7 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_pending_entity_messages",
         "_ready_future",
     )
 
@@ -94,7 +133,8 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[str | bytes | _PendingEntityMessage | None] = deque()
+        self._pending_entity_messages: dict[tuple[int, str], _PendingEntityMessage] = {}
         self._ready_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
@@ -122,6 +162,7 @@ class WebSocketHandler:
         logger = self._logger
         wsock = self._wsock
         send_str = wsock.send_str
+        send_bytes = wsock.send_bytes
         loop = self._hass.loop
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
@@ -137,29 +178,57 @@ class WebSocketHandler:
                 # A None message is used to signal the end of the connection
                 if (message := message_queue.popleft()) is None:
                     return
+                if isinstance(message, _PendingEntityMessage):
+                    message = self._pop_pending_entity_message(message)
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
+                connection = self._connection
+                can_deflate = connection is not None and connection.can_deflate
 
                 if (
                     not messages_remaining
-                    or not (connection := self._connection)
+                    or not connection
                     or not connection.can_coalesce
                 ):
                     if debug_enabled:
-                        debug("%s: Sending %s", self.description, message)
-                    await send_str(message)
+                        debug("%s: Sending %s", self.description, _as_str(message))
+                    if can_deflate:
+                        await send_bytes(
+                            await self._async_deflate(message) + DEFLATE_FINAL_BLOCK
+                        )
+                    else:
+                        await send_str(_as_str(message))
                     continue
 
-                messages: list[str] = [message]
+                messages: list[str | bytes] = [message]
                 while messages_remaining:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
+                    if isinstance(message, _PendingEntityMessage):
+                        message = self._pop_pending_entity_message(message)
                     messages.append(message)
                     messages_remaining -= 1
 
-                joined_messages = ",".join(messages)
+                if can_deflate:
+                    if debug_enabled:
+                        debug(
+                            "%s: Sending [%s]",
+                            self.description,
+                            ",".join(_as_str(message) for message in messages),
+                        )
+                    segments = [_DEFLATED_ARRAY_START]
+                    for message in messages:
+                        if len(segments) > 1:
+                            segments.append(_DEFLATED_ARRAY_SEPARATOR)
+                        segments.append(await self._async_deflate(message))
+                    segments.append(_DEFLATED_ARRAY_END)
+                    segments.append(DEFLATE_FINAL_BLOCK)
+                    await send_bytes(b"".join(segments))
+                    continue
+
+                joined_messages = ",".join(_as_str(message) for message in messages)
                 coalesced_messages = f"[{joined_messages}]"
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
@@ -174,6 +243,22 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _pop_pending_entity_message(
+        self, pending: _PendingEntityMessage
+    ) -> str | bytes:
+        """Return a pending entity message that is about to be sent."""
+        del self._pending_entity_messages[pending.key]
+        return pending.message
+
+    async def _async_deflate(self, message: str | bytes) -> bytes:
+        """Return a message as a deflate segment."""
+        if isinstance(message, bytes):
+            # Already compressed once for all connections
+            return message
+        if len(message) < DEFLATE_EXECUTOR_MIN_SIZE:
+            return deflate_segment(message)
+        return await self._hass.async_add_executor_job(deflate_segment, message)
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -182,7 +267,9 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | bytes | dict[str, Any] | EntityStateMessage
+    ) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -194,11 +281,28 @@ class WebSocketHandler:
             # max pending messages.
             return
 
-        if isinstance(message, dict):
-            message = message_to_json(message)
-
         message_queue = self._message_queue
         queue_size_before_add = len(message_queue)
+        queued_message: str | bytes | _PendingEntityMessage
+        if isinstance(message, dict):
+            queued_message = message_to_json(message)
+        elif not isinstance(message, EntityStateMessage):
+            queued_message = message
+        elif queue_size_before_add < PENDING_MSG_COALESCE:
+            queued_message = message.message
+        else:
+            # The client is falling behind, only keep the latest
+            # state of each entity instead of every change
+            key = (message.iden, message.event.data["entity_id"])
+            if (pending := self._pending_entity_messages.get(key)) is not None:
+                state_message = entity_state_message(message.iden, message.event)
+                if isinstance(pending.message, bytes):
+                    pending.message = deflate_segment(state_message)
+                else:
+                    pending.message = state_message
+                return
+            queued_message = _PendingEntityMessage(key, message.message)
+
         if queue_size_before_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
@@ -208,12 +312,18 @@ class WebSocketHandler:
                 ),
                 self.description,
                 MAX_PENDING_MSG,
-                message,
+                message.message
+                if isinstance(message, EntityStateMessage)
+                else queued_message,
             )
             self._cancel()
             return
 
-        message_queue.append(message)
+        if isinstance(queued_message, _PendingEntityMessage):
+            # Only register the message once it is queued, so a rejected
+            # message doesn't swallow later changes of the entity
+            self._pending_entity_messages[queued_message.key] = queued_message
+        message_queue.append(queued_message)
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
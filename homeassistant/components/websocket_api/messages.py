@@ -4,6 +4,7 @@ from __future__ import annotations
 from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, Final, cast
+import zlib
 
 import voluptuous as vol
 
@@ -42,6 +43,15 @@ ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
 
+# Clients that negotiated FEATURE_DEFLATE_MESSAGES receive messages as
+# raw deflate (RFC 1951) binary frames. Messages are built from segments
+# that are independent deflate streams flushed to a byte boundary, so
+# segments can be concatenated and cached event segments can be shared
+# between connections. A frame is terminated with DEFLATE_FINAL_BLOCK.
+DEFLATE_FINAL_BLOCK: Final = b"\x01\x00\x00\xff\xff"
+# Smaller segments are stored since compressing them does not pay off
+DEFLATE_MIN_SIZE: Final = 128
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -121,6 +131,87 @@ def _cached_state_diff_message(event: Event) -> str:
     )
 
 
+def deflated_event_message(iden: int, event: Event) -> bytes:
+    """Return an event message as a deflate segment.
+
+    The event is only compressed once, only the
+    id is added for each connection.
+    """
+    return deflate_segment(f'{{"id":{iden}') + _deflated_event_message(event)
+
+
+@lru_cache(maxsize=128)
+def _deflated_event_message(event: Event) -> bytes:
+    """Cache and compress the event message following the id."""
+    return deflate_segment(
+        _cached_event_message(event).partition(IDEN_JSON_TEMPLATE)[2]
+    )
+
+
+def deflated_state_diff_message(iden: int, event: Event) -> bytes:
+    """Return a state diff event message as a deflate segment.
+
+    The event is only compressed once, only the
+    id is added for each connection.
+    """
+    return deflate_segment(f'{{"id":{iden}') + _deflated_state_diff_message(event)
+
+
+@lru_cache(maxsize=128)
+def _deflated_state_diff_message(event: Event) -> bytes:
+    """Cache and compress the state diff event message following the id."""
+    return deflate_segment(
+        _cached_state_diff_message(event).partition(IDEN_JSON_TEMPLATE)[2]
+    )
+
+
+def deflate_segment(data: str) -> bytes:
+    """Return data as a deflate segment."""
+    encoded = data.encode()
+    if (size := len(encoded)) < DEFLATE_MIN_SIZE:
+        # A single non-final stored block
+        return (
+            b"\x00"
+            + size.to_bytes(2, "little")
+            + (size ^ 0xFFFF).to_bytes(2, "little")
+            + encoded
+        )
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(encoded) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def inflate_segment(segment: bytes) -> str:
+    """Return the data of a deflate segment."""
+    return zlib.decompress(segment + DEFLATE_FINAL_BLOCK, -zlib.MAX_WBITS).decode()
+
+
+class EntityStateMessage:
+    """A state change message of a subscribe_entities subscription.
+
+    Connections that fall behind can replace queued state changes
+    of the same entity with its latest state.
+    """
+
+    __slots__ = ("iden", "event", "message")
+
+    def __init__(self, iden: int, event: Event, message: str | bytes) -> None:
+        """Initialize the entity state message."""
+        self.iden = iden
+        self.event = event
+        self.message = message
+
+
+def entity_state_message(iden: int, event: Event) -> str:
+    """Return a message with the full new state of a state_changed event."""
+    if (new_state := event.data["new_state"]) is None:
+        payload: dict[str, Any] = {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    else:
+        payload = {
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state()}
+        }
+    return message_to_json({"id": iden, "type": "event", "event": payload})
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -0,0 +1,146 @@
+"""Shared fan-out of state changes to subscribe_entities subscriptions."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .const import DATA_ENTITY_SUBSCRIPTIONS
+from .messages import (
+    EntityStateMessage,
+    cached_state_diff_message,
+    deflated_state_diff_message,
+)
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+# The subscription id, the entity filter and if messages are deflated
+SubscriptionGroupKey = tuple[int, frozenset[str], bool]
+
+
+class _SubscriptionGroup:
+    """Subscriptions that receive identical messages."""
+
+    __slots__ = ("msg_id", "entity_ids", "state_diff_message", "connections")
+
+    def __init__(self, msg_id: int, entity_ids: frozenset[str], deflate: bool) -> None:
+        """Initialize the subscription group."""
+        self.msg_id = msg_id
+        self.entity_ids = entity_ids
+        self.state_diff_message: Callable[[int, Event], str | bytes]
+        if deflate:
+            self.state_diff_message = deflated_state_diff_message
+        else:
+            self.state_diff_message = cached_state_diff_message
+        self.connections: dict[ActiveConnection, None] = {}
+
+
+class EntitySubscriptionHub:
+    """Forward state changes to the subscribe_entities subscriptions.
+
+    Frontends subscribe with the same ids and entity filters, so
+    subscriptions are grouped to filter each state change and build
+    its message once per group instead of once per connection. Only
+    the permissions of each user are checked for every connection.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscription hub."""
+        self.hass = hass
+        self._groups: dict[SubscriptionGroupKey, _SubscriptionGroup] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self.events = 0
+        self.messages_built = 0
+        self.messages_sent = 0
+        self.total_time = 0.0
+
+    @callback
+    def async_subscribe(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to state changes of entity_ids or all entities."""
+        key = (msg_id, frozenset(entity_ids), connection.can_deflate)
+        if (group := self._groups.get(key)) is None:
+            group = self._groups[key] = _SubscriptionGroup(*key)
+        group.connections[connection] = None
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+            )
+        return partial(self._async_unsubscribe, key, connection)
+
+    @callback
+    def _async_unsubscribe(
+        self, key: SubscriptionGroupKey, connection: ActiveConnection
+    ) -> None:
+        """Unsubscribe a connection."""
+        group = self._groups[key]
+        del group.connections[connection]
+        if group.connections:
+            return
+        del self._groups[key]
+        if not self._groups and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward a state change to the subscribed connections."""
+        start = time.perf_counter()
+        entity_id: str = event.data["entity_id"]
+        messages_built = messages_sent = 0
+        for group in self._groups.values():
+            if group.entity_ids and entity_id not in group.entity_ids:
+                continue
+            message: EntityStateMessage | None = None
+            for connection in group.connections:
+                # We have to lookup the permissions again because the user
+                # might have changed since the subscription was created.
+                permissions = connection.user.permissions
+                if not permissions.access_all_entities(
+                    POLICY_READ
+                ) and not permissions.check_entity(entity_id, POLICY_READ):
+                    continue
+                if message is None:
+                    message = EntityStateMessage(
+                        group.msg_id,
+                        event,
+                        group.state_diff_message(group.msg_id, event),
+                    )
+                    messages_built += 1
+                connection.send_message(message)
+                messages_sent += 1
+        self.events += 1
+        self.messages_built += messages_built
+        self.messages_sent += messages_sent
+        self.total_time += time.perf_counter() - start
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the fan-out statistics."""
+        events = self.events
+        return {
+            "groups": len(self._groups),
+            "subscriptions": sum(
+                len(group.connections) for group in self._groups.values()
+            ),
+            "events": events,
+            "messages_built": self.messages_built,
+            "messages_sent": self.messages_sent,
+            "total_time": self.total_time,
+            "average_time": self.total_time / events if events else 0.0,
+        }
+
+
+@callback
+def async_get_entity_subscription_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the subscription hub of subscribe_entities."""
+    if (hub := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        hub = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = EntitySubscriptionHub(hass)
+    return hub
@@ -978,25 +978,99 @@ _FilterableJobType = tuple[
 ]
 
 
+class EventDispatchStats:
+    """Dispatch statistics for a single event type."""
+
+    __slots__ = ("fired", "listeners", "dispatch_time", "max_dispatch_time")
+
+    def __init__(self) -> None:
+        """Initialize the dispatch statistics."""
+        self.fired = 0
+        self.listeners = 0
+        self.dispatch_time = 0.0
+        self.max_dispatch_time = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "fired": self.fired,
+            "listeners": self.listeners,
+            "dispatch_time": self.dispatch_time,
+            "max_dispatch_time": self.max_dispatch_time,
+        }
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_keyed_listeners",
+        "_dispatch_stats",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._keyed_listeners: dict[str, dict[str, list[_FilterableJobType]]] = {}
+        self._dispatch_stats: dict[str, EventDispatchStats] | None = None
         self._hass = hass
 
     @callback
     def async_listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners.
 
+        Keyed listeners are included in the count of their event type.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for jobs in keyed_listeners.values()
+            )
+        return listeners
+
+    @callback
+    def async_keyed_listeners(self) -> dict[str, dict[str, int]]:
+        """Return dictionary with events and the number of listeners per key.
+
+        This method must be run in the event loop.
+        """
+        return {
+            event_type: {key: len(jobs) for key, jobs in keyed_listeners.items()}
+            for event_type, keyed_listeners in self._keyed_listeners.items()
+        }
+
+    @callback
+    def async_set_dispatch_stats(self, enabled: bool) -> None:
+        """Enable or disable collection of dispatch statistics.
+
+        Disabling collection discards the statistics collected so far.
+
+        This method must be run in the event loop.
+        """
+        if not enabled:
+            self._dispatch_stats = None
+        elif self._dispatch_stats is None:
+            self._dispatch_stats = {}
+
+    @callback
+    def async_dispatch_stats(self) -> dict[str, dict[str, Any]]:
+        """Return dispatch statistics per event type.
+
+        This method must be run in the event loop.
+        """
+        if self._dispatch_stats is None:
+            return {}
+        return {
+            event_type: stats.as_dict()
+            for event_type, stats in self._dispatch_stats.items()
+        }
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1036,11 +1110,40 @@ class EventBus:
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
 
+        if (
+            event_data
+            and (keyed_listeners := self._keyed_listeners.get(event_type))
+            and isinstance(entity_id := event_data.get("entity_id"), str)
+        ):
+            # Keyed listeners are indexed by entity_id and by domain
+            # so routing them is a dict lookup instead of running
+            # a filter for every listener.
+            entity_id_listeners = keyed_listeners.get(entity_id)
+            domain_listeners = keyed_listeners.get(entity_id.partition(".")[0])
+            if entity_id_listeners and domain_listeners:
+                # A listener keyed on both the entity_id and its
+                # domain is only called once
+                listeners = listeners + list(
+                    dict.fromkeys(entity_id_listeners + domain_listeners)
+                )
+            elif entity_id_listeners:
+                listeners = listeners + entity_id_listeners
+            elif domain_listeners:
+                listeners = listeners + domain_listeners
+
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
+        stats: EventDispatchStats | None = None
+        if (dispatch_stats := self._dispatch_stats) is not None:
+            if (stats := dispatch_stats.get(event_type)) is None:
+                stats = dispatch_stats[event_type] = EventDispatchStats()
+            stats.fired += 1
+            stats.listeners += len(listeners) + len(match_all_listeners)
+            start = monotonic()
+
         if not listeners and not match_all_listeners:
             return
 
@@ -1064,6 +1167,12 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+        if stats is not None:
+            elapsed = monotonic() - start
+            stats.dispatch_time += elapsed
+            if elapsed > stats.max_dispatch_time:
+                stats.max_dispatch_time = elapsed
+
     def listen(
         self,
         event_type: str,
@@ -1116,6 +1225,76 @@ class EventBus:
             (HassJob(listener, f"listen {event_type}"), event_filter, run_immediately),
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        keys: str | Iterable[str],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type keyed by entity_id or domain.
+
+        Each key is either an entity_id or a domain. The listener is
+        only called for events whose entity_id in the event data matches
+        one of the keys, or whose entity_id belongs to one of the domains.
+
+        Keyed listeners are looked up in an index when the event is fired,
+        so the cost of firing an event does not grow with the number of
+        keyed listeners for other keys.
+
+        If run_immediately is passed, the callback will be run
+        right away instead of using call_soon. Only use this if
+        the callback results in scheduling another task.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners cannot listen to all events")
+        if run_immediately and not is_callback(listener):
+            raise HomeAssistantError(f"Event listener {listener} is not a callback")
+        if isinstance(keys, str):
+            keys = [keys]
+        keys = list(dict.fromkeys(key.lower() for key in keys))
+        filterable_job: _FilterableJobType = (
+            HassJob(listener, f"listen {event_type} {keys}"),
+            None,
+            run_immediately,
+        )
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        for key in keys:
+            keyed_listeners.setdefault(key, []).append(filterable_job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, keys, filterable_job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self, event_type: str, keys: list[str], filterable_job: _FilterableJobType
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            for key in keys:
+                keyed_listeners[key].remove(filterable_job)
+                if not keyed_listeners[key]:
+                    del keyed_listeners[key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+        except (KeyError, ValueError):
+            # KeyError is key event_type or key listener did not exist
+            # ValueError if listener did not exist within key
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
@@ -1267,7 +1446,12 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # ReadOnlyDict is immutable so it can be shared between states
+        self.attributes: ReadOnlyDict[str, Any] = (
+            attributes
+            if type(attributes) is ReadOnlyDict
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1283,6 +1467,11 @@ class State:
             "_", " "
         )
 
+    @property
+    def last_updated_timestamp(self) -> float:
+        """Timestamp of the last update."""
+        return self.last_updated.timestamp()
+
     def as_dict(self) -> ReadOnlyDict[str, Collection[Any]]:
         """Return a dict representation of the State.
 
@@ -1413,6 +1602,27 @@ class State:
         )
 
 
+def _state_change_attributes(
+    old_state: State | None,
+    new_state: str,
+    attributes: Mapping[str, Any],
+    force_update: bool,
+) -> Mapping[str, Any] | None:
+    """Return the attributes to use for a new state.
+
+    Returns None if setting the state would leave the state machine unchanged.
+
+    If the attributes did not change, the attributes of the old state are
+    returned so they are shared with the new state instead of being copied
+    into a new ReadOnlyDict on every state change.
+    """
+    if old_state is None or old_state.attributes != attributes:
+        return attributes
+    if not force_update and old_state.state == new_state:
+        return None
+    return old_state.attributes
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
@@ -1613,17 +1823,12 @@ class StateMachine:
         """
         entity_id = entity_id.lower()
         new_state = str(new_state)
-        attributes = attributes or {}
-        if (old_state := self._states.get(entity_id)) is None:
-            same_state = False
-            same_attr = False
-            last_changed = None
-        else:
-            same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        if same_state and same_attr:
+        old_state = self._states.get(entity_id)
+        if (
+            attributes := _state_change_attributes(
+                old_state, new_state, attributes or {}, force_update
+            )
+        ) is None:
             return
 
         if context is None:
@@ -1644,7 +1849,106 @@ class StateMachine:
         else:
             now = dt_util.utcnow()
 
-        state = State(
+        state = self._async_create_state(
+            entity_id, new_state, attributes, force_update, context, now, old_state
+        )
+        self._async_store_state(entity_id, old_state, state)
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
+            EventOrigin.local,
+            context,
+            time_fired=now,
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[
+            tuple[str, str, Mapping[str, Any] | None, bool, Context | None]
+        ],
+    ) -> None:
+        """Set the state of multiple entities, add entities that do not exist.
+
+        Each item is a tuple of entity_id, new_state, attributes, force_update
+        and context, which have the same meaning as the arguments of async_set.
+        If the same entity_id is passed more than once, the last item wins.
+
+        All states share the same update time. The state_changed events
+        are fired once all states have been written. If a state is
+        invalid, the valid states are still written and the error of the
+        first invalid state is raised afterwards.
+
+        This method must be run in the event loop.
+        """
+        # See async_set for why we start from a timestamp
+        timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        pending: dict[str, tuple[State | None, State]] = {}
+        error: HomeAssistantError | None = None
+        for entity_id, new_state, attributes, force_update, context in states:
+            entity_id = entity_id.lower()
+            new_state = str(new_state)
+            pending.pop(entity_id, None)
+            old_state = self._states.get(entity_id)
+            if (
+                attributes := _state_change_attributes(
+                    old_state, new_state, attributes or {}, force_update
+                )
+            ) is None:
+                continue
+            try:
+                state = self._async_create_state(
+                    entity_id,
+                    new_state,
+                    attributes,
+                    force_update,
+                    context or Context(id=ulid_at_time(timestamp)),
+                    now,
+                    old_state,
+                )
+            except (InvalidEntityFormatError, InvalidStateError) as err:
+                if error is None:
+                    error = err
+                continue
+            pending[entity_id] = (old_state, state)
+
+        for entity_id, (old_state, state) in pending.items():
+            self._async_store_state(entity_id, old_state, state)
+
+        bus_fire = self._bus.async_fire
+        for entity_id, (old_state, state) in pending.items():
+            bus_fire(
+                EVENT_STATE_CHANGED,
+                {"entity_id": entity_id, "old_state": old_state, "new_state": state},
+                EventOrigin.local,
+                state.context,
+                time_fired=now,
+            )
+
+        if error is not None:
+            raise error
+
+    @callback
+    def _async_create_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any],
+        force_update: bool,
+        context: Context,
+        now: datetime.datetime,
+        old_state: State | None,
+    ) -> State:
+        """Create the State object that replaces old_state."""
+        if old_state is None:
+            last_changed = None
+        elif old_state.state == new_state and not force_update:
+            last_changed = old_state.last_changed
+        else:
+            last_changed = None
+
+        return State(
             entity_id,
             new_state,
             attributes,
@@ -1653,6 +1957,12 @@ class StateMachine:
             context,
             old_state is None,
         )
+
+    @callback
+    def _async_store_state(
+        self, entity_id: str, old_state: State | None, state: State
+    ) -> None:
+        """Store a state in the state machine and the domain index."""
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
@@ -1660,13 +1970,6 @@ class StateMachine:
             domain_index = {}
             self._domain_index[state.domain] = domain_index
         domain_index[entity_id] = state
-        self._bus.async_fire(
-            EVENT_STATE_CHANGED,
-            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
-            EventOrigin.local,
-            context,
-            time_fired=now,
-        )
 
 
 class SupportsResponse(enum.StrEnum):
@@ -1,10 +1,11 @@
 """Provide a way to connect entities belonging to one device."""
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Coroutine, ValuesView
 from enum import StrEnum
 import logging
+from operator import itemgetter
 import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, cast
 from urllib.parse import urlparse
@@ -22,6 +23,7 @@ from . import storage
 from .debounce import Debouncer
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data
+from .registry import RegistryIndexType, update_index
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -375,9 +377,10 @@ _EntryTypeT = TypeVar("_EntryTypeT", DeviceEntry, DeletedDeviceEntry)
 class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
     """Container for device registry items, maps device id -> entry.
 
-    Maintains two additional indexes:
+    Maintains three additional indexes:
     - (connection_type, connection identifier) -> entry
     - (DOMAIN, identifier) -> entry
+    - config_entry_id -> device ids
     """
 
     def __init__(self) -> None:
@@ -385,6 +388,7 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         super().__init__()
         self._connections: dict[tuple[str, str], _EntryTypeT] = {}
         self._identifiers: dict[tuple[str, str], _EntryTypeT] = {}
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
 
     def values(self) -> ValuesView[_EntryTypeT]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -392,8 +396,8 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
 
     def __setitem__(self, key: str, entry: _EntryTypeT) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry = self.data.get(key)
+        if old_entry is not None:
             for connection in old_entry.connections:
                 del self._connections[connection]
             for identifier in old_entry.identifiers:
@@ -404,6 +408,7 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
             self._connections[connection] = entry
         for identifier in entry.identifiers:
             self._identifiers[identifier] = entry
+        self._update_indexes(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
@@ -412,8 +417,30 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
             del self._connections[connection]
         for identifier in entry.identifiers:
             del self._identifiers[identifier]
+        self._update_indexes(key, entry, None)
         super().__delitem__(key)
 
+    def _update_indexes(
+        self, key: str, old_entry: _EntryTypeT | None, entry: _EntryTypeT | None
+    ) -> None:
+        """Update the config entry index of an entry."""
+        update_index(
+            self._config_entry_id_index,
+            key,
+            old_entry.config_entries if old_entry else (),
+            entry.config_entries if entry else (),
+        )
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[_EntryTypeT]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[device_id]
+            for device_id in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
     def get_entry(
         self,
         identifiers: set[tuple[str, str]] | None,
@@ -432,10 +459,43 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Maintains an additional index:
+    - area_id -> device ids
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+
+    def _update_indexes(
+        self, key: str, old_entry: DeviceEntry | None, entry: DeviceEntry | None
+    ) -> None:
+        """Update the config entry and area indexes of an entry."""
+        super()._update_indexes(key, old_entry, entry)
+        old_area_id = old_entry and old_entry.area_id
+        area_id = entry and entry.area_id
+        if old_area_id != area_id:
+            update_index(
+                self._area_id_index,
+                key,
+                (old_area_id,) if old_area_id else (),
+                (area_id,) if area_id else (),
+            )
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[device_id] for device_id in self._area_id_index.get(area_id, ())]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -448,6 +508,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_key=itemgetter("id"),
         )
 
     @callback
@@ -776,7 +837,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -877,12 +938,12 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in self.devices.get_entries_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
-        for deleted_device in list(self.deleted_devices.values()):
+        for deleted_device in self.deleted_devices.get_entries_for_config_entry_id(
+            config_entry_id
+        ):
             config_entries = deleted_device.config_entries
-            if config_entry_id not in config_entries:
-                continue
             if config_entries == {config_entry_id}:
                 # Add a time stamp when the deleted device became orphaned
                 self.deleted_devices[deleted_device.id] = attr.evolve(
@@ -890,8 +951,6 @@ class DeviceRegistry:
                 )
             else:
                 config_entries = config_entries - {config_entry_id}
-                # No need to reindex here since we currently
-                # do not have a lookup by config entry
                 self.deleted_devices[deleted_device.id] = attr.evolve(
                     deleted_device, config_entries=config_entries
                 )
@@ -918,9 +977,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in self.devices.get_devices_for_area_id(area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -939,7 +997,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -947,11 +1005,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
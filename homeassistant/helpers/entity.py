@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections.abc import Coroutine, Iterable, Mapping, MutableMapping
+from collections.abc import Coroutine, Generator, Iterable, Mapping, MutableMapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum, auto
@@ -34,7 +35,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     EntityCategory,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    HomeAssistant,
+    callback,
+    validate_state,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     InvalidStateError,
@@ -60,6 +67,7 @@ _T = TypeVar("_T")
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_STATE_WRITE_BATCH = "entity_state_write_batch"
 SOURCE_CONFIG_ENTRY = "config_entry"
 SOURCE_PLATFORM_CONFIG = "platform_config"
 
@@ -82,6 +90,35 @@ def entity_sources(hass: HomeAssistant) -> dict[str, dict[str, str]]:
     return _entity_sources
 
 
+@contextmanager
+def async_batch_state_writes(hass: HomeAssistant) -> Generator[None, None, None]:
+    """Batch the state writes of entities.
+
+    While the context manager is active, states written by
+    async_write_ha_state are collected and written to the state machine
+    with a single call to StateMachine.async_set_many when the outermost
+    context manager exits. Multiple writes of the same entity are coalesced
+    and only the last one is written. Entities with force_update are
+    written right away, since every one of their writes is an event.
+
+    Nothing should be awaited while the context manager is active.
+
+    This method must be run in the event loop.
+    """
+    if DATA_STATE_WRITE_BATCH in hass.data:
+        yield
+        return
+
+    batch: dict[
+        str, tuple[str, str, dict[str, Any], bool, Context | None]
+    ] = hass.data.setdefault(DATA_STATE_WRITE_BATCH, {})
+    try:
+        yield
+    finally:
+        del hass.data[DATA_STATE_WRITE_BATCH]
+        hass.states.async_set_many(batch.values())
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -853,6 +890,29 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
+        if (
+            batch := hass.data.get(DATA_STATE_WRITE_BATCH)
+        ) is not None and not self.force_update:
+            try:
+                validate_state(state)
+            except InvalidStateError:
+                _LOGGER.exception("Failed to set state, fall back to %s", STATE_UNKNOWN)
+                state, attr = STATE_UNKNOWN, {}
+            batch.pop(entity_id, None)
+            batch[entity_id] = (
+                entity_id,
+                state,
+                attr,
+                self.force_update,
+                self._context,
+            )
+            return
+
+        if batch is not None:
+            # Every write of a force_update entity fires an event, so
+            # it is written right away instead of being coalesced.
+            batch.pop(entity_id, None)
+
         try:
             hass.states.async_set(
                 entity_id, state, attr, self.force_update, self._context
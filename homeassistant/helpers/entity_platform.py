@@ -41,6 +41,7 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later, async_track_time_interval
 from .issue_registry import IssueSeverity, async_create_issue
+from .startup_trace import async_get_trace
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -751,6 +752,9 @@ class EntityPlatform:
 
         await entity.add_to_platform_finish()
 
+        if (trace := async_get_trace(self.hass)) is not None:
+            trace.async_first_state(self.platform_name, self.domain)
+
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
 
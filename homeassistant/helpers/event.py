@@ -44,7 +44,7 @@ from .entity_registry import (
 )
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import RenderInfo, RenderStats, Template, result_as_boolean
 from .typing import EventType, TemplateVarsType
 
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
@@ -62,6 +62,10 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TRACK_TEMPLATE_RESULT_INFOS = "track_template_result_infos"
+
+TEMPLATE_STATS_ORDER = ("total_time", "p99_time", "renders", "triggers", "fan_in")
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -299,35 +303,70 @@ def _async_dispatch_entity_id_event(
             )
 
 
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["entity_id"] in callbacks
-
-
 @bind_hass
 def _async_track_state_change_event(
     hass: HomeAssistant,
     entity_ids: str | Iterable[str],
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
-    """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        hass,
-        entity_ids,
-        TRACK_STATE_CHANGE_CALLBACKS,
-        TRACK_STATE_CHANGE_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_entity_id_event,
-        _async_state_change_filter,
-        action,
+    """async_track_state_change_event without lowercasing.
+
+    Each tracked entity_id has a single listener keyed by the entity_id
+    on the event bus, so state changes of other entities don't run any
+    filter.
+    """
+    if not entity_ids:
+        return _remove_empty_listener
+
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+
+    hass_data = hass.data
+
+    callbacks: dict[
+        str, list[HassJob[[EventType[EventStateChangedData]], Any]]
+    ] | None = hass_data.get(TRACK_STATE_CHANGE_CALLBACKS)
+    if callbacks is None:
+        callbacks = hass_data[TRACK_STATE_CHANGE_CALLBACKS] = {}
+    listeners: dict[str, CALLBACK_TYPE] | None = hass_data.get(
+        TRACK_STATE_CHANGE_LISTENER
+    )
+    if listeners is None:
+        listeners = hass_data[TRACK_STATE_CHANGE_LISTENER] = {}
+
+    job = HassJob(action, f"track {EVENT_STATE_CHANGED} event {entity_ids}")
+
+    for entity_id in entity_ids:
+        if callback_list := callbacks.get(entity_id):
+            callback_list.append(job)
+            continue
+        callbacks[entity_id] = [job]
+        listeners[entity_id] = hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED,
+            entity_id,
+            callback(ft.partial(_async_dispatch_entity_id_event, hass, callbacks)),
+        )
+
+    return ft.partial(
+        _remove_state_change_listener, entity_ids, job, callbacks, listeners
     )
 
 
+@callback
+def _remove_state_change_listener(
+    entity_ids: Iterable[str],
+    job: HassJob[[EventType[EventStateChangedData]], Any],
+    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    listeners: dict[str, CALLBACK_TYPE],
+) -> None:
+    """Remove state change listener."""
+    for entity_id in entity_ids:
+        callbacks[entity_id].remove(job)
+        if not callbacks[entity_id]:
+            del callbacks[entity_id]
+            listeners.pop(entity_id)()
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
@@ -908,6 +947,7 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        self._triggers: dict[Template, int] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -922,6 +962,8 @@ class TrackTemplateResultInfo:
         log_fn: Callable[[int, str], None] | None = None,
     ) -> None:
         """Activation of template tracking."""
+        for track_template_ in self._track_templates:
+            track_template_.template.enable_render_stats()
         block_render = False
         super_template = self._track_templates[0] if self._has_super_template else None
 
@@ -970,6 +1012,7 @@ class TrackTemplateResultInfo:
             self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
         )
         self._update_time_listeners()
+        self.hass.data.setdefault(TRACK_TEMPLATE_RESULT_INFOS, set()).add(self)
         _LOGGER.debug(
             (
                 "Template group %s listens for %s, first render blocked by super"
@@ -989,6 +1032,49 @@ class TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @callback
+    def async_template_stats(self) -> list[dict[str, Any]]:
+        """Return the render statistics of the tracked templates.
+
+        The fan in is the number of entities whose state changes
+        cause the template to re-render.
+        """
+        states = self.hass.states
+        template_stats: list[dict[str, Any]] = []
+        for track_template_ in self._track_templates:
+            template = track_template_.template
+            if (info := self._info.get(template)) is None:
+                continue
+            if info.all_states or info.all_states_lifecycle:
+                fan_in = states.async_entity_ids_count()
+            else:
+                domains = info.domains | info.domains_lifecycle
+                fan_in = sum(
+                    states.async_entity_ids_count(domain) for domain in domains
+                ) + sum(
+                    1
+                    for entity_id in info.entities
+                    if split_entity_id(entity_id)[0] not in domains
+                )
+            render_stats = template.render_stats or RenderStats()
+            template_stats.append(
+                {
+                    "template": template.template,
+                    **render_stats.as_dict(),
+                    "triggers": self._triggers.get(template, 0),
+                    "fan_in": fan_in,
+                    "listeners": {
+                        "all": info.all_states or info.all_states_lifecycle,
+                        "domains": sorted(info.domains | info.domains_lifecycle),
+                        "entities": sorted(info.entities),
+                    },
+                    "rate_limit": info.rate_limit.total_seconds()
+                    if info.rate_limit is not None
+                    else None,
+                }
+            )
+        return template_stats
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1025,6 +1111,7 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self.hass.data[TRACK_TEMPLATE_RESULT_INFOS].discard(self)
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1057,6 +1144,8 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            self._triggers[template] = self._triggers.get(template, 0) + 1
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1214,6 +1303,22 @@ class TrackTemplateResultInfo:
         self.hass.async_run_hass_job(self._job, event, updates)
 
 
+@callback
+def async_get_tracked_template_stats(
+    hass: HomeAssistant, order_by: str = "total_time", limit: int | None = None
+) -> list[dict[str, Any]]:
+    """Return the render statistics of all tracked templates.
+
+    The most expensive templates by order_by come first.
+    """
+    template_stats: list[dict[str, Any]] = []
+    info: TrackTemplateResultInfo
+    for info in hass.data.get(TRACK_TEMPLATE_RESULT_INFOS, ()):
+        template_stats.extend(info.async_template_stats())
+    template_stats.sort(key=lambda stats: stats.get(order_by, 0), reverse=True)
+    return template_stats[:limit]
+
+
 TrackTemplateResultListener = Callable[
     [
         EventType[EventStateChangedData] | None,
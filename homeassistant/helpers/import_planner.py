@@ -0,0 +1,220 @@
+"""Import integrations ahead of their setup during startup."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor
+import importlib
+import logging
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.loader import DATA_COMPONENTS, Integration
+from homeassistant.util.package import is_installed
+
+from . import storage
+
+STORAGE_KEY = "core.import_planner"
+STORAGE_VERSION = 1
+
+# Imports mostly wait on reading files, so a few
+# threads are enough to keep the storage busy
+IMPORT_WORKERS = 4
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def import_waves(integrations: Iterable[Integration]) -> list[list[Integration]]:
+    """Order integrations in waves that only depend on earlier waves.
+
+    Importing the dependencies of an integration first means the
+    import threads rarely wait on each other for a module lock.
+    """
+    remaining = {integration.domain: integration for integration in integrations}
+    waves: list[list[Integration]] = []
+    while remaining:
+        wave = [
+            integration
+            for integration in remaining.values()
+            if not any(dep in remaining for dep in integration.dependencies)
+        ]
+        if not wave:
+            # Circular dependencies, import the rest together
+            wave = list(remaining.values())
+        for integration in wave:
+            del remaining[integration.domain]
+        waves.append(wave)
+    return waves
+
+
+def _import_module(name: str) -> None:
+    """Import a module, failures are reported when it is imported for setup."""
+    try:
+        importlib.import_module(name)
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.debug("Unable to import %s ahead of setup: %s", name, err)
+
+
+def _import_integration(integration: Integration) -> bool:
+    """Import an integration and return if it was imported.
+
+    Custom integrations are only imported once their requirements are
+    installed, since they can have side effects when they are imported.
+    """
+    if not integration.is_built_in and not all(
+        is_installed(requirement) for requirement in integration.requirements
+    ):
+        _LOGGER.debug(
+            "Not importing %s ahead of setup, its requirements are not installed",
+            integration.domain,
+        )
+        return False
+    _import_module(integration.pkg_path)
+    return True
+
+
+class ImportPlanner:
+    """Import the integrations that will be set up in worker threads.
+
+    Setting up integrations imports their modules on the event loop one
+    at a time. The planner imports them in parallel ahead of the setup,
+    together with the platforms that were loaded during the last start.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the import planner."""
+        self.hass = hass
+        self._store = storage.Store[dict[str, Any]](
+            hass, STORAGE_VERSION, STORAGE_KEY, private=True
+        )
+        self._platforms: list[str] = []
+        self._imported: dict[str, asyncio.Future[None]] = {}
+
+    async def async_load(self) -> None:
+        """Load the platforms that were loaded during the last start."""
+        if data := await self._store.async_load():
+            self._platforms = data["platforms"]
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, self._async_save_platforms
+        )
+
+    async def async_wait_imported(self, domains: Iterable[str], timeout: float) -> bool:
+        """Wait until the integrations of the domains have been imported.
+
+        Importing a module on the event loop while a worker thread imports
+        it blocks the loop on the import lock, so a stage waits for the
+        imports of its own integrations and their platforms before it is
+        set up. Returns False if the imports did not finish in time.
+        """
+        if not (
+            futures := [
+                future
+                for domain in domains
+                if (future := self._imported.get(domain)) and not future.done()
+            ]
+        ):
+            return True
+        _, pending = await asyncio.wait(futures, timeout=timeout)
+        return not pending
+
+    @callback
+    def async_start(
+        self, stages: Iterable[Iterable[Integration]]
+    ) -> asyncio.Task[None]:
+        """Start importing integrations stage by stage in the background.
+
+        The platforms of an integration that were loaded during the last
+        start are imported right after the integration.
+        """
+        loop = self.hass.loop
+        integrations: list[Integration] = []
+        for stage in stages:
+            stage_integrations = [
+                integration
+                for integration in stage
+                if integration.domain not in self._imported
+            ]
+            for integration in stage_integrations:
+                self._imported[integration.domain] = loop.create_future()
+            for wave in import_waves(stage_integrations):
+                integrations.extend(wave)
+        platforms: dict[str, list[str]] = {}
+        for platform in self._platforms:
+            domain, _, platform_name = platform.partition(".")
+            platforms.setdefault(domain, []).append(platform_name)
+        return self.hass.async_create_background_task(
+            self._async_import(integrations, platforms), "import integrations"
+        )
+
+    async def _async_import(
+        self, integrations: list[Integration], platforms: dict[str, list[str]]
+    ) -> None:
+        """Import the integrations in order and their platforms."""
+        executor = ThreadPoolExecutor(
+            max_workers=IMPORT_WORKERS, thread_name_prefix="ImportPlanner"
+        )
+        # Each integration only waits for the dependencies ordered before
+        # it, so a slow import only holds back the integrations that need it
+        ordered: set[str] = set()
+        imports: list[Coroutine[Any, Any, None]] = []
+        for integration in integrations:
+            imports.append(
+                self._async_import_integration(
+                    executor,
+                    integration,
+                    [
+                        self._imported[domain]
+                        for domain in integration.dependencies
+                        if domain in ordered
+                    ],
+                    platforms.get(integration.domain, []),
+                )
+            )
+            ordered.add(integration.domain)
+        try:
+            await asyncio.gather(*imports)
+        finally:
+            executor.shutdown(wait=False)
+            # Never leave a stage waiting on an import that was cancelled
+            for future in self._imported.values():
+                if not future.done():
+                    future.set_result(None)
+
+    async def _async_import_integration(
+        self,
+        executor: ThreadPoolExecutor,
+        integration: Integration,
+        dependencies: list[asyncio.Future[None]],
+        platforms: list[str],
+    ) -> None:
+        """Import an integration after its dependencies, then its platforms."""
+        loop = self.hass.loop
+        try:
+            if dependencies:
+                await asyncio.wait(dependencies)
+            if await loop.run_in_executor(executor, _import_integration, integration):
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor,
+                            _import_module,
+                            f"{integration.pkg_path}.{platform}",
+                        )
+                        for platform in platforms
+                    )
+                )
+        finally:
+            if not (future := self._imported[integration.domain]).done():
+                future.set_result(None)
+
+    @callback
+    def _async_save_platforms(self, _event: Event) -> None:
+        """Save the platforms that were loaded during this start."""
+        self._store.async_delay_save(
+            lambda: {
+                "platforms": sorted(
+                    name for name in self.hass.data[DATA_COMPONENTS] if "." in name
+                )
+            }
+        )
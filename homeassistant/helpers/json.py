@@ -158,8 +158,12 @@ def save_json(
     *,
     encoder: type[json.JSONEncoder] | None = None,
     atomic_writes: bool = False,
+    fsync: bool = False,
 ) -> None:
-    """Save JSON data to a file."""
+    """Save JSON data to a file.
+
+    See write_utf8_file for fsync.
+    """
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -184,7 +188,7 @@ def save_json(
     if atomic_writes:
         write_utf8_file_atomic(filename, json_data, private)
     else:
-        write_utf8_file(filename, json_data, private)
+        write_utf8_file(filename, json_data, private, fsync=fsync)
 
 
 def find_paths_unserializable_data(
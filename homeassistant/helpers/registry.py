@@ -0,0 +1,31 @@
+"""Provide common helpers for registries."""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Collection
+from typing import Literal
+
+# Maps a value to the keys of the registry entries that have the value
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def update_index(
+    index: RegistryIndexType,
+    key: str,
+    old_values: Collection[str],
+    new_values: Collection[str],
+) -> None:
+    """Update the index for a registry entry whose values changed.
+
+    An entry keeps its place for the values it still has, so lookups
+    return the entries in the order they got the value.
+    """
+    for value in old_values:
+        if value not in new_values:
+            keys = index[value]
+            del keys[key]
+            if not keys:
+                del index[value]
+    for value in new_values:
+        if value not in old_values:
+            index[value][key] = True
@@ -31,6 +31,9 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How often the last seen time of a state that did not change is updated
+LAST_SEEN_UPDATE_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -106,6 +109,11 @@ def async_get(hass: HomeAssistant) -> RestoreStateData:
     return cast(RestoreStateData, hass.data[DATA_RESTORE_STATE])
 
 
+def _stored_state_key(stored_state: dict[str, Any]) -> str:
+    """Return the key of a stored state in the journal."""
+    return stored_state["state"]["entity_id"]  # type: ignore[no-any-return]
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -133,10 +141,16 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            journal_key=_stored_state_key,
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state and the dict of the entities in the last dump
+        self._dumped_states: dict[str, tuple[State, dict[str, Any]]] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -211,15 +225,41 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_stored_states_as_dicts(
+        self, stored_states: list[StoredState]
+    ) -> list[dict[str, Any]]:
+        """Return the dicts of the stored states.
+
+        States that did not change since the last dump are returned as they
+        were dumped, so only the changed states are written to the journal.
+        Their last seen time is updated once a day.
+        """
+        last_seen_expired = dt_util.utcnow() - LAST_SEEN_UPDATE_INTERVAL
+        dumped_states: dict[str, tuple[State, dict[str, Any]]] = {}
+        stored_state_dicts: list[dict[str, Any]] = []
+        for stored_state in stored_states:
+            state = stored_state.state
+            stored_state_dict = stored_state.as_dict()
+            if (
+                (dumped := self._dumped_states.get(state.entity_id)) is not None
+                # States are immutable, a changed state is a new object
+                and dumped[0] is state
+                and dumped[1]["extra_data"] == stored_state_dict["extra_data"]
+                and dumped[1]["last_seen"] > last_seen_expired
+            ):
+                stored_state_dict = dumped[1]
+            dumped_states[state.entity_id] = (state, stored_state_dict)
+            stored_state_dicts.append(stored_state_dict)
+        self._dumped_states = dumped_states
+        return stored_state_dicts
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                self._async_stored_states_as_dicts(self.async_get_stored_states())
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
@@ -0,0 +1,209 @@
+"""Trace the setup of integrations during startup."""
+from __future__ import annotations
+
+from collections.abc import Generator
+import contextlib
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .json import save_json
+
+DATA_STARTUP_TRACE = "startup_trace"
+
+STARTUP_TRACE_FILE = "startup_trace.json"
+
+# How often the event loop is checked for being blocked
+LOOP_CHECK_INTERVAL = 0.05
+# Shorter delays of the checks are not recorded
+LOOP_BLOCKED_THRESHOLD = 0.1
+
+PHASE_REQUIREMENTS = "requirements"
+PHASE_IMPORT = "import"
+PHASE_SETUP = "setup"
+PHASE_SETUP_ENTRY = "setup_entry"
+PHASE_PLATFORM = "platform"
+PHASE_FIRST_STATE = "first_state"
+PHASE_LOOP_BLOCKED = "loop_blocked"
+
+_BOOTSTRAP_TRACK = "bootstrap"
+
+
+class StartupTrace:
+    """Timeline of the setup of integrations during startup.
+
+    The timeline can be exported in the Chrome trace event format, which
+    shows every integration on its own track.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the startup trace."""
+        self.hass = hass
+        self.active = True
+        self.loop_blocked_time = 0.0
+        self._start = time.monotonic()
+        self._events: list[dict[str, Any]] = []
+        self._tracks: dict[str, int] = {_BOOTSTRAP_TRACK: 0}
+        self._first_states: set[str] = set()
+        self._loop_check: tuple[float, CALLBACK_TYPE] | None = None
+
+    def _track(self, integration: str) -> int:
+        """Return the track of an integration."""
+        if (track := self._tracks.get(integration)) is None:
+            track = self._tracks[integration] = len(self._tracks)
+        return track
+
+    def _timestamp(self, monotonic: float) -> float:
+        """Return the trace timestamp in microseconds of a monotonic time."""
+        return round((monotonic - self._start) * 1_000_000, 1)
+
+    @callback
+    def async_add_span(
+        self,
+        integration: str,
+        phase: str,
+        start: float,
+        end: float,
+        name: str | None = None,
+    ) -> None:
+        """Add a phase of an integration that ran from start to end."""
+        if not self.active:
+            return
+        self._events.append(
+            {
+                "name": name or phase,
+                "cat": phase,
+                "ph": "X",
+                "ts": self._timestamp(start),
+                "dur": round((end - start) * 1_000_000, 1),
+                "pid": 1,
+                "tid": self._track(integration),
+            }
+        )
+
+    @callback
+    def async_add_instant(
+        self, integration: str, phase: str, name: str | None = None
+    ) -> None:
+        """Add a moment in the setup of an integration."""
+        if not self.active:
+            return
+        self._events.append(
+            {
+                "name": name or phase,
+                "cat": phase,
+                "ph": "i",
+                "s": "t",
+                "ts": self._timestamp(time.monotonic()),
+                "pid": 1,
+                "tid": self._track(integration),
+            }
+        )
+
+    @callback
+    def async_first_state(self, integration: str, domain: str) -> None:
+        """Record the first state written by a platform."""
+        if (platform := f"{domain}.{integration}") in self._first_states:
+            return
+        self._first_states.add(platform)
+        self.async_add_instant(integration, PHASE_FIRST_STATE, platform)
+
+    @callback
+    def async_start_loop_monitor(self) -> None:
+        """Start recording when the event loop is blocked."""
+        expected = time.monotonic() + LOOP_CHECK_INTERVAL
+        handle = self.hass.loop.call_later(LOOP_CHECK_INTERVAL, self._check_loop)
+        self._loop_check = (expected, handle.cancel)
+
+    @callback
+    def _check_loop(self) -> None:
+        """Record the time the check was delayed by a blocked event loop."""
+        assert self._loop_check is not None
+        expected = self._loop_check[0]
+        if (now := time.monotonic()) - expected >= LOOP_BLOCKED_THRESHOLD:
+            self.loop_blocked_time += now - expected
+            self.async_add_span(_BOOTSTRAP_TRACK, PHASE_LOOP_BLOCKED, expected, now)
+        self.async_start_loop_monitor()
+
+    @callback
+    def async_stop_loop_monitor(self) -> None:
+        """Stop recording when the event loop is blocked."""
+        if self._loop_check is not None:
+            self._loop_check[1]()
+            self._loop_check = None
+
+    @callback
+    def async_finish(self) -> None:
+        """Finish the trace."""
+        self.async_stop_loop_monitor()
+        self.async_add_instant(_BOOTSTRAP_TRACK, "started")
+        self.active = False
+
+    @callback
+    def async_as_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format."""
+        return {
+            "traceEvents": [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": track,
+                    "args": {"name": integration},
+                }
+                for integration, track in self._tracks.items()
+            ]
+            + self._events,
+            "displayTimeUnit": "ms",
+            "otherData": {"loop_blocked_time": self.loop_blocked_time},
+        }
+
+
+@callback
+def async_start_trace(hass: HomeAssistant) -> StartupTrace:
+    """Start tracing the startup.
+
+    The trace is written to the configuration directory once
+    Home Assistant has started.
+    """
+    trace = hass.data[DATA_STARTUP_TRACE] = StartupTrace(hass)
+
+    async def _async_write_trace(_event: Event) -> None:
+        """Finish and write the trace."""
+        trace.async_finish()
+        # Errors are logged by save_json
+        with contextlib.suppress(HomeAssistantError):
+            await hass.async_add_executor_job(
+                save_json,
+                hass.config.path(STARTUP_TRACE_FILE),
+                trace.async_as_chrome_trace(),
+            )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_write_trace)
+    return trace
+
+
+@callback
+def async_get_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace while it is recording."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is not None and trace.active:
+        return trace  # type: ignore[no-any-return]
+    return None
+
+
+@contextlib.contextmanager
+def async_trace_phase(
+    hass: HomeAssistant, integration: str, phase: str, name: str | None = None
+) -> Generator[None, None, None]:
+    """Record a phase in the setup of an integration."""
+    if (trace := async_get_trace(hass)) is None:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        trace.async_add_span(integration, phase, start, time.monotonic(), name)
@@ -5,13 +5,22 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass, field
 import inspect
+import itertools
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import Any, Generic, TypeVar
-
-from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+import queue
+import threading
+import time
+from typing import Any, Generic, TypeVar, cast
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+)
 from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
@@ -25,6 +34,7 @@ from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -35,6 +45,18 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITER = "storage_writer"
+
+# Stores with atomic writes hold critical data and are written first
+WRITE_PRIORITY_CRITICAL = 0
+WRITE_PRIORITY_DEFAULT = 1
+
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the data file once it grows
+# larger than this ratio of the size of the data file
+JOURNAL_COMPACT_RATIO = 0.5
+
+_STOPPING_STATES = (CoreState.stopping, CoreState.final_write)
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +101,230 @@ async def async_migrator(
     return config
 
 
+@dataclass(slots=True)
+class StoreWriteStats:
+    """Statistics of the writes of a store."""
+
+    writes: int = 0
+    # Saves that were merged into a write that was already queued
+    coalesced: int = 0
+    # Time from queuing the data until it was written and synced
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    # Time spent encoding and writing the data
+    total_write_time: float = 0.0
+    max_write_time: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the statistics with the average times."""
+        return {
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+            "average_latency": self.total_latency / self.writes if self.writes else 0,
+            "max_latency": self.max_latency,
+            "average_write_time": (
+                self.total_write_time / self.writes if self.writes else 0
+            ),
+            "max_write_time": self.max_write_time,
+        }
+
+
+@dataclass(slots=True)
+class _PendingWrite:
+    """Data of a store that waits to be written."""
+
+    store: Store
+    data: dict[str, Any]
+    queued: float
+    futures: list[asyncio.Future[None]] = field(default_factory=list)
+
+
+class _StorageWriter(threading.Thread):
+    """Thread that writes the data of all stores.
+
+    Writing in a dedicated thread keeps the JSON encoding and file writes of
+    stores, which all save together when stopping, from taking over the
+    executor. Saves of a store that are queued while it waits are written
+    once with the latest data, and the stores written together share the
+    sync of their directory.
+
+    The writer is stopped and joined when Home Assistant closes. It is a
+    daemon thread so a writer that is started after that does not keep the
+    interpreter from exiting.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the storage writer."""
+        super().__init__(name="StorageWriter", daemon=True)
+        self.hass = hass
+        self.stats: dict[str, StoreWriteStats] = {}
+        self._queue: queue.PriorityQueue[
+            tuple[int, int, str | None]
+        ] = queue.PriorityQueue()
+        self._pending: dict[str, _PendingWrite] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._stopped = False
+
+    async def async_write(self, store: Store, data: dict[str, Any]) -> None:
+        """Write the data of a store."""
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        write = _PendingWrite(store, data, time.monotonic(), [future])
+        with self._lock:
+            stats = self.stats.setdefault(store.key, StoreWriteStats())
+            if not (stopped := self._stopped or not self.is_alive()):
+                if (pending := self._pending.get(store.key)) is not None:
+                    stats.coalesced += 1
+                    pending.store = store
+                    pending.data = data
+                    pending.futures.append(future)
+                else:
+                    self._pending[store.key] = write
+                    self._queue.put(
+                        (store._write_priority, next(self._sequence), store.key)
+                    )
+        if stopped:
+            # Written in the executor once the writer has stopped
+            await self.hass.async_add_executor_job(self._write_batch, [write])
+        await future
+
+    def run(self) -> None:
+        """Write the queued data until stopped."""
+        batch: list[_PendingWrite] = []
+        try:
+            while True:
+                keys = [self._queue.get()[2]]
+                # Everything that is queued by now is written in the same batch
+                with suppress(queue.Empty):
+                    while True:
+                        keys.append(self._queue.get_nowait()[2])
+                with self._lock:
+                    batch = [self._pending.pop(key) for key in keys if key is not None]
+                if batch:
+                    try:
+                        self._write_batch(batch)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error writing storage")
+                batch = []
+                if None in keys:
+                    return
+        finally:
+            # Data that is still queued when the writer stops unexpectedly
+            # is written here, later writes fall back to the executor
+            with self._lock:
+                self._stopped = True
+                batch.extend(self._pending.values())
+                self._pending.clear()
+            if batch:
+                self._write_batch(batch)
+
+    def _write_batch(self, batch: list[_PendingWrite]) -> None:
+        """Write a batch of data and sync the directories of atomic writes."""
+        errors: list[Exception | None] = []
+        directories: set[str] = set()
+        try:
+            for pending in batch:
+                store = pending.store
+                start = time.monotonic()
+                try:
+                    store._write_data(store.path, pending.data)
+                except Exception as err:  # pylint: disable=broad-except
+                    errors.append(err)
+                else:
+                    errors.append(None)
+                stats = self.stats.setdefault(store.key, StoreWriteStats())
+                write_time = time.monotonic() - start
+                stats.total_write_time += write_time
+                stats.max_write_time = max(stats.max_write_time, write_time)
+                if store._atomic_writes:
+                    directories.add(os.path.dirname(store.path))
+
+            for directory in directories:
+                try:
+                    fdesc = os.open(directory, os.O_RDONLY)
+                    try:
+                        os.fsync(fdesc)
+                    finally:
+                        os.close(fdesc)
+                except OSError as err:
+                    _LOGGER.error(
+                        "Error syncing storage directory %s: %s", directory, err
+                    )
+        except Exception as err:  # pylint: disable=broad-except
+            # The data that was not written fails with the error
+            _LOGGER.exception("Error writing storage")
+            errors.extend(err for _ in range(len(errors), len(batch)))
+
+        now = time.monotonic()
+        loop_closed = False
+        for pending, error in zip(batch, errors):
+            stats = self.stats.setdefault(pending.store.key, StoreWriteStats())
+            stats.writes += 1
+            latency = now - pending.queued
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            if loop_closed:
+                continue
+            for future in pending.futures:
+                try:
+                    self.hass.loop.call_soon_threadsafe(
+                        _set_future_result, future, error
+                    )
+                except RuntimeError:
+                    # The event loop is closed, nothing waits for the writes
+                    loop_closed = True
+                    break
+
+    async def async_stop(self, _event: Event | None = None) -> None:
+        """Stop the storage writer once all queued data is written."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._queue.put((WRITE_PRIORITY_DEFAULT + 1, next(self._sequence), None))
+        await self.hass.async_add_executor_job(self.join)
+
+
+def _set_future_result(future: asyncio.Future[None], error: Exception | None) -> None:
+    """Set the result of a write."""
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+@callback
+def _async_get_storage_writer(hass: HomeAssistant) -> _StorageWriter:
+    """Return the storage writer, it is started on first use."""
+    if (writer := hass.data.get(STORAGE_WRITER)) is None:
+        writer = hass.data[STORAGE_WRITER] = _StorageWriter(hass)
+        writer.start()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, writer.async_stop)
+    return cast(_StorageWriter, writer)
+
+
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> dict[str, dict[str, float]]:
+    """Return the statistics of the writes of the stores by their key."""
+    if (writer := hass.data.get(STORAGE_WRITER)) is None:
+        return {}
+    return {key: stats.as_dict() for key, stats in writer.stats.items()}
+
+
+@dataclass(slots=True)
+class _JournalState:
+    """Encoded items of the data that was written last by a journaled store."""
+
+    journal_id: str
+    version: tuple[int, int]
+    # Items of the lists in the data by their key, None for a list as data
+    lists: dict[str | None, dict[str, bytes]]
+    # Other values in the data
+    values: dict[str, bytes]
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -94,8 +340,16 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_key: Callable[[Any], str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Stores with a journal_key only append the items of the lists in
+        the data that changed, identified by the key, to a journal file.
+        The journal is compacted into the data file when it grows too large.
+        Compacting is done by the save that makes the journal grow too
+        large, which then takes as long as a save of a store without one.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,12 +363,24 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal_key = journal_key
+        self._journal: _JournalState | None = None
+        self._journal_size = 0
+        self._snapshot_size = 0
+        self._write_priority = (
+            WRITE_PRIORITY_CRITICAL if atomic_writes else WRITE_PRIORITY_DEFAULT
+        )
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -158,9 +424,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -353,22 +617,224 @@ class Store(Generic[_T]):
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> Any:
+        """Load the data file and apply the journal."""
+        data = cast(dict[str, Any], json_util.load_json(self.path))
+        if self._journal_key is None or not data:
+            return data
+
+        self._journal = None
+        self._journal_size = 0
+        self._snapshot_size = os.path.getsize(self.path)
+        if (journal_id := data.get("journal")) is None:
+            # Written without a journal
+            return data
+
+        stored = data["data"]
+        lists, values = self._split_data(stored)
+        complete = self._replay_journal(journal_id, lists, values)
+        if isinstance(stored, list):
+            data["data"] = list(lists[None].values())
+        else:
+            data["data"] = {
+                name: list(lists[name].values()) if name in lists else values[name]
+                for name in stored
+            }
+        if complete:
+            self._journal = _JournalState(
+                journal_id,
+                (data["version"], data.get("minor_version", 1)),
+                *self._encode_data(lists, values),
+            )
+        return data
+
+    def _replay_journal(
+        self,
+        journal_id: str,
+        lists: dict[str | None, dict[str, Any]],
+        values: dict[str, Any],
+    ) -> bool:
+        """Apply the journal of the data file.
+
+        Returns False when the journal ends with an incomplete write.
+        """
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                journal = fdesc.read()
+        except FileNotFoundError:
+            return True
+
+        header, _, records = journal.partition(b"\n")
+        try:
+            if json_util.json_loads(header) != {"journal": journal_id}:
+                # Journal of an older data file
+                return True
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            return False
+
+        for line in records.splitlines():
+            try:
+                changes = cast(list[dict[str, Any]], json_util.json_loads(line))
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                _LOGGER.warning(
+                    "Ignoring an incomplete write at the end of the journal of %s",
+                    self.key,
+                )
+                return False
+            for change in changes:
+                if "n" in change:
+                    values[change["n"]] = change["v"]
+                elif "v" in change:
+                    lists[change["l"]][change["i"]] = change["v"]
+                else:
+                    lists[change["l"]].pop(change["i"], None)
+
+        self._journal_size = len(journal)
+        return True
+
+    def _split_data(
+        self, data: Any
+    ) -> tuple[dict[str | None, dict[str, Any]], dict[str, Any]]:
+        """Split the data in the items of its lists by key and other values."""
+        assert self._journal_key is not None
+        journal_key = self._journal_key
+        if isinstance(data, list):
+            return {None: {journal_key(item): item for item in data}}, {}
+        lists: dict[str | None, dict[str, Any]] = {}
+        values: dict[str, Any] = {}
+        for name, value in data.items():
+            if isinstance(value, list):
+                lists[name] = {journal_key(item): item for item in value}
+            else:
+                values[name] = value
+        return lists, values
+
+    def _encode_data(
+        self, lists: dict[str | None, dict[str, Any]], values: dict[str, Any]
+    ) -> tuple[dict[str | None, dict[str, bytes]], dict[str, bytes]]:
+        """Encode the items and values of the data."""
+        encode: Callable[[Any], bytes]
+        if self._encoder and self._encoder is not json_helper.JSONEncoder:
+            # Like save_json, only custom encoders use the slow path
+            encoder = self._encoder
+
+            def encode(obj: Any) -> bytes:
+                return json.dumps(obj, cls=encoder).encode("utf-8")
+
+        else:
+            encode = json_helper.json_bytes
+        return (
+            {
+                name: {item_id: encode(item) for item_id, item in items.items()}
+                for name, items in lists.items()
+            },
+            {name: encode(value) for name, value in values.items()},
+        )
+
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        await _async_get_storage_writer(self.hass).async_write(self, data)
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if self._journal_key is not None:
+            self._write_journaled_data(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
             data,
             self._private,
             encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+            # The directory is synced by the storage writer
+            fsync=self._atomic_writes,
         )
 
+    def _write_journaled_data(self, path: str, data: dict) -> None:
+        """Append the changes to the journal or compact it into the data file."""
+        version = (data["version"], data["minor_version"])
+        lists: dict[str | None, dict[str, bytes]] | None
+        values: dict[str, bytes] | None
+        try:
+            lists, values = self._encode_data(*self._split_data(data["data"]))
+        except TypeError:
+            # Let save_json report where the data can't be serialized
+            lists = values = None
+
+        if (
+            (journal := self._journal) is not None
+            and lists is not None
+            and values is not None
+            and journal.version == version
+            and journal.lists.keys() == lists.keys()
+            and journal.values.keys() == values.keys()
+        ):
+            if not (changes := _journal_changes(journal, lists, values)):
+                return
+            line = b"[" + b",".join(changes) + b"]\n"
+            if (
+                self._journal_size + len(line)
+                <= self._snapshot_size * JOURNAL_COMPACT_RATIO
+                # Compacting is left to the next start to keep stopping quick
+                or self.hass.state in _STOPPING_STATES
+            ):
+                _LOGGER.debug(
+                    "Appending %s changes for %s to %s",
+                    len(changes),
+                    self.key,
+                    self.journal_path,
+                )
+                self._append_journal(journal.journal_id, line)
+                journal.lists = lists
+                journal.values = values
+                return
+
+        _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        journal_id = random_uuid_hex()
+        json_helper.save_json(
+            path,
+            {**data, "journal": journal_id},
+            self._private,
+            encoder=self._encoder,
+            # The directory is synced by the storage writer
+            fsync=self._atomic_writes,
+        )
+        # The journal is ignored when it does not match the data file
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_size = 0
+        self._snapshot_size = os.path.getsize(path)
+        self._journal = None
+        if lists is not None and values is not None:
+            self._journal = _JournalState(journal_id, version, lists, values)
+
+    def _append_journal(self, journal_id: str, line: bytes) -> None:
+        """Append a line to the journal, a new journal starts with a header."""
+        if not self._journal_size:
+            line = json_helper.json_bytes({"journal": journal_id}) + b"\n" + line
+        try:
+            fdesc = os.open(
+                self.journal_path,
+                os.O_WRONLY
+                | os.O_CREAT
+                | os.O_APPEND
+                | (0 if self._journal_size else os.O_TRUNC),
+                0o600 if self._private else 0o644,
+            )
+            with open(fdesc, "wb") as journal:
+                journal.write(line)
+                if self._atomic_writes:
+                    journal.flush()
+                    os.fsync(journal.fileno())
+        except OSError as error:
+            # The next write compacts the journal in case it was partially written
+            self._journal = None
+            _LOGGER.exception("Appending to the journal failed: %s", self.journal_path)
+            raise WriteError(error) from error
+        self._journal_size += len(line)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -380,3 +846,37 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal_key is not None:
+            self._journal = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _journal_changes(
+    journal: _JournalState,
+    lists: dict[str | None, dict[str, bytes]],
+    values: dict[str, bytes],
+) -> list[bytes]:
+    """Return the encoded changes of the data since it was written last."""
+    dump = json_helper.json_bytes
+    changes: list[bytes] = []
+    for name, items in lists.items():
+        written = journal.lists[name]
+        encoded_name = dump(name)
+        changes.extend(
+            b'{"l":%s,"i":%s,"v":%s}' % (encoded_name, dump(item_id), item)
+            for item_id, item in items.items()
+            if written.get(item_id) != item
+        )
+        changes.extend(
+            b'{"l":%s,"i":%s}' % (encoded_name, dump(item_id))
+            for item_id in written
+            if item_id not in items
+        )
+    changes.extend(
+        b'{"n":%s,"v":%s}' % (dump(name), value)
+        for name, value in values.items()
+        if journal.values[name] != value
+    )
+    return changes
@@ -4,6 +4,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import deque
 import collections.abc
 from collections.abc import Callable, Collection, Generator, Iterable, MutableMapping
 from contextlib import contextmanager, suppress
@@ -20,6 +21,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import time
 from types import CodeType
 from typing import (
     Any,
@@ -36,7 +38,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -145,14 +147,32 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+#
+# COMPILED_TEMPLATE_CACHE_SIZE is the number of compiled templates shared
+# by all template environments. Templates in use already share their
+# compiled code through the template_cache of their environment, this
+# cache keeps the code of the most recently used templates around so
+# templates that are created over and over again, for example by
+# websocket subscriptions or scripts, and environments created for a
+# custom log function do not have to compile them again.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 2048
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
 CACHED_TEMPLATE_LRU: MutableMapping[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
     CACHED_TEMPLATE_STATES
 )
+COMPILED_TEMPLATE_LRU: MutableMapping[tuple[str, bool, bool], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+# The number of the most recent render times of a template that are
+# kept to calculate percentiles of its render time
+RENDER_TIME_SAMPLES = 200
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -445,6 +465,495 @@ class RenderInfo:
             self.filter = _false
 
 
+class RenderStats:
+    """Holds the render times of a template."""
+
+    __slots__ = ("renders", "total_time", "_recent_times")
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.renders = 0
+        self.total_time = 0.0
+        self._recent_times: deque[float] = deque(maxlen=RENDER_TIME_SAMPLES)
+
+    def add(self, render_time: float) -> None:
+        """Add the time a render took."""
+        self.renders += 1
+        self.total_time += render_time
+        self._recent_times.append(render_time)
+
+    def percentile(self, percent: float) -> float:
+        """Return a percentile of the most recent render times."""
+        if not (recent_times := sorted(self._recent_times)):
+            return 0.0
+        return recent_times[
+            min(len(recent_times) - 1, math.ceil(len(recent_times) * percent / 100) - 1)
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the render statistics as a dict, times are in seconds."""
+        return {
+            "renders": self.renders,
+            "total_time": self.total_time,
+            "average_time": self.total_time / self.renders if self.renders else 0.0,
+            "p99_time": self.percentile(99),
+        }
+
+
+class StaticDependencies:
+    """Holds the states a template references without rendering it."""
+
+    __slots__ = ("entities", "domains", "covers_all_states")
+
+    def __init__(
+        self,
+        entities: frozenset[str],
+        domains: frozenset[str],
+        covers_all_states: bool,
+    ) -> None:
+        """Initialise."""
+        self.entities = entities
+        self.domains = domains
+        # True if every iteration over all states is narrowed to the
+        # entities and domains by selecting on a literal domain or entity_id
+        self.covers_all_states = covers_all_states
+
+    def __repr__(self) -> str:
+        """Representation of StaticDependencies."""
+        return (
+            f"<StaticDependencies entities={self.entities} domains={self.domains}"
+            f" covers_all_states={self.covers_all_states}>"
+        )
+
+
+_NO_STATIC_DEPENDENCIES = StaticDependencies(frozenset(), frozenset(), False)
+
+# Functions, filters and tests that take an entity_id as first argument
+_ENTITY_ID_FUNCTIONS = {
+    "states",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "has_value",
+}
+# Tests which make selectattr only select states matching the value(s)
+_SELECTATTR_TESTS = {"eq", "equalto", "==", "in"}
+# Nodes that pull in other templates, which are not analyzed
+_TEMPLATE_REFERENCES = (nodes.Extends, nodes.Include, nodes.Import, nodes.FromImport)
+
+
+def _const_string(node: nodes.Node | None) -> str | None:
+    """Return the string literal of a node."""
+    if isinstance(node, nodes.Const) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _const_strings(node: nodes.Node | None) -> list[str] | None:
+    """Return the string literals of a list or tuple node."""
+    if not isinstance(node, (nodes.List, nodes.Tuple)):
+        return None
+    values = [_const_string(item) for item in node.items]
+    if None in values:
+        return None
+    return cast(list[str], values)
+
+
+def _collect_static_entity_id(
+    value: str | None, entities: set[str], domains: set[str]
+) -> None:
+    """Collect a literal entity_id or domain."""
+    if value is None:
+        return
+    if valid_entity_id(value):
+        entities.add(value)
+    elif valid_domain(value):
+        domains.add(value)
+
+
+def _collect_static_selectattr(
+    node: nodes.Filter, entities: set[str], domains: set[str]
+) -> bool:
+    """Collect the states selected by selectattr on a literal domain or entity_id.
+
+    Returns False if other states may be selected.
+    """
+    if (
+        node.name != "selectattr"
+        or len(node.args) != 3
+        or node.kwargs
+        or node.dyn_args is not None
+        or node.dyn_kwargs is not None
+    ):
+        return False
+    attribute, test, value = node.args
+    if (test_name := _const_string(test)) not in _SELECTATTR_TESTS:
+        return False
+    if test_name == "in":
+        values = _const_strings(value)
+    elif (single_value := _const_string(value)) is not None:
+        values = [single_value]
+    else:
+        return False
+    if not values:
+        return False
+    attribute_name = _const_string(attribute)
+    if attribute_name == "domain" and all(map(valid_domain, values)):
+        domains.update(values)
+        return True
+    if attribute_name == "entity_id" and all(map(valid_entity_id, values)):
+        entities.update(values)
+        return True
+    return False
+
+
+def _collect_static_states_access(
+    node: nodes.Name,
+    parent: nodes.Node | None,
+    grandparent: nodes.Node | None,
+    entities: set[str],
+    domains: set[str],
+) -> bool:
+    """Collect the states referenced by an access of the states global.
+
+    Returns False if the access may iterate over all states.
+    """
+    if node.ctx != "load" or parent is None:
+        return False
+    if isinstance(parent, nodes.Call) and parent.node is node:
+        # states('sensor.temperature') is collected as a function
+        return True
+    if isinstance(parent, nodes.Getattr) and parent.node is node:
+        # states.sensor or states.sensor.temperature
+        if isinstance(grandparent, nodes.Getattr) and grandparent.node is parent:
+            _collect_static_entity_id(
+                f"{parent.attr}.{grandparent.attr}", entities, domains
+            )
+        else:
+            _collect_static_entity_id(parent.attr, entities, domains)
+        return True
+    if isinstance(parent, nodes.Getitem) and parent.node is node:
+        # states['sensor.temperature'], looking up a key that is
+        # not a literal never iterates over all states either
+        _collect_static_entity_id(_const_string(parent.arg), entities, domains)
+        return True
+    if isinstance(parent, nodes.Filter) and parent.node is node:
+        # states | selectattr('domain', 'eq', 'light')
+        return _collect_static_selectattr(parent, entities, domains)
+    return False
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def template_static_dependencies(source: str) -> StaticDependencies:
+    """Extract the states a template references from its syntax tree.
+
+    Only literal entity_ids and domains are found, the dependencies
+    collected during a render remain authoritative.
+    """
+    try:
+        tree = _NO_HASS_ENV.parse(source)
+    except jinja2.TemplateError:
+        return _NO_STATIC_DEPENDENCIES
+
+    entities: set[str] = set()
+    domains: set[str] = set()
+    covers_all_states = True
+    stack: list[tuple[nodes.Node, nodes.Node | None, nodes.Node | None]] = [
+        (tree, None, None)
+    ]
+    while stack:
+        node, parent, grandparent = stack.pop()
+        stack.extend((child, node, parent) for child in node.iter_child_nodes())
+        if isinstance(node, _TEMPLATE_REFERENCES):
+            covers_all_states = False
+        elif isinstance(node, nodes.Name):
+            if node.name == "states" and not _collect_static_states_access(
+                node, parent, grandparent, entities, domains
+            ):
+                covers_all_states = False
+        elif isinstance(node, nodes.Call):
+            if isinstance(node.node, nodes.Name) and node.node.name in (
+                _ENTITY_ID_FUNCTIONS
+            ):
+                _collect_static_entity_id(
+                    _const_string(node.args[0]) if node.args else None,
+                    entities,
+                    domains,
+                )
+        elif isinstance(node, (nodes.Filter, nodes.Test)):
+            if node.name in _ENTITY_ID_FUNCTIONS:
+                _collect_static_entity_id(_const_string(node.node), entities, domains)
+
+    return StaticDependencies(
+        frozenset(entities), frozenset(domains), covers_all_states
+    )
+
+
+# Filters applied to every item of a sequence on its own
+_ITEM_FILTERS = {"list", "map", "reject", "rejectattr", "select", "selectattr"}
+# Filters and tests which only depend on the value they are applied to
+_PURE_ITEM_FILTERS = {
+    "abs",
+    "as_datetime",
+    "as_timestamp",
+    "bool",
+    "capitalize",
+    "count",
+    "d",
+    "default",
+    "first",
+    "float",
+    "from_json",
+    "int",
+    "is_number",
+    "last",
+    "length",
+    "lower",
+    "multiply",
+    "regex_findall",
+    "regex_findall_index",
+    "regex_match",
+    "regex_replace",
+    "regex_search",
+    "replace",
+    "round",
+    "slugify",
+    "string",
+    "title",
+    "to_json",
+    "trim",
+    "upper",
+}
+_PURE_ITEM_TESTS = (set(jinja2.tests.TESTS) - {"filter", "test"}) | {
+    "contains",
+    "is_number",
+    "match",
+    "search",
+}
+# Filters consuming any iterable the same way as a list
+_SEQUENCE_FILTERS = {"join", "list", "max", "min", "sort", "sum", "unique"}
+# Nodes with a body that is rendered with its own context
+_SCOPED_NODES = (nodes.Macro, nodes.CallBlock)
+
+_INCREMENTAL_ITEMS = "_incremental_items"
+
+
+def _is_const(node: nodes.Node) -> bool:
+    """Return if a node is a literal."""
+    if isinstance(node, (nodes.List, nodes.Tuple)):
+        return all(_is_const(item) for item in node.items)
+    return isinstance(node, nodes.Const)
+
+
+def _is_pure_item_filter(node: nodes.Filter) -> bool:
+    """Return if a filter applies to every item on its own with literal arguments."""
+    if (
+        node.name not in _ITEM_FILTERS
+        or node.dyn_args is not None
+        or node.dyn_kwargs is not None
+        or not all(_is_const(arg) for arg in node.args)
+        or not all(_is_const(kwarg.value) for kwarg in node.kwargs)
+    ):
+        return False
+    if node.name == "list":
+        return not node.args and not node.kwargs
+    if node.name == "map":
+        if not node.args:
+            return all(kwarg.key in ("attribute", "default") for kwarg in node.kwargs)
+        return _const_string(node.args[0]) in _PURE_ITEM_FILTERS
+    # selectattr('state', 'eq', 'on') or select('odd')
+    test_position = 1 if node.name.endswith("attr") else 0
+    if node.kwargs:
+        return False
+    if len(node.args) <= test_position:
+        # Selects on the truthiness of the item or attribute
+        return True
+    return _const_string(node.args[test_position]) in _PURE_ITEM_TESTS
+
+
+def _replace_child(parent: nodes.Node, child: nodes.Node, new: nodes.Node) -> None:
+    """Replace the child of a node."""
+    for field, value in parent.iter_fields():
+        if value is child:
+            setattr(parent, field, new)
+            return
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                if item is child:
+                    value[index] = new
+                    return
+
+
+def _plan_incremental_render(tree: nodes.Template) -> list[tuple[str, nodes.Template]]:
+    """Split the iterations over the states of a domain from a template.
+
+    Finds states.<domain> iterated through filters, like selectattr and
+    map, which apply to each state on their own with literal arguments,
+    for example:
+
+        {{ states.sensor | selectattr('state', 'eq', 'on') | list | count }}
+
+    The iterations in the tree are replaced by calls returning their
+    resulting items by index. For every iteration the domain and a
+    template that passes the items each state in _states results in to
+    _store is returned.
+    """
+    parents: dict[int, nodes.Node] = {}
+    domain_lookups: list[nodes.Getattr] = []
+    stack: list[nodes.Node] = [tree]
+    while stack:
+        node = stack.pop()
+        for child in node.iter_child_nodes():
+            parents[id(child)] = node
+            stack.append(child)
+        if isinstance(node, nodes.Name) and node.name == "states":
+            if node.ctx != "load":
+                # The states global is shadowed
+                return []
+            if (
+                isinstance(lookup := parents[id(node)], nodes.Getattr)
+                and valid_domain(lookup.attr)
+                and lookup.attr not in _RESERVED_NAMES
+            ):
+                domain_lookups.append(lookup)
+
+    iterations: list[tuple[str, nodes.Template]] = []
+    for lookup in domain_lookups:
+        chain: nodes.Expr = lookup
+        while (
+            isinstance(parent := parents.get(id(chain)), nodes.Filter)
+            and parent.node is chain
+            and _is_pure_item_filter(parent)
+        ):
+            chain = parent
+        if chain is lookup:
+            continue
+        assert isinstance(chain, nodes.Filter)
+        if chain.name != "list" and not (
+            isinstance(parent, nodes.Filter)
+            and parent.node is chain
+            and parent.name in _SEQUENCE_FILTERS
+        ):
+            # Other filters may handle the lazy sequence differently
+            continue
+        ancestor: nodes.Node | None = parent
+        while ancestor is not None and not isinstance(ancestor, _SCOPED_NODES):
+            ancestor = parents.get(id(ancestor))
+        if ancestor is not None:
+            continue
+
+        items = nodes.Call(
+            nodes.Name(_INCREMENTAL_ITEMS, "load"),
+            [nodes.Const(len(iterations))],
+            [],
+            None,
+            None,
+        )
+        _replace_child(parents[id(chain)], chain, items)
+        _replace_child(
+            parents[id(lookup)], lookup, nodes.List([nodes.Name("_state", "load")])
+        )
+        if chain.name != "list":
+            chain = nodes.Filter(chain, "list", [], [], None, None)
+        # {% for _state in _states %}{{ _store(loop.index0, [_state] | ...) }}{% endfor %}
+        store = nodes.Call(
+            nodes.Name("_store", "load"),
+            [nodes.Getattr(nodes.Name("loop", "load"), "index0", "load"), chain],
+            [],
+            None,
+            None,
+        )
+        item_tree = nodes.Template(
+            [
+                nodes.For(
+                    nodes.Name("_state", "store"),
+                    nodes.Name("_states", "load"),
+                    [nodes.Output([store])],
+                    [],
+                    None,
+                    False,
+                )
+            ]
+        )
+        iterations.append((lookup.attr, item_tree))
+    return iterations
+
+
+class _DomainIteration:
+    """Holds the items the states of a domain resulted in when last rendered."""
+
+    __slots__ = ("domain", "compiled", "_items")
+
+    def __init__(self, domain: str, compiled: jinja2.Template) -> None:
+        """Initialise."""
+        self.domain = domain
+        self.compiled = compiled
+        self._items: dict[str, tuple[State, list[Any]]] = {}
+
+    def async_items(self, hass: HomeAssistant, template_str: str) -> list[Any]:
+        """Return the items of the states, only rendering states that changed."""
+        cached_items = self._items
+        items: dict[str, tuple[State, list[Any]]] = {}
+        changed: list[State] = []
+        for state in hass.states.async_all(self.domain):
+            entity_id = state.entity_id
+            if (cached := cached_items.get(entity_id)) is not None and (
+                cached[0] is state
+            ):
+                items[entity_id] = cached
+            else:
+                items[entity_id] = (state, [])
+                changed.append(state)
+
+        if changed:
+
+            def _store(index: int, result: list[Any]) -> str:
+                state = changed[index]
+                items[state.entity_id] = (state, result)
+                return ""
+
+            _render_with_context(
+                template_str,
+                self.compiled,
+                _states=[_template_state_no_collect(hass, state) for state in changed],
+                _store=_store,
+            )
+
+        self._items = items
+
+        # Collect the domain like iterating over DomainStates does
+        if (render_info := _render_info.get()) is not None:
+            render_info.domains_lifecycle.add(self.domain)  # type: ignore[attr-defined]
+            if items:
+                render_info.domains.add(self.domain)  # type: ignore[attr-defined]
+
+        return [item for _, result in items.values() for item in result]
+
+
+class _IncrementalRender:
+    """Render a template without iterating over unchanged states of a domain."""
+
+    __slots__ = ("compiled", "iterations")
+
+    def __init__(
+        self, compiled: jinja2.Template, iterations: list[_DomainIteration]
+    ) -> None:
+        """Initialise."""
+        self.compiled = compiled
+        self.iterations = iterations
+
+    def async_render(
+        self, hass: HomeAssistant, template_str: str, **kwargs: Any
+    ) -> str:
+        """Render the template."""
+
+        def _incremental_items(index: int) -> list[Any]:
+            return self.iterations[index].async_items(hass, template_str)
+
+        kwargs[_INCREMENTAL_ITEMS] = _incremental_items
+        return _render_with_context(template_str, self.compiled, **kwargs)
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -461,6 +970,8 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_incremental_render",
+        "_render_stats",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -479,6 +990,19 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        # None until planned, False if it cannot render incrementally
+        self._incremental_render: _IncrementalRender | Literal[False] | None = None
+        self._render_stats: RenderStats | None = None
+
+    @property
+    def render_stats(self) -> RenderStats | None:
+        """Return the render times, None unless they are recorded."""
+        return self._render_stats
+
+    def enable_render_stats(self) -> None:
+        """Record the render times of the template from now on."""
+        if self._render_stats is None:
+            self._render_stats = RenderStats()
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -564,10 +1088,27 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        # Templates rendered to collect their dependencies are rendered
+        # again whenever those change, so they are worth planning
+        incremental = self._incremental_render
+        if incremental is None and _render_info.get() is not None:
+            incremental = self._incremental_render = self._plan_incremental_render()
+
+        render_stats = self._render_stats
+        start = time.perf_counter() if render_stats is not None else 0.0
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if incremental and "states" not in kwargs:
+                assert self.hass is not None
+                render_result = incremental.async_render(
+                    self.hass, self.template, **kwargs
+                )
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
+        finally:
+            if render_stats is not None:
+                render_stats.add(time.perf_counter() - start)
 
         render_result = render_result.strip()
 
@@ -699,9 +1240,47 @@ class Template:
         finally:
             _render_info.reset(token)
 
+        if (
+            render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.exception
+        ):
+            self._apply_static_dependencies(render_info, variables, kwargs)
+
         render_info._freeze()
         return render_info
 
+    def _apply_static_dependencies(
+        self,
+        render_info: RenderInfo,
+        variables: TemplateVarsType,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Narrow or complete the dependencies collected during a render.
+
+        A template that only iterates over states selected by a literal
+        domain or entity_id does not need to listen for all states, and a
+        template that failed to render should still re-render when the
+        states it references change.
+        """
+        if self._compiled_code is None:
+            # Invalid templates will not render when states change
+            return
+        if "states" in (variables or {}) or "states" in kwargs:
+            # The states global is shadowed
+            return
+        static = template_static_dependencies(self.template)
+        if (
+            render_info.all_states or render_info.all_states_lifecycle
+        ) and static.covers_all_states:
+            # selectattr also checks if there are any states at all
+            render_info.all_states = False
+            render_info.all_states_lifecycle = False
+        elif not render_info.exception:
+            return
+        render_info.entities.update(static.entities)  # type: ignore[attr-defined]
+        render_info.domains.update(static.domains)  # type: ignore[attr-defined]
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -755,6 +1334,24 @@ class Template:
                 )
             return value if error_value is _SENTINEL else error_value
 
+    def _plan_incremental_render(self) -> _IncrementalRender | Literal[False]:
+        """Compile the template to keep the items of domain iterations."""
+        if self._limited or self._log_fn is not None:
+            return False
+        env = self._env
+        try:
+            tree = env.parse(self.template)
+            if not (planned := _plan_incremental_render(tree)):
+                return False
+            iterations: list[_DomainIteration] = []
+            for domain, item_tree in planned:
+                item_tree.set_lineno(1)
+                item_tree.set_environment(env)
+                iterations.append(_DomainIteration(domain, env.from_string(item_tree)))
+            return _IncrementalRender(env.from_string(tree), iterations)
+        except jinja2.TemplateError:
+            return False
+
     def _ensure_compiled(
         self,
         limited: bool = False,
@@ -2317,6 +2914,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._limited = bool(limited)
+        self._strict = bool(strict)
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
@@ -2603,8 +3202,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        if (cached := self.template_cache.get(source)) is not None:
+            return cached
+
+        if self.hass is not None and isinstance(source, str):
+            # The available filters and tests differ without hass
+            # so only environments with hass share compiled code
+            key = (source, self._limited, self._strict)
+            if (cached := COMPILED_TEMPLATE_LRU.get(key)) is None:
+                cached = COMPILED_TEMPLATE_LRU[key] = super().compile(source)
+        else:
+            cached = super().compile(source)
+        self.template_cache[source] = cached
 
         return cached
 
@@ -12,8 +12,11 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
+import stat
 import sys
+import threading
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -22,10 +25,12 @@ from awesomeversion import (
     AwesomeVersionException,
     AwesomeVersionStrategy,
 )
+import orjson
 import voluptuous as vol
 
 from . import generated
-from .core import HomeAssistant, callback
+from .const import EVENT_HOMEASSISTANT_STARTED, __version__
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -33,6 +38,7 @@ from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
+from .util.file import WriteError, write_utf8_file
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 # Typing imports that create a circular dependency
@@ -48,6 +54,10 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_INTEGRATION_DESCRIPTIONS = "integration_descriptions"
+DATA_MANIFEST_SNAPSHOT = "manifest_snapshot"
+MANIFEST_SNAPSHOT_FILE = "core.manifest_snapshot"
+MANIFEST_SNAPSHOT_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -173,6 +183,126 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
 
 
+class ManifestSnapshot:
+    """Parsed manifests and integration directories of the last start.
+
+    Resolving integrations reads and parses the manifest of every
+    integration that is found. The snapshot is loaded with a single read
+    at startup and only the files and directories that were modified
+    since it was written are read again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the manifest snapshot."""
+        self.path = path
+        # Path -> [mtime_ns, size, parsed content]
+        self._files: dict[str, list[Any]] = {}
+        # Path -> [mtime_ns, names of the sub directories]
+        self._dirs: dict[str, list[Any]] = {}
+        self._dirty = False
+        # Integrations are resolved in executor threads
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load the snapshot of the last start."""
+        try:
+            data = json_loads(pathlib.Path(self.path).read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, *JSON_DECODE_EXCEPTIONS) as err:
+            _LOGGER.warning("Unable to load manifest snapshot %s: %s", self.path, err)
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_SNAPSHOT_VERSION
+            or data.get("ha_version") != __version__
+        ):
+            # Rebuilt when Home Assistant is updated
+            return
+        self._files = cast(dict[str, list[Any]], data["files"])
+        self._dirs = cast(dict[str, list[Any]], data["dirs"])
+
+    def save(self) -> None:
+        """Save the snapshot if it was modified."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = orjson.dumps(
+                {
+                    "version": MANIFEST_SNAPSHOT_VERSION,
+                    "ha_version": __version__,
+                    "files": self._files,
+                    "dirs": self._dirs,
+                }
+            ).decode()
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        write_utf8_file(self.path, data, private=True)
+
+    def read_json(self, path: pathlib.Path) -> Any:
+        """Return the parsed content of a JSON file.
+
+        Returns None if the file does not exist.
+        """
+        key = str(path)
+        try:
+            file_stat = path.stat()
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            with self._lock:
+                if self._files.pop(key, None) is not None:
+                    self._dirty = True
+            return None
+        if (
+            (entry := self._files.get(key)) is not None
+            and entry[0] == file_stat.st_mtime_ns
+            and entry[1] == file_stat.st_size
+        ):
+            return entry[2]
+        content = json_loads(path.read_bytes())
+        with self._lock:
+            self._files[key] = [file_stat.st_mtime_ns, file_stat.st_size, content]
+            self._dirty = True
+        return content
+
+    def sub_directories(self, path: pathlib.Path) -> list[str]:
+        """Return the names of the sub directories of a directory."""
+        key = str(path)
+        mtime = path.stat().st_mtime_ns
+        if (entry := self._dirs.get(key)) is not None and entry[0] == mtime:
+            return cast(list[str], entry[1])
+        names = [entry.name for entry in path.iterdir() if entry.is_dir()]
+        with self._lock:
+            self._dirs[key] = [mtime, names]
+            self._dirty = True
+        return names
+
+
+async def async_load_manifest_snapshot(hass: HomeAssistant) -> None:
+    """Load the manifest snapshot and save it once Home Assistant has started."""
+    snapshot = ManifestSnapshot(hass.config.path(".storage", MANIFEST_SNAPSHOT_FILE))
+    await hass.async_add_executor_job(snapshot.load)
+    hass.data[DATA_MANIFEST_SNAPSHOT] = snapshot
+
+    async def _async_save_snapshot(_event: Event) -> None:
+        """Save the manifest snapshot."""
+        # Errors are logged by write_utf8_file
+        with suppress(WriteError):
+            await hass.async_add_executor_job(snapshot.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_snapshot)
+
+
+def _read_json(hass: HomeAssistant, path: pathlib.Path) -> Any:
+    """Return the parsed content of a JSON file, None if it does not exist."""
+    if (snapshot := hass.data.get(DATA_MANIFEST_SNAPSHOT)) is not None:
+        return snapshot.read_json(path)
+    if not path.is_file():
+        return None
+    return json_loads(path.read_text())
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -196,10 +326,18 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    snapshot: ManifestSnapshot | None = hass.data.get(DATA_MANIFEST_SNAPSHOT)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        if snapshot is not None:
+            return [
+                name
+                for path in paths
+                for name in snapshot.sub_directories(pathlib.Path(path))
+            ]
         return [
-            entry
+            entry.name
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
@@ -213,7 +351,7 @@ async def _async_get_custom_components(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        dirs,
     )
     return {
         integration.domain: integration
@@ -321,11 +459,20 @@ async def async_get_integration_descriptions(
     hass: HomeAssistant,
 ) -> dict[str, Any]:
     """Return cached list of integrations."""
-    base = generated.__path__[0]
-    config_flow_path = pathlib.Path(base) / "integrations.json"
-
-    flow = await hass.async_add_executor_job(config_flow_path.read_text)
-    core_flows = cast(dict[str, Any], json_loads(flow))
+    if (cached := hass.data.get(DATA_INTEGRATION_DESCRIPTIONS)) is None:
+        base = generated.__path__[0]
+        config_flow_path = pathlib.Path(base) / "integrations.json"
+        cached = hass.data[DATA_INTEGRATION_DESCRIPTIONS] = cast(
+            dict[str, Any],
+            await hass.async_add_executor_job(_read_json, hass, config_flow_path),
+        )
+    # Copy what is modified for the custom integrations
+    core_flows = {
+        **cached,
+        "integration": dict(cached["integration"]),
+        "helper": dict(cached["helper"]),
+        "translated_name": list(cached["translated_name"]),
+    }
     custom_integrations = await async_get_custom_components(hass)
     custom_flows: dict[str, Any] = {
         "integration": {},
@@ -559,17 +706,17 @@ class Integration:
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                manifest = cast(Manifest | None, _read_json(hass, manifest_path))
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
+            if manifest is None:
+                continue
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -6,6 +6,7 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
 from timeit import default_timer as timer
@@ -19,6 +20,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -314,6 +316,47 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def sensor_statistics_calculations(hass):
+    """Calculate 5 minute statistics of 1500 sensors with 300 states each."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models import LazyState
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import recorder as sensor_recorder
+
+    end = dt_util.utcnow()
+    start = end - timedelta(minutes=5)
+    start_ts = start.timestamp()
+    sensors = [
+        [
+            (
+                float(state_idx % 17),
+                LazyState(
+                    None,
+                    {},
+                    None,
+                    f"sensor.power_{sensor_idx}",
+                    str(state_idx % 17),
+                    start_ts + state_idx,
+                    True,
+                ),
+            )
+            for state_idx in range(300)
+        ]
+        for sensor_idx in range(1500)
+    ]
+
+    start_time = timer()
+    for fstates in sensors:
+        max(fstate for fstate, _ in fstates)
+        min(fstate for fstate, _ in fstates)
+        sensor_recorder._time_weighted_average(  # pylint: disable=protected-access
+            fstates, start, end
+        )
+    return timer() - start_time
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
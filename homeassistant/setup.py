@@ -6,6 +6,7 @@ from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
 from datetime import timedelta
 import logging.handlers
+from time import monotonic
 from timeit import default_timer as timer
 from types import ModuleType
 from typing import Any
@@ -21,6 +22,14 @@ from .const import (
 from .core import CALLBACK_TYPE, DOMAIN as HOMEASSISTANT_DOMAIN
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import (
+    PHASE_IMPORT,
+    PHASE_PLATFORM,
+    PHASE_REQUIREMENTS,
+    PHASE_SETUP,
+    async_get_trace,
+    async_trace_phase,
+)
 from .helpers.typing import ConfigType
 from .util import dt as dt_util, ensure_unique_string
 
@@ -204,7 +213,8 @@ async def _async_setup_component(
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
     try:
-        await async_process_deps_reqs(hass, config, integration)
+        with async_trace_phase(hass, domain, PHASE_REQUIREMENTS):
+            await async_process_deps_reqs(hass, config, integration)
     except HomeAssistantError as err:
         log_error(str(err))
         return False
@@ -212,7 +222,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_trace_phase(hass, domain, PHASE_IMPORT):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -515,6 +526,7 @@ def async_start_setup(
 
     setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
+    trace = async_get_trace(hass)
     for unique, domain in unique_components.items():
         del setup_started[unique]
         integration = domain.rpartition(".")[-1]
@@ -522,3 +534,12 @@ def async_start_setup(
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+        if trace is not None:
+            end = monotonic()
+            trace.async_add_span(
+                integration,
+                PHASE_PLATFORM if "." in domain else PHASE_SETUP,
+                end - time_taken.total_seconds(),
+                end,
+                domain,
+            )
@@ -47,10 +47,15 @@ def write_utf8_file(
     filename: str,
     utf8_data: str,
     private: bool = False,
+    *,
+    fsync: bool = False,
 ) -> None:
     """Write a file and rename it into place.
 
     Writes all or nothing.
+
+    With fsync the file is synced to disk before it is renamed into
+    place, syncing the rename is left to the caller.
     """
 
     tmp_filename = ""
@@ -63,6 +68,9 @@ def write_utf8_file(
             tmp_filename = fdesc.name
             if not private:
                 os.fchmod(fdesc.fileno(), 0o644)
+            if fsync:
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
         os.replace(tmp_filename, filename)
     except OSError as error:
         _LOGGER.exception("Saving file failed: %s", filename)
@@ -457,7 +457,16 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.second_group",
         "group.test_group",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    # One keyed listener per tracked entity, sensor.happy is only tracked
+    # when no earlier test excluded the sensor domain from groups
+    keyed_listeners = hass.bus.async_keyed_listeners()["state_changed"]
+    keyed_listeners.pop("sensor.happy", None)
+    assert keyed_listeners == {
+        "hello.world": 1,
+        "light.bowl": 1,
+        "test.one": 1,
+        "test.two": 1,
+    }
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["hello.world"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
@@ -476,7 +485,11 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.all_tests",
         "group.hello",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    assert hass.bus.async_keyed_listeners()["state_changed"] == {
+        "light.bowl": 1,
+        "test.one": 1,
+        "test.two": 1,
+    }
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
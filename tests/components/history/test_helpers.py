@@ -0,0 +1,56 @@
+"""Test the history helpers."""
+import pytest
+
+from homeassistant.components.history.helpers import downsample_states
+
+
+def _states(*values: str) -> list[dict[str, str | float]]:
+    """Return compressed states for the values, one per second."""
+    return [{"s": value, "lu": float(idx)} for idx, value in enumerate(values)]
+
+
+def test_downsample_states_keeps_peaks() -> None:
+    """Test numeric buckets keep their lowest and highest state."""
+    states = _states(*(str(idx % 5) for idx in range(41)))
+    downsampled = downsample_states(states, 8)
+    assert len(downsampled) <= 8
+    assert downsampled[0] is states[0]
+    assert downsampled[-1] is states[-1]
+    assert sorted(state["s"] for state in downsampled[1:-1]) == ["0"] * 3 + ["4"] * 3
+
+
+def test_downsample_states_caps_non_numeric_states() -> None:
+    """Test states that are not numeric are limited too."""
+    states = _states(*(("on", "off")[idx % 2] for idx in range(1000)))
+    downsampled = downsample_states(states, 20)
+    assert len(downsampled) <= 20
+    assert {state["s"] for state in downsampled} == {"on", "off"}
+
+
+def test_downsample_states_keeps_gaps() -> None:
+    """Test a bucket with unavailable states keeps the gap and how it ended."""
+    states = _states(*([str(idx) for idx in range(20)] + ["unavailable"] * 20))
+    states.extend(_states(*(str(idx) for idx in range(60)))[40:])
+    downsampled = downsample_states(states, 6)
+    assert [state["s"] for state in downsampled] == [
+        "0",
+        "unavailable",
+        "unavailable",
+        "58",
+        "59",
+    ]
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf", "NaN"])
+def test_downsample_states_nan_is_not_numeric(value: str) -> None:
+    """Test NaN and infinite states are handled as not numeric."""
+    states = _states(*(["1", "2", value, "3"] * 10))
+    downsampled = downsample_states(states, 4)
+    assert len(downsampled) <= 4
+    assert value in {state["s"] for state in downsampled[1:-1]}
+
+
+def test_downsample_states_below_max_points() -> None:
+    """Test states are not downsampled when there are few enough."""
+    states = _states("1", "unavailable", "nan")
+    assert downsample_states(states, 4) is states
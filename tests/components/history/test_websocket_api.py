@@ -1,7 +1,7 @@
 """The tests the History component websocket_api."""
 import asyncio
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import pytest
@@ -401,6 +401,63 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for minute in range(60):
+        with freeze_time(now + timedelta(minutes=minute)):
+            value = "unavailable" if minute == 30 else str(minute % 7)
+            hass.states.async_set("sensor.power", value)
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": (now - timedelta(minutes=1)).isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 12,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    states = response["result"]["sensor.power"]
+    assert len(states) <= 12
+    assert states[0]["s"] == "0"
+    assert states[-1]["s"] == "3"
+    assert {"s": "unavailable", "lu": ANY} in states
+    # The peaks of every bucket are kept
+    assert {state["s"] for state in states[1:-1]} >= {"0", "6", "unavailable"}
+    assert [state["lu"] for state in states] == sorted(state["lu"] for state in states)
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (now - timedelta(minutes=1)).isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 100,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["sensor.power"]) == 60
+
+
 async def test_history_during_period_bad_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -14,12 +14,15 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_STATE_MEMORY,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_START,
+    SERVICE_START_LOG_EVENT_DISPATCH,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_LOG_EVENT_DISPATCH,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
@@ -237,6 +240,93 @@ async def test_log_scheduled(
     await hass.async_block_till_done()
 
 
+async def test_log_state_memory(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test logging the memory used by states per domain."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_STATE_MEMORY)
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 255})
+    hass.states.async_set("light.bedroom", "off")
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_STATE_MEMORY, blocking=True)
+
+    assert "State memory for domain light: 2 states" in caplog.text
+    assert "State memory for domain sensor: 1 states" in caplog.text
+    assert "State memory total: 3 states" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_event_dispatch_logging(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test logging the dispatch statistics of the event bus."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_START_LOG_EVENT_DISPATCH)
+    assert hass.services.has_service(DOMAIN, SERVICE_STOP_LOG_EVENT_DISPATCH)
+
+    hass.bus.async_listen("profiler_test_event", lambda event: None)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_START_LOG_EVENT_DISPATCH,
+        {CONF_SCAN_INTERVAL: 10},
+        blocking=True,
+    )
+    with pytest.raises(HomeAssistantError, match="already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_LOG_EVENT_DISPATCH, {}, blocking=True
+        )
+
+    hass.bus.async_fire("profiler_test_event")
+    hass.bus.async_fire("profiler_test_event")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    assert (
+        "Event dispatch for profiler_test_event: fired 2 times to 2 listeners"
+        in caplog.text
+    )
+    assert hass.bus.async_dispatch_stats()
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_LOG_EVENT_DISPATCH, {}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert hass.bus.async_dispatch_stats() == {}
+
+    caplog.clear()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+    await hass.async_block_till_done()
+    assert "Event dispatch for" not in caplog.text
+
+    with pytest.raises(HomeAssistantError, match="not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_LOG_EVENT_DISPATCH, {}, blocking=True
+        )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
     """Test logging lru stats."""
 
@@ -0,0 +1,125 @@
+"""Test the state attributes table manager."""
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers.state_attributes import HashFilter
+from homeassistant.components.recorder.tasks import LoadStateAttributesHashFilterTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+
+def test_hash_filter() -> None:
+    """Test the hash filter has no false negatives and few false positives."""
+    hash_filter = HashFilter(1000)
+    added = [
+        StateAttributes.hash_shared_attrs_bytes(f'{{"idx":{idx}}}'.encode())
+        for idx in range(1000)
+    ]
+    for hash_ in added:
+        hash_filter.add(hash_)
+
+    assert hash_filter.count == 1000
+    assert all(hash_filter.might_contain(hash_) for hash_ in added)
+    false_positives = sum(
+        hash_filter.might_contain(
+            StateAttributes.hash_shared_attrs_bytes(f'{{"other":{idx}}}'.encode())
+        )
+        for idx in range(10000)
+    )
+    assert false_positives < 100
+
+
+async def test_load_recent_and_hash_filter(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test warming up the cache and skipping lookups of new attributes."""
+    instance = recorder.get_instance(hass)
+    manager = instance.state_attributes_manager
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "kW"})
+    await async_wait_recording_done(hass)
+
+    assert manager._hash_filter is not None
+    known_attrs = '{"unit_of_measurement":"W"}'
+    known_hash = StateAttributes.hash_shared_attrs_bytes(known_attrs.encode())
+    new_attrs = '{"unit_of_measurement":"never seen"}'
+    new_hash = StateAttributes.hash_shared_attrs_bytes(new_attrs.encode())
+    assert manager._hash_filter.might_contain(known_hash)
+
+    def _get_after_reset() -> dict[str, int | None]:
+        manager._id_map.clear()
+        with session_scope(hass=hass, read_only=True) as session:
+            with patch(
+                "homeassistant.components.recorder.table_managers.state_attributes.execute_stmt_lambda_element"
+            ) as execute_stmt:
+                assert manager.get(new_attrs, new_hash, session) is None
+            assert not execute_stmt.called
+            manager.load_recent(session)
+        return {
+            known_attrs: manager.get_from_cache(known_attrs),
+            new_attrs: manager.get_from_cache(new_attrs),
+        }
+
+    results = await instance.async_add_executor_job(_get_after_reset)
+    assert results[known_attrs] is not None
+    assert results[new_attrs] is None
+
+
+async def test_hash_filter_reloaded_when_full(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the hash filter is reloaded once it is over capacity."""
+    instance = recorder.get_instance(hass)
+    manager = instance.state_attributes_manager
+    await async_wait_recording_done(hass)
+    assert manager._hash_filter is not None
+
+    with patch.object(manager._hash_filter, "capacity", 0):
+        hass.states.async_set("sensor.one", "1", {"new": "attributes"})
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert manager._hash_filter is not None
+    assert manager._hash_filter.might_contain(
+        StateAttributes.hash_shared_attrs_bytes(b'{"new":"attributes"}')
+    )
+
+
+async def test_hash_filter_loaded_in_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the hash filter is loaded by a task per chunk."""
+    instance = recorder.get_instance(hass)
+    manager = instance.state_attributes_manager
+    for idx in range(3):
+        hass.states.async_set(f"sensor.{idx}", "1", {"idx": idx})
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.table_managers.state_attributes.HASH_FILTER_CHUNK_SIZE",
+        1,
+    ), patch.object(
+        manager, "load_hash_filter", wraps=manager.load_hash_filter
+    ) as load_hash_filter:
+        instance.queue_task(LoadStateAttributesHashFilterTask())
+        await async_wait_recording_done(hass)
+        # Each chunk queues the task of the next chunk
+        for _ in range(3):
+            await async_wait_recording_done(hass)
+
+    assert [call.args[1] is None for call in load_hash_filter.call_args_list] == [
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert manager._loading_hash_filter is None
+    assert manager._hash_filter is not None
+    for idx in range(3):
+        assert manager._hash_filter.might_contain(
+            StateAttributes.hash_shared_attrs_bytes(f'{{"idx":{idx}}}'.encode())
+        )
@@ -22,6 +22,10 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.history import legacy
+from homeassistant.components.recorder.history.cache import (
+    ESTIMATED_STATE_SIZE,
+    HistoryCache,
+)
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
@@ -196,6 +200,92 @@ def test_significant_states_with_session_single_entity(
         assert len(states["demo.id"]) == 2
 
 
+def test_get_significant_states_past_window_is_cached(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test results for windows that can no longer change are cached."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    now = dt_util.utcnow()
+    one_hour_ago = now - timedelta(hours=1)
+    with freeze_time(one_hour_ago):
+        hass.states.set("demo.id", "any", {"attr": True})
+        wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.history.modern.execute_stmt_lambda_element",
+        wraps=history.modern.execute_stmt_lambda_element,
+    ) as execute_stmt:
+        states = history.get_significant_states(
+            hass,
+            now - timedelta(days=1),
+            one_hour_ago + timedelta(minutes=1),
+            ["demo.id"],
+        )
+        assert len(states["demo.id"]) == 1
+        assert execute_stmt.call_count == 1
+
+        # Mutating the result does not affect the cache
+        states["demo.id"].clear()
+        states = history.get_significant_states(
+            hass,
+            now - timedelta(days=1),
+            one_hour_ago + timedelta(minutes=1),
+            ["demo.id"],
+        )
+        assert len(states["demo.id"]) == 1
+        assert execute_stmt.call_count == 1
+        assert len(instance.history_cache) == 1
+
+        # Windows that end recently are not cached
+        for _ in range(2):
+            states = history.get_significant_states(
+                hass, now - timedelta(days=1), now, ["demo.id"]
+            )
+            assert len(states["demo.id"]) == 1
+        assert execute_stmt.call_count == 3
+        assert len(instance.history_cache) == 1
+
+        hass.services.call(recorder.DOMAIN, "purge", {"keep_days": 0})
+        hass.block_till_done()
+        wait_recording_done(hass)
+        assert len(instance.history_cache) == 0
+
+        states = history.get_significant_states(
+            hass,
+            now - timedelta(days=1),
+            one_hour_ago + timedelta(minutes=1),
+            ["demo.id"],
+        )
+        assert states == {}
+
+
+def test_history_cache_evicts_by_size() -> None:
+    """Test the history cache evicts the least recently used results."""
+    cache = HistoryCache(max_size=3 * ESTIMATED_STATE_SIZE)
+    state = State("demo.id", "on")
+    key_1 = (("demo.id",), 1.0, 2.0, True, True, False, False, False)
+    key_2 = (("demo.id",), 2.0, 3.0, True, True, False, False, False)
+    key_3 = (("demo.id",), 3.0, 4.0, True, True, False, False, False)
+
+    cache.put(key_1, cache.generation, {"demo.id": [state]})
+    cache.put(key_2, cache.generation, {"demo.id": [state, state]})
+    assert cache.size == 3 * ESTIMATED_STATE_SIZE
+    assert cache.get(key_1) == {"demo.id": [state]}
+
+    cache.put(key_3, cache.generation, {"demo.id": [state]})
+    assert cache.get(key_2) is None
+    assert cache.get(key_1) is not None
+    assert cache.get(key_3) is not None
+
+    # Results of queries that started before an invalidation are not stored
+    generation = cache.generation
+    cache.clear()
+    cache.put(key_1, generation, {"demo.id": [state]})
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
 @pytest.mark.parametrize(
     ("attributes", "no_attributes", "limit"),
     [
@@ -113,6 +113,7 @@ def _default_recorder(hass):
         auto_purge=True,
         auto_repack=True,
         keep_days=7,
+        purge_time_budget=5,
         commit_interval=1,
         uri="sqlite://",
         db_max_retries=10,
@@ -342,6 +343,44 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_backlog_in_batches(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a backlog of events is written in batches."""
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    await async_block_recorder(hass, 0.1)
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as shared_attrs_bytes_from_event, patch.object(
+        recorder_mock, "_pre_process_tasks", wraps=recorder_mock._pre_process_tasks
+    ) as pre_process_tasks:
+        for idx in range(10):
+            hass.states.async_set(f"test.recorder_{idx}", "on", attributes)
+            hass.states.async_set(f"test.recorder_{idx}", "off", {"idx": idx})
+        hass.bus.async_fire("test_event", {"idx": 1})
+        await async_wait_recording_done(hass)
+
+    assert pre_process_tasks.called
+    # Each state is only serialized once even though the
+    # attributes were loaded for the whole batch up front
+    assert shared_attrs_bytes_from_event.call_count == 20
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 20
+        assert session.query(StateAttributes).count() == 11
+        assert (
+            session.query(Events)
+            .join(EventTypes)
+            .filter(EventTypes.event_type == "test_event")
+            .count()
+            == 1
+        )
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -0,0 +1,264 @@
+"""Test dropping expired partitions."""
+from contextlib import contextmanager
+from datetime import timedelta
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from freezegun import freeze_time
+import pytest
+from sqlalchemy import text
+
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.db_schema import Events, States
+from homeassistant.components.recorder.partition import (
+    RangePartition,
+    _parse_postgresql_upper_bound,
+    find_expired_partitions,
+    purge_expired_partitions,
+)
+from homeassistant.components.recorder.purge import (
+    PurgeDeadline,
+    PurgeProgress,
+    purge_old_data,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.mark.parametrize(
+    ("bound", "expected"),
+    [
+        ("FOR VALUES FROM ('1693526400') TO ('1693612800')", 1693612800.0),
+        ("FOR VALUES FROM (MINVALUE) TO ('1693612800.5')", 1693612800.5),
+        ("FOR VALUES FROM ('1693612800') TO (MAXVALUE)", None),
+        ("DEFAULT", None),
+    ],
+)
+def test_parse_postgresql_upper_bound(bound: str, expected: float | None) -> None:
+    """Test parsing the upper bound of PostgreSQL partitions."""
+    assert _parse_postgresql_upper_bound(bound) == expected
+
+
+def test_find_expired_partitions_postgresql() -> None:
+    """Test finding expired partitions on PostgreSQL."""
+
+    def _execute(statement, params):
+        if "pg_get_partkeydef" in str(statement):
+            return MagicMock(
+                scalar=MagicMock(
+                    return_value={
+                        "states": None,
+                        "events": "RANGE (time_fired_ts)",
+                        "statistics_short_term": "RANGE (start_ts)",
+                    }[params["table"]]
+                )
+            )
+        if params["table"] == "events":
+            return [
+                ("events_1", "FOR VALUES FROM ('100') TO ('200')"),
+                ("events_0", "FOR VALUES FROM (MINVALUE) TO ('100')"),
+                ("events_default", "DEFAULT"),
+            ]
+        return [("statistics_short_term_0", "FOR VALUES FROM ('0') TO ('300')")]
+
+    session = MagicMock(execute=_execute)
+    assert find_expired_partitions(session, SupportedDialect.POSTGRESQL, 200) == [
+        RangePartition("events", "events_0", 100),
+        RangePartition("events", "events_1", 200),
+    ]
+
+
+@pytest.mark.parametrize(
+    "dialect_name", [SupportedDialect.SQLITE, SupportedDialect.MYSQL]
+)
+def test_find_expired_partitions_unsupported(dialect_name: SupportedDialect) -> None:
+    """Test partitions are only supported on PostgreSQL."""
+    session = MagicMock()
+    assert find_expired_partitions(session, dialect_name, 200) == []
+    session.execute.assert_not_called()
+
+
+async def _add_states_and_events(hass: HomeAssistant, days_ago: list[int]) -> None:
+    """Add a state and an event for each of the days ago."""
+    utcnow = dt_util.utcnow()
+    for days in days_ago:
+        with freeze_time(utcnow - timedelta(days=days)):
+            hass.states.async_set("test.partition", f"day_{days}", {"days": days})
+            hass.bus.async_fire("test_partition", {"days": days})
+            await async_wait_recording_done(hass)
+
+
+@contextmanager
+def _patch_partitions(partitions: dict[str, list[RangePartition]]):
+    """Emulate range partitions on the timestamp columns of SQLite tables.
+
+    The rows of a partition are the rows of its table below the upper
+    bound, so the statements run against the rows of a real database.
+    """
+    columns = {
+        "states": "last_updated_ts",
+        "events": "time_fired_ts",
+        "statistics_short_term": "start_ts",
+    }
+
+    def _partition_rows(session, partition):
+        return (
+            f"(SELECT * FROM {partition.table}"  # noqa: S608
+            f" WHERE {columns[partition.table]} < {partition.upper_bound}) rows"
+        )
+
+    def _drop_partition(session, partition):
+        session.execute(
+            text(
+                f"DELETE FROM {partition.table}"  # noqa: S608
+                f" WHERE {columns[partition.table]} < {partition.upper_bound}"
+            )
+        )
+
+    with patch(
+        "homeassistant.components.recorder.core.Recorder.dialect_name",
+        new_callable=PropertyMock,
+        return_value=SupportedDialect.POSTGRESQL,
+    ), patch(
+        "homeassistant.components.recorder.partition._find_postgresql_partitions",
+        side_effect=lambda session, table: partitions.get(table, []),
+    ) as find_partitions, patch(
+        "homeassistant.components.recorder.partition._partition_rows",
+        side_effect=_partition_rows,
+    ), patch(
+        "homeassistant.components.recorder.partition._drop_partition",
+        side_effect=_drop_partition,
+    ):
+        yield find_partitions
+
+
+async def test_purge_expired_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test dropping expired partitions unlinks the states that are kept."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_states_and_events(hass, [11, 5, 0])
+    utcnow = dt_util.utcnow()
+    ten_days_ago = (utcnow - timedelta(days=10)).timestamp()
+    four_days_ago = (utcnow - timedelta(days=4)).timestamp()
+
+    with session_scope(hass=hass) as session:
+        attributes_ids = {
+            state.attributes_id
+            for state in session.query(States).filter(
+                States.last_updated_ts < four_days_ago
+            )
+        }
+        data_ids = {
+            event.data_id
+            for event in session.query(Events).filter(
+                Events.time_fired_ts < four_days_ago
+            )
+        }
+    assert len(attributes_ids) == 2
+    assert len(data_ids) == 2
+
+    progress = PurgeProgress(dt_util.utc_from_timestamp(four_days_ago))
+    with _patch_partitions(
+        {
+            "states": [
+                RangePartition("states", "states_0", ten_days_ago),
+                RangePartition("states", "states_1", four_days_ago),
+            ],
+            "events": [RangePartition("events", "events_0", four_days_ago)],
+        }
+    ), session_scope(hass=hass) as session:
+        assert purge_expired_partitions(
+            instance, session, four_days_ago, progress, PurgeDeadline(30)
+        ) == (attributes_ids, data_ids)
+
+    assert progress.expired_partitions == []
+    assert progress.states_purged == 2
+    assert progress.events_purged == 2
+    with session_scope(hass=hass) as session:
+        states = session.query(States).all()
+        assert [state.state for state in states] == ["day_0"]
+        # The state linked to a dropped state no longer references it
+        assert states[0].old_state_id is None
+        assert (
+            not session.query(Events)
+            .filter(Events.time_fired_ts < four_days_ago)
+            .count()
+        )
+
+
+async def test_purge_expired_partitions_time_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test dropping partitions is spread over runs by the time budget."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.purge_time_budget = 0.000001
+    await _add_states_and_events(hass, [11, 5, 0])
+    utcnow = dt_util.utcnow()
+    purge_before = utcnow - timedelta(days=4)
+    ten_days_ago = (utcnow - timedelta(days=10)).timestamp()
+
+    with _patch_partitions(
+        {
+            "states": [
+                RangePartition("states", "states_0", ten_days_ago),
+                RangePartition("states", "states_1", purge_before.timestamp()),
+            ],
+        }
+    ) as find_partitions, session_scope(hass=hass) as session:
+        states = session.query(States)
+
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert [state.state for state in states] == ["day_5", "day_0"]
+        assert instance.purge_progress.expired_partitions == [
+            RangePartition("states", "states_1", purge_before.timestamp())
+        ]
+
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert [state.state for state in states] == ["day_0"]
+        assert instance.purge_progress.expired_partitions == []
+
+        while not purge_old_data(instance, purge_before, repack=False):
+            pass
+
+    # The catalog is only queried once for every table during a purge
+    assert len(find_partitions.mock_calls) == 3
+    assert instance.purge_progress.states_purged == 2
+
+
+async def test_purge_old_data_drops_expired_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purge drops expired partitions before deleting rows in batches."""
+    instance = await async_setup_recorder_instance(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_expired_partitions",
+        return_value=(set(), set()),
+    ) as purge_expired_partitions:
+        assert purge_old_data(instance, purge_before, repack=False)
+    purge_expired_partitions.assert_not_called()
+
+    with patch(
+        "homeassistant.components.recorder.core.Recorder.dialect_name",
+        new_callable=PropertyMock,
+        return_value=SupportedDialect.POSTGRESQL,
+    ), patch(
+        "homeassistant.components.recorder.purge.purge_expired_partitions",
+        return_value=({1, 2}, {3}),
+    ) as purge_expired_partitions, patch(
+        "homeassistant.components.recorder.purge._purge_unused_attributes_ids"
+    ) as purge_unused_attributes_ids, patch(
+        "homeassistant.components.recorder.purge._purge_unused_data_ids"
+    ) as purge_unused_data_ids:
+        assert purge_old_data(instance, purge_before, repack=False)
+
+    assert len(purge_expired_partitions.mock_calls) == 1
+    assert purge_expired_partitions.mock_calls[0].args[2] == purge_before.timestamp()
+    assert purge_unused_attributes_ids.mock_calls[0].args[2] == {1, 2}
+    assert purge_unused_data_ids.mock_calls[0].args[2] == {3}
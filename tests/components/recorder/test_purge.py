@@ -159,6 +159,75 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_with_time_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purge stops selecting batches when the time budget is used up."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.purge_time_budget = 0.000001
+
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 6
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 2
+
+        progress = instance.purge_progress
+        assert progress.purge_before == purge_before
+        assert progress.runs == 1
+        assert progress.states_purged == 4
+        assert progress.end_time is None
+        assert progress.as_dict()["in_progress"] is True
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert states.count() == 2
+
+        assert instance.purge_progress is progress
+        assert progress.runs == 2
+        assert progress.states_purged == 4
+        assert progress.end_time is not None
+        assert progress.as_dict()["in_progress"] is False
+
+        # A new purge starts tracking its own progress
+        purge_before = dt_util.utcnow()
+        purge_old_data(instance, purge_before, repack=False)
+        assert instance.purge_progress is not progress
+        assert instance.purge_progress.states_purged == 2
+
+
+async def test_purge_time_budget_covers_statistics(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the time budget is checked before the statistics are purged."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.purge_time_budget = 0.000001
+
+    await _add_test_states(hass)
+    await _add_test_statistics(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        statistics = session.query(StatisticsShortTerm)
+
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert states.count() == 2
+        assert statistics.count() == 6
+
+        # Nothing was left to purge before the statistics
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert statistics.count() == 2
+
+        assert purge_old_data(instance, purge_before, repack=False)
+        assert instance.purge_progress.runs == 3
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -27,6 +27,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recording_done,
     create_engine_test,
     do_adhoc_statistics,
@@ -2138,6 +2139,38 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of a purge."""
+    client = await hass_ws_client()
+
+    await client.send_json({"id": 1, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    await hass.services.async_call(
+        recorder.DOMAIN, "purge", {"keep_days": 0}, blocking=True
+    )
+    await async_wait_purge_done(hass)
+
+    await client.send_json({"id": 2, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "purge_before": ANY,
+        "start_time": ANY,
+        "end_time": ANY,
+        "in_progress": False,
+        "runs": 1,
+        "run_time": ANY,
+        "states_purged": 0,
+        "events_purged": ANY,
+        "rows_per_second": ANY,
+    }
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -556,6 +556,41 @@ async def test_script_blueprint(hass):
     }
 
 
+async def test_graph_follows_changes(hass: HomeAssistant) -> None:
+    """Test the search graph is updated when the references change."""
+    assert await async_setup_component(
+        hass, "group", {"group": {"lights": {"entities": ["light.one"]}}}
+    )
+    await hass.async_block_till_done()
+
+    device_reg = dr.async_get(hass)
+    entity_reg = er.async_get(hass)
+
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.one") == {
+        "group": {"group.lights"},
+    }
+
+    await hass.services.async_call(
+        "group",
+        "set",
+        {"object_id": "lights", "entities": ["light.two"]},
+        blocking=True,
+    )
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.one") == {}
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.two") == {
+        "group": {"group.lights"},
+    }
+
+    await hass.services.async_call(
+        "group", "remove", {"object_id": "lights"}, blocking=True
+    )
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.two") == {}
+
+
 async def test_ws_api(hass: HomeAssistant, hass_ws_client: WebSocketGenerator) -> None:
     """Test WS API."""
     assert await async_setup_component(hass, "search", {})
@@ -0,0 +1,58 @@
+"""Test template diagnostics."""
+from unittest.mock import ANY
+
+from homeassistant.components import template
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test diagnostics include the render statistics of templates."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    state_template = "{{ states('sensor.one') | float + 1 }}"
+    template_config_entry = MockConfigEntry(
+        data={},
+        domain=template.DOMAIN,
+        options={
+            "name": "My template",
+            "state": state_template,
+            "template_type": "sensor",
+        },
+        title="My template",
+    )
+    template_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(template_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "3")
+    hass.states.async_set("sensor.two", "4")
+    await hass.async_block_till_done()
+
+    template_stats = {
+        "template": state_template,
+        "renders": 3,
+        "total_time": ANY,
+        "average_time": ANY,
+        "p99_time": ANY,
+        "triggers": 1,
+        "fan_in": 1,
+        "listeners": {"all": False, "domains": [], "entities": ["sensor.one"]},
+        "rate_limit": None,
+    }
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, template_config_entry
+    )
+    assert diagnostics == {
+        "options": {
+            "name": "My template",
+            "state": state_template,
+            "template_type": "sensor",
+        },
+        "templates": [template_stats],
+    }
@@ -22,6 +22,7 @@ from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.startup_trace import async_start_trace
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 from homeassistant.util.json import json_loads
@@ -2106,6 +2107,94 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_trace(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test getting the startup trace."""
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    trace = async_start_trace(hass)
+    trace.async_add_span("august", "setup", 0.0, 0.0)
+    await websocket_client.send_json({"id": 8, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == trace.async_as_chrome_trace()
+    assert len(msg["result"]["traceEvents"]) == 3
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 9, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_template_render_stats(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test getting the render statistics of tracked templates."""
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("sensor.one", "1")
+
+    for msg_id, template_str in (
+        (5, "{{ states('sensor.one') }}"),
+        (6, "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}"),
+    ):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "render_template", "template": template_str}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "event"
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "template/render_stats", "order_by": "fan_in", "limit": 1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "template": (
+                "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}"
+            ),
+            "renders": 2,
+            "total_time": ANY,
+            "average_time": ANY,
+            "p99_time": ANY,
+            "triggers": 0,
+            "fan_in": 2,
+            "listeners": {"all": False, "domains": ["light"], "entities": []},
+            "rate_limit": 1.0,
+        }
+    ]
+
+    hass.states.async_set("sensor.one", "2")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "template/render_stats", "order_by": "renders"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert [stats["template"] for stats in msg["result"]] == [
+        "{{ states('sensor.one') }}",
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+    ]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 9, "type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -14,8 +15,11 @@ from homeassistant.components.websocket_api import (
     websocket_command,
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.websocket_api.messages import EntityStateMessage
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -431,6 +435,147 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_deflate(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test enabling deflate sends compressed binary messages."""
+    websocket_client = await hass_ws_client(hass)
+
+    async def _receive_deflated() -> Any:
+        msg = await websocket_client.receive()
+        assert msg.type == WSMsgType.BINARY
+        return json_loads(zlib.decompress(msg.data, -zlib.MAX_WBITS))
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_DEFLATE_MESSAGES: 1,
+            },
+        }
+    )
+    # The result is already deflated
+    msg = await _receive_deflated()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    hass.states.async_set("light.kitchen", "on", {"description": "x" * 1000})
+    await websocket_client.send_json({"id": 2, "type": "subscribe_entities"})
+    msgs = await _receive_deflated()
+    if not isinstance(msgs, list):
+        msgs = [msgs, await _receive_deflated()]
+    assert msgs[0] == {"id": 2, "type": "result", "success": True, "result": None}
+    assert msgs[1]["event"]["a"]["light.kitchen"]["s"] == "on"
+
+    await websocket_client.send_json({"id": 3, "type": "subscribe_entities"})
+    msgs = await _receive_deflated()
+    if not isinstance(msgs, list):
+        msgs = [msgs, await _receive_deflated()]
+    assert msgs[0]["id"] == 3
+
+    hass.states.async_set("light.kitchen", "off", {"description": "y" * 1000})
+    await hass.async_block_till_done()
+    msgs = await _receive_deflated()
+    if not isinstance(msgs, list):
+        msgs = [msgs, await _receive_deflated()]
+    assert {msg["id"] for msg in msgs} == {2, 3}
+    state = hass.states.get("light.kitchen")
+    for msg in msgs:
+        assert msg["event"]["c"]["light.kitchen"]["+"] == {
+            "s": "off",
+            "a": {"description": "y" * 1000},
+            "c": state.context.id,
+            "lc": state.last_changed.timestamp(),
+        }
+
+
+async def test_pending_entity_messages_coalesce(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test queued state changes are replaced by the latest state."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hallway", "off")
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+    assert (await websocket_client.receive_json())["success"] is True
+    await websocket_client.receive_json()
+
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE", 0):
+        # No chance for the writer to run in between
+        hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+        hass.states.async_set("light.hallway", "on")
+        hass.states.async_set("light.kitchen", "on", {"color": "red"})
+        hass.states.async_remove("light.hallway")
+        hass.states.async_set("light.kitchen", "off", {"color": "blue"})
+
+    kitchen = hass.states.get("light.kitchen")
+    msg = await websocket_client.receive_json()
+    assert msg == {
+        "id": 5,
+        "type": "event",
+        "event": {
+            "a": {
+                "light.kitchen": {
+                    "s": "off",
+                    "a": {"color": "blue"},
+                    "c": kitchen.context.id,
+                    "lc": kitchen.last_changed.timestamp(),
+                }
+            }
+        },
+    }
+    msg = await websocket_client.receive_json()
+    assert msg == {"id": 5, "type": "event", "event": {"r": ["light.hallway"]}}
+
+    # Not falling behind anymore
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+
+
+async def test_rejected_entity_message_not_pending(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a state change over the pending limit is not kept for coalescing."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    hass.states.async_set("light.kitchen", "on")
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": "light.kitchen",
+            "old_state": None,
+            "new_state": hass.states.get("light.kitchen"),
+        },
+    )
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE", 0
+    ), patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 0):
+        instance._send_message(EntityStateMessage(5, event, "state"))
+
+    assert instance._pending_entity_messages == {}
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.close
+    assert "Client unable to keep up with pending messages" in caplog.text
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -3,8 +3,14 @@ import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
+    _deflated_state_diff_message as lru_deflated_state_diff_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_message,
+    deflate_segment,
+    deflated_event_message,
+    deflated_state_diff_message,
+    inflate_segment,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -51,6 +57,37 @@ async def test_cached_event_message(hass: HomeAssistant) -> None:
     assert cache_info.currsize == 2
 
 
+async def test_deflated_messages(hass: HomeAssistant) -> None:
+    """Test deflated messages match the JSON messages and are compressed once."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on", {"description": "x" * 500})
+    hass.states.async_set("light.window", "off", {"description": "y" * 500})
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    lru_deflated_state_diff_cache.cache_clear()
+
+    for event in events:
+        for iden in (2, 3):
+            assert inflate_segment(
+                deflated_event_message(iden, event)
+            ) == cached_event_message(iden, event)
+            assert inflate_segment(
+                deflated_state_diff_message(iden, event)
+            ) == cached_state_diff_message(iden, event)
+        assert len(deflated_event_message(2, event)) < len(
+            cached_event_message(2, event)
+        )
+
+    cache_info = lru_deflated_state_diff_cache.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 2
+
+    # Segments can be concatenated
+    segments = [deflate_segment("["), deflate_segment("z" * 1000)]
+    segments.append(deflate_segment("]"))
+    assert inflate_segment(b"".join(segments)) == f"[{'z' * 1000}]"
+
+
 async def test_cached_event_message_with_different_idens(hass: HomeAssistant) -> None:
     """Test that we cache event messages when the subscrition idens differ."""
 
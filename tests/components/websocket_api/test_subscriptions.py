@@ -0,0 +1,89 @@
+"""Test Websocket API subscriptions module."""
+from homeassistant.components.websocket_api.subscriptions import (
+    async_get_entity_subscription_hub,
+)
+from homeassistant.core import HomeAssistant
+
+from tests.typing import WebSocketGenerator
+
+
+async def test_entity_subscriptions_share_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscriptions with the same id and filter share their messages."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hallway", "on")
+    clients = [await hass_ws_client(hass) for _ in range(3)]
+    for client, msg in zip(
+        clients,
+        (
+            {"id": 5, "type": "subscribe_entities"},
+            {"id": 5, "type": "subscribe_entities"},
+            {"id": 5, "type": "subscribe_entities", "entity_ids": ["light.hallway"]},
+        ),
+    ):
+        await client.send_json(msg)
+        assert (await client.receive_json())["success"] is True
+        assert (await client.receive_json())["type"] == "event"
+
+    hub = async_get_entity_subscription_hub(hass)
+    assert hub.async_stats() | {"total_time": 0.0, "average_time": 0.0} == {
+        "groups": 2,
+        "subscriptions": 3,
+        "events": 0,
+        "messages_built": 0,
+        "messages_sent": 0,
+        "total_time": 0.0,
+        "average_time": 0.0,
+    }
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hallway", "off")
+    await hass.async_block_till_done()
+    for client in clients[:2]:
+        msg = await client.receive_json()
+        assert msg["id"] == 5
+        assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
+    for client in clients:
+        msg = await client.receive_json()
+        assert msg["id"] == 5
+        assert msg["event"]["c"]["light.hallway"]["+"]["s"] == "off"
+
+    stats = hub.async_stats()
+    assert stats["events"] == 2
+    # Built once for each group that wants the change
+    assert stats["messages_built"] == 3
+    assert stats["messages_sent"] == 5
+
+    await clients[2].send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    assert (await clients[2].receive_json())["success"] is True
+    assert hub.async_stats()["groups"] == 1
+
+    for client in clients[:2]:
+        await client.close()
+    await hass.async_block_till_done()
+    assert hub.async_stats()["subscriptions"] == 0
+    assert hub._unsub is None
+
+
+async def test_subscribe_entities_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the subscribe entities stats command."""
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "subscribe_entities"})
+    assert (await client.receive_json())["success"] is True
+    await client.receive_json()
+    hass.states.async_set("light.kitchen", "on")
+    await client.receive_json()
+
+    await client.send_json({"id": 6, "type": "subscribe_entities/stats"})
+    msg = await client.receive_json()
+    assert msg["success"] is True
+    assert msg["result"]["groups"] == 1
+    assert msg["result"]["subscriptions"] == 1
+    assert msg["result"]["events"] == 1
+    assert msg["result"]["messages_sent"] == 1
+    assert msg["result"]["average_time"] == msg["result"]["total_time"]
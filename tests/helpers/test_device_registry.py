@@ -709,6 +709,56 @@ async def test_removing_area_id(
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_config_entry_and_area(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test looking up devices by config entry and area."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+
+    device_1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id, identifiers={("bridgeid", "0123")}
+    )
+    device_2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id, identifiers={("bridgeid", "4567")}
+    )
+    device_2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id, identifiers={("bridgeid", "4567")}
+    )
+    device_1 = device_registry.async_update_device(device_1.id, area_id="kitchen")
+
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [device_1, device_2]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [device_2]
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [device_1]
+
+    device_registry.async_clear_area_id("kitchen")
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+
+    device_registry.async_remove_device(device_2.id)
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_2.entry_id)
+        == []
+    )
+    assert device_registry.deleted_devices.get_entries_for_config_entry_id(
+        config_entry_2.entry_id
+    ) == [device_registry.deleted_devices[device_2.id]]
+
+    device_registry.async_clear_config_entry(config_entry_2.entry_id)
+    assert (
+        device_registry.deleted_devices.get_entries_for_config_entry_id(
+            config_entry_2.entry_id
+        )
+        == []
+    )
+    assert device_registry.deleted_devices[device_2.id].orphaned_timestamp is None
+
+
 async def test_specifying_via_device_create(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
@@ -15,6 +15,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -28,6 +29,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_capture_events,
     get_test_home_assistant,
     mock_registry,
 )
@@ -649,6 +651,62 @@ async def test_set_context_expired(hass: HomeAssistant) -> None:
     assert ent._context_set is None
 
 
+async def test_batch_state_writes(hass: HomeAssistant) -> None:
+    """Test batching state writes of entities."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.hass = hass
+        ent.entity_id = f"hello.world_{idx}"
+        entities.append(ent)
+
+    with entity.async_batch_state_writes(hass):
+        for ent in entities:
+            ent._attr_state = "first"
+            ent.async_write_ha_state()
+        with entity.async_batch_state_writes(hass):
+            entities[0]._attr_state = "second"
+            entities[0].async_write_ha_state()
+        entities[1]._attr_state = "x" * 256
+        entities[1].async_write_ha_state()
+        assert hass.states.get("hello.world_0") is None
+
+    assert hass.states.get("hello.world_0").state == "second"
+    assert hass.states.get("hello.world_1").state == STATE_UNKNOWN
+    assert hass.states.get("hello.world_2").state == "first"
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in events] == [
+        "hello.world_2",
+        "hello.world_0",
+        "hello.world_1",
+    ]
+    assert entity.DATA_STATE_WRITE_BATCH not in hass.data
+
+
+async def test_batch_state_writes_force_update(hass: HomeAssistant) -> None:
+    """Test batched writes of force_update entities are not coalesced."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_force_update = True
+
+    with entity.async_batch_state_writes(hass):
+        ent._attr_state = "first"
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "first"
+        ent._attr_state = "second"
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "second"
+
+    await hass.async_block_till_done()
+    assert [event.data["new_state"].state for event in events] == [
+        "first",
+        "second",
+    ]
+
+
 async def test_warn_disabled(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
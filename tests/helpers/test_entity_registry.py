@@ -1475,6 +1475,49 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_indexes() -> None:
+    """Test the device, config entry and area indexes of EntityRegistryItems."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="entry",
+        device_id="device",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="entry",
+        device_id="device",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device") == [entry1]
+    assert entities.get_entries_for_device_id("device", True) == [entry1, entry2]
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+
+    # Entries keep their place for the values that did not change
+    entry1 = entities["test.entity1"] = attr.evolve(entry1, area_id="hallway")
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("hallway") == [entry1]
+
+    del entities["test.entity1"]
+    assert entities.get_entries_for_device_id("device", True) == [entry2]
+    assert entities.get_entries_for_area_id("hallway") == []
+    entities.pop("test.entity2")
+    assert entities.get_entries_for_config_entry_id("entry") == []
+    assert not entities._device_id_index
+    assert not entities._config_entry_id_index
+    assert not entities._area_id_index
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
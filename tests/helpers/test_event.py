@@ -2906,6 +2906,50 @@ async def test_track_template_unavailable_states_has_default_rate_limit(
     info.async_remove()
 
 
+async def test_track_template_states_selected_by_domain(
+    hass: HomeAssistant,
+) -> None:
+    """Test template selecting states by domain does not listen for all states."""
+    hass.states.async_set("light.one", "on")
+    template_refresh = Template(
+        "{{ states | selectattr('domain', 'eq', 'light') | selectattr('state', 'eq', 'on') | list | count }}",
+        hass,
+    )
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_refresh, None, timedelta(seconds=0))],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    info.async_refresh()
+    await hass.async_block_till_done()
+
+    assert info.listeners == {
+        "all": False,
+        "domains": {"light"},
+        "entities": set(),
+        "time": False,
+    }
+    assert refresh_runs == [1]
+    hass.states.async_set("switch.one", "on")
+    await hass.async_block_till_done()
+    assert refresh_runs == [1]
+    hass.states.async_set("light.two", "on")
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, 2]
+    info.async_remove()
+
+
 async def test_specifically_referenced_entity_is_not_rate_limited(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,180 @@
+"""Test the import planner."""
+from datetime import timedelta
+import threading
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.import_planner import (
+    STORAGE_KEY,
+    ImportPlanner,
+    import_waves,
+)
+from homeassistant.loader import DATA_COMPONENTS
+from homeassistant.util import dt as dt_util
+
+from tests.common import MockModule, async_fire_time_changed, mock_integration
+
+
+def test_import_waves(hass: HomeAssistant) -> None:
+    """Test integrations are imported after their dependencies."""
+    integrations = [
+        mock_integration(hass, MockModule("comp_c", dependencies=["comp_b"])),
+        mock_integration(hass, MockModule("comp_b", dependencies=["comp_a", "http"])),
+        mock_integration(hass, MockModule("comp_a")),
+        mock_integration(hass, MockModule("comp_d")),
+        mock_integration(hass, MockModule("comp_e", dependencies=["comp_f"])),
+        mock_integration(hass, MockModule("comp_f", dependencies=["comp_e"])),
+    ]
+    assert [
+        sorted(integration.domain for integration in wave)
+        for wave in import_waves(integrations)
+    ] == [["comp_a", "comp_d"], ["comp_b"], ["comp_c"], ["comp_e", "comp_f"]]
+
+
+async def test_import_integrations_and_platforms(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test importing integrations and the platforms of the last start."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "data": {"platforms": ["comp_a.light", "comp_b.sensor", "removed.light"]},
+    }
+    integrations = [
+        mock_integration(hass, MockModule("comp_b", dependencies=["comp_a"])),
+        mock_integration(hass, MockModule("comp_a")),
+    ]
+    imported: list[str] = []
+
+    def _import_module(name: str) -> None:
+        imported.append(name)
+        if name.endswith("comp_b"):
+            raise ImportError("Broken")
+
+    planner = ImportPlanner(hass)
+    await planner.async_load()
+    with patch(
+        "homeassistant.helpers.import_planner.importlib.import_module",
+        side_effect=_import_module,
+    ):
+        await planner.async_start([integrations])
+
+    # Integrations are imported after the dependencies and their platforms
+    assert imported == [
+        "homeassistant.components.comp_a",
+        "homeassistant.components.comp_a.light",
+        "homeassistant.components.comp_b",
+        "homeassistant.components.comp_b.sensor",
+    ]
+
+    hass.data[DATA_COMPONENTS]["comp_a.switch"] = object()
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"] == {"platforms": ["comp_a.switch"]}
+
+
+async def test_import_stages(hass: HomeAssistant) -> None:
+    """Test waiting on a stage only waits for the imports of that stage."""
+    integrations = [
+        mock_integration(hass, MockModule("comp_a")),
+        mock_integration(hass, MockModule("comp_b")),
+    ]
+    release_comp_b = threading.Event()
+
+    def _import_module(name: str) -> None:
+        if name.endswith("comp_b"):
+            release_comp_b.wait(5)
+
+    planner = ImportPlanner(hass)
+    await planner.async_load()
+    with patch(
+        "homeassistant.helpers.import_planner.importlib.import_module",
+        side_effect=_import_module,
+    ):
+        task = planner.async_start([integrations[:1], integrations])
+        assert await planner.async_wait_imported({"comp_a", "unknown"}, 5)
+        assert not task.done()
+        assert not await planner.async_wait_imported({"comp_b"}, 0.01)
+
+        release_comp_b.set()
+        assert await planner.async_wait_imported({"comp_b"}, 5)
+        await task
+
+
+async def test_slow_import_only_holds_back_dependents(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test a slow import only holds back the integrations depending on it."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "data": {"platforms": ["comp_c.light"]},
+    }
+    integrations = [
+        mock_integration(hass, MockModule("comp_a")),
+        mock_integration(hass, MockModule("comp_b", dependencies=["comp_a"])),
+        mock_integration(hass, MockModule("comp_c")),
+    ]
+    release_comp_a = threading.Event()
+    release_platform = threading.Event()
+
+    def _import_module(name: str) -> None:
+        if name.endswith("comp_a"):
+            release_comp_a.wait(5)
+        elif name.endswith("comp_c.light"):
+            release_platform.wait(5)
+
+    planner = ImportPlanner(hass)
+    await planner.async_load()
+    with patch(
+        "homeassistant.helpers.import_planner.importlib.import_module",
+        side_effect=_import_module,
+    ):
+        task = planner.async_start([integrations])
+        # A stage also waits for the platforms of its integrations
+        assert not await planner.async_wait_imported({"comp_c"}, 0.05)
+        release_platform.set()
+        assert await planner.async_wait_imported({"comp_c"}, 5)
+        assert not await planner.async_wait_imported({"comp_b"}, 0.01)
+
+        release_comp_a.set()
+        assert await planner.async_wait_imported({"comp_a", "comp_b"}, 5)
+        await task
+
+
+async def test_custom_integration_requirements_not_installed(
+    hass: HomeAssistant,
+) -> None:
+    """Test custom integrations are only imported once requirements are installed."""
+    integrations = [
+        mock_integration(
+            hass,
+            MockModule("comp_a", requirements=["missing==1.0"]),
+            built_in=False,
+        ),
+        mock_integration(
+            hass,
+            MockModule("comp_b", requirements=["installed==1.0"]),
+            built_in=False,
+        ),
+        mock_integration(hass, MockModule("comp_c", requirements=["missing==1.0"])),
+    ]
+    imported: list[str] = []
+
+    planner = ImportPlanner(hass)
+    await planner.async_load()
+    with patch(
+        "homeassistant.helpers.import_planner.is_installed",
+        side_effect=lambda requirement: requirement == "installed==1.0",
+    ), patch(
+        "homeassistant.helpers.import_planner.importlib.import_module",
+        side_effect=imported.append,
+    ):
+        await planner.async_start([integrations])
+
+    assert sorted(imported) == [
+        "custom_components.comp_b",
+        "homeassistant.components.comp_c",
+    ]
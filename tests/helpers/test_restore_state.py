@@ -5,6 +5,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -16,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_UPDATE_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -346,6 +348,45 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert written_states[1]["state"]["state"] == "off"
 
 
+async def test_dump_unchanged_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states that did not change are dumped as before."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for entity_id in ("input_boolean.b1", "input_boolean.b2"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    hass.states.async_set("input_boolean.b1", "on")
+    hass.states.async_set("input_boolean.b2", "on")
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        first_dump = mock_write_data.mock_calls[0][1][0]
+
+        freezer.tick(timedelta(minutes=15))
+        hass.states.async_set("input_boolean.b2", "off")
+        await data.async_dump_states()
+        second_dump = mock_write_data.mock_calls[1][1][0]
+
+        freezer.tick(LAST_SEEN_UPDATE_INTERVAL)
+        await data.async_dump_states()
+        third_dump = mock_write_data.mock_calls[2][1][0]
+
+    assert second_dump[0] is first_dump[0]
+    assert second_dump[1]["state"]["state"] == "off"
+    assert second_dump[1]["last_seen"] > first_dump[1]["last_seen"]
+    # The last seen time of unchanged states is updated once a day
+    assert third_dump[0]["last_seen"] == dt_util.utcnow()
+    assert third_dump[1]["last_seen"] == dt_util.utcnow()
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
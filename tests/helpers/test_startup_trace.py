@@ -0,0 +1,98 @@
+"""Test the startup trace."""
+import asyncio
+import time
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigFlow
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.startup_trace import (
+    DATA_STARTUP_TRACE,
+    LOOP_BLOCKED_THRESHOLD,
+    async_get_trace,
+    async_start_trace,
+)
+from homeassistant.setup import async_setup_component
+
+from tests.common import (
+    MockConfigEntry,
+    MockEntity,
+    MockModule,
+    MockPlatform,
+    mock_config_flow,
+    mock_integration,
+    mock_platform,
+)
+
+
+async def test_startup_trace(hass: HomeAssistant) -> None:
+    """Test tracing the setup of integrations."""
+    assert async_get_trace(hass) is None
+    trace = async_start_trace(hass)
+    assert async_get_trace(hass) is trace
+
+    async def async_setup_entry(hass, entry):
+        await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+        return True
+
+    async def async_setup_entry_platform(hass, entry, async_add_entities):
+        async_add_entities([MockEntity(name="Test")])
+
+    mock_integration(hass, MockModule("comp", async_setup_entry=async_setup_entry))
+    mock_platform(
+        hass,
+        "comp.sensor",
+        MockPlatform(async_setup_entry=async_setup_entry_platform),
+    )
+    mock_platform(hass, "comp.config_flow", None)
+    entry = MockConfigEntry(domain="comp", title="My comp")
+    entry.add_to_hass(hass)
+    with mock_config_flow("comp", ConfigFlow):
+        assert await async_setup_component(hass, "comp", {})
+        await hass.async_block_till_done()
+
+    trace.async_start_loop_monitor()
+    monotonic = time.monotonic
+    # The check is late as if the event loop was blocked
+    with patch(
+        "homeassistant.helpers.startup_trace.time.monotonic",
+        side_effect=lambda: monotonic() + LOOP_BLOCKED_THRESHOLD * 2,
+    ):
+        await asyncio.sleep(0.1)
+    assert trace.loop_blocked_time >= LOOP_BLOCKED_THRESHOLD
+
+    with patch("homeassistant.helpers.startup_trace.save_json") as mock_save_json:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+    assert async_get_trace(hass) is None
+    assert hass.data[DATA_STARTUP_TRACE] is trace
+    assert mock_save_json.call_args[0][0] == hass.config.path("startup_trace.json")
+    chrome_trace = mock_save_json.call_args[0][1]
+    assert chrome_trace == trace.async_as_chrome_trace()
+
+    tracks = {
+        event["tid"]: event["args"]["name"]
+        for event in chrome_trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert sorted(tracks.values()) == ["bootstrap", "comp", "sensor"]
+    events = {
+        (tracks[event["tid"]], event["cat"], event["name"])
+        for event in chrome_trace["traceEvents"]
+        if event["ph"] != "M"
+    }
+    assert events == {
+        ("comp", "requirements", "requirements"),
+        ("comp", "import", "import"),
+        ("comp", "setup", "comp"),
+        ("comp", "setup_entry", "My comp"),
+        ("comp", "platform", "sensor.comp"),
+        ("comp", "first_state", "sensor.comp"),
+        ("sensor", "requirements", "requirements"),
+        ("sensor", "import", "import"),
+        ("sensor", "setup", "sensor"),
+        ("bootstrap", "loop_blocked", "loop_blocked"),
+        ("bootstrap", "started", "started"),
+    }
+    assert chrome_trace["otherData"] == {"loop_blocked_time": trace.loop_blocked_time}
@@ -2,7 +2,9 @@
 import asyncio
 from datetime import timedelta
 import json
+from operator import itemgetter
 import os
+import threading
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -16,6 +18,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -733,3 +736,255 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_journaled_store(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test changes are appended to the journal and compacted into the data file."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    def journaled_store() -> storage.Store:
+        return storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key=itemgetter("id"))
+
+    def read_file(path: str) -> str | None:
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as fdesc:
+            return fdesc.read()
+
+    store = journaled_store()
+    items = [{"id": str(idx), "value": "x" * 100} for idx in range(10)]
+    await store.async_save({"items": items, "count": 10})
+    data_file = await hass.async_add_executor_job(read_file, store.path)
+    assert await hass.async_add_executor_job(read_file, store.journal_path) is None
+
+    items[1] = {"id": "1", "value": "changed"}
+    del items[2]
+    items.append({"id": "10", "value": "new"})
+    await store.async_save({"items": items, "count": 10})
+    # Saving the same data does not append to the journal
+    await store.async_save({"items": items, "count": 10})
+    assert await hass.async_add_executor_job(read_file, store.path) == data_file
+    journal = (
+        await hass.async_add_executor_job(read_file, store.journal_path)
+    ).splitlines()
+    assert len(journal) == 2
+    assert json.loads(journal[1]) == [
+        {"l": "items", "i": "1", "v": {"id": "1", "value": "changed"}},
+        {"l": "items", "i": "10", "v": {"id": "10", "value": "new"}},
+        {"l": "items", "i": "2"},
+    ]
+
+    store = journaled_store()
+    assert await store.async_load() == {"items": items, "count": 10}
+    await store.async_save({"items": items, "count": 11})
+    journal = (
+        await hass.async_add_executor_job(read_file, store.journal_path)
+    ).splitlines()
+    assert json.loads(journal[-1]) == [{"n": "count", "v": 11}]
+
+    # An incomplete write at the end of the journal is ignored
+    def append_incomplete_write() -> None:
+        with open(store.journal_path, "a", encoding="utf-8") as fdesc:
+            fdesc.write('[{"n": "count", "v": 1')
+
+    await hass.async_add_executor_job(append_incomplete_write)
+    store = journaled_store()
+    assert await store.async_load() == {"items": items, "count": 11}
+    assert "incomplete write at the end of the journal of storage-test" in caplog.text
+
+    # The next save compacts the journal into the data file
+    await store.async_save({"items": items, "count": 11})
+    assert await hass.async_add_executor_job(read_file, store.journal_path) is None
+    assert json.loads(await hass.async_add_executor_job(read_file, store.path))[
+        "data"
+    ] == {"items": items, "count": 11}
+
+    items.append({"id": "11", "value": "x" * 1000})
+    await store.async_save({"items": items, "count": 12})
+    assert await hass.async_add_executor_job(read_file, store.journal_path) is None
+    store = journaled_store()
+    assert await store.async_load() == {"items": items, "count": 12}
+
+    # The journal is not compacted while stopping
+    hass.state = CoreState.stopping
+    items.append({"id": "12", "value": "x" * 2000})
+    await store.async_save({"items": items, "count": 13})
+    await store._async_handle_write_data()
+    assert await hass.async_add_executor_job(read_file, store.journal_path)
+    hass.state = CoreState.running
+
+    await store.async_remove()
+    assert await hass.async_add_executor_job(read_file, store.path) is None
+    await hass.async_stop(force=True)
+
+
+async def test_journaled_store_default_encoder(tmpdir: py.path.local) -> None:
+    """Test the journal of a store with the default encoder uses orjson."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(
+        hass,
+        MOCK_VERSION,
+        MOCK_KEY,
+        encoder=JSONEncoder,
+        journal_key=itemgetter("id"),
+    )
+    items = [{"id": "1", "value": "x" * 100}, {"id": "2", "value": "x" * 100}]
+    with patch(
+        "homeassistant.helpers.storage.json.dumps", wraps=json.dumps
+    ) as json_dumps:
+        await store.async_save({"items": items})
+        items[1] = {"id": "2", "value": "changed"}
+        await store.async_save({"items": items})
+
+    journaled = os.path.exists(store.journal_path)
+    await hass.async_stop(force=True)
+    assert journaled
+    json_dumps.assert_not_called()
+
+
+async def test_storage_writer(tmpdir: py.path.local) -> None:
+    """Test stores are written by priority and queued saves are coalesced."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    written: list[tuple[str, Any]] = []
+    started = threading.Event()
+    release = threading.Event()
+    write_data = storage.Store._write_data
+
+    def _write_data(store: storage.Store, path: str, data: dict[str, Any]) -> None:
+        if store.key == "blocker":
+            started.set()
+            release.wait(5)
+        written.append((store.key, data["data"]))
+        write_data(store, path, data)
+
+    with patch.object(storage.Store, "_write_data", _write_data):
+        tasks = [
+            hass.async_create_task(
+                storage.Store(hass, MOCK_VERSION, "blocker").async_save({"n": 0})
+            )
+        ]
+        await hass.async_add_executor_job(started.wait, 5)
+        tasks.extend(
+            hass.async_create_task(store.async_save({"n": idx}))
+            for idx, store in enumerate(
+                (
+                    storage.Store(hass, MOCK_VERSION, "default"),
+                    storage.Store(hass, MOCK_VERSION, "default"),
+                    storage.Store(hass, MOCK_VERSION, "critical", atomic_writes=True),
+                ),
+                1,
+            )
+        )
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert written == [
+            ("blocker", {"n": 0}),
+            ("critical", {"n": 3}),
+            ("default", {"n": 2}),
+        ]
+        stats = storage.async_get_write_stats(hass)
+        assert stats["default"]["writes"] == 1
+        assert stats["default"]["coalesced"] == 1
+        assert stats["critical"]["writes"] == 1
+        assert stats["blocker"]["max_latency"] >= stats["blocker"]["max_write_time"]
+
+        # Written in the executor once the writer has stopped
+        await hass.data[storage.STORAGE_WRITER].async_stop()
+        store = storage.Store(hass, MOCK_VERSION, "default")
+        await store.async_save({"n": 4})
+        assert written[-1] == ("default", {"n": 4})
+        assert storage.async_get_write_stats(hass)["default"]["writes"] == 2
+
+    assert await storage.Store(hass, MOCK_VERSION, "default").async_load() == {"n": 4}
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+async def test_storage_writer_unexpected_errors(tmpdir: py.path.local) -> None:
+    """Test writes are always resolved when the storage writer fails."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(hass, MOCK_VERSION, "critical", atomic_writes=True)
+
+    # Errors outside of writing the data fail the write, the writer continues
+    with patch(
+        "homeassistant.helpers.storage.os.open", side_effect=ValueError
+    ), pytest.raises(ValueError):
+        await store.async_save({"n": 1})
+    await store.async_save({"n": 2})
+    writer = hass.data[storage.STORAGE_WRITER]
+    assert writer.is_alive()
+
+    write_batch = storage._StorageWriter._write_batch
+    calls = 0
+
+    def _write_batch(self, batch):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise SystemExit
+        write_batch(self, batch)
+
+    # The batch of a writer that stops unexpectedly is still written
+    # and later writes fall back to the executor
+    with patch.object(storage._StorageWriter, "_write_batch", _write_batch):
+        await store.async_save({"n": 3})
+        await hass.async_add_executor_job(writer.join, 5)
+        assert not writer.is_alive()
+        await store.async_save({"n": 4})
+    assert calls == 3
+
+    assert await storage.Store(hass, MOCK_VERSION, "critical").async_load() == {"n": 4}
+    await hass.async_stop(force=True)
+
+
+async def test_storage_writer_loop_closed(tmpdir: py.path.local) -> None:
+    """Test the writes of a batch are all counted when the event loop is closed."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    writer = storage._StorageWriter(hass)
+    assert writer.daemon
+
+    batch = [
+        storage._PendingWrite(
+            storage.Store(hass, MOCK_VERSION, key), {"data": {}}, 0, [Mock(), Mock()]
+        )
+        for key in ("first", "second")
+    ]
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", side_effect=RuntimeError
+    ) as mock_call_soon:
+        writer._write_batch(batch)
+
+    assert mock_call_soon.call_count == 1
+    assert writer.stats["first"].writes == 1
+    assert writer.stats["second"].writes == 1
+    await hass.async_stop(force=True)
@@ -29,7 +29,7 @@ from homeassistant.const import (
     UnitOfSpeed,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import (
     area_registry as ar,
@@ -225,6 +225,101 @@ def test_iterating_all_states_unavailable(hass: HomeAssistant) -> None:
     assert_result_info(info, 1, entities=[], all_states=True)
 
 
+def test_iterating_all_states_selected_by_domain(hass: HomeAssistant) -> None:
+    """Test iterating all states selected by a literal domain only tracks the domain."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.outlet", "on")
+
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('domain', 'eq', 'light') | map(attribute='state') | list }}",
+    )
+    assert_result_info(info, ["on"], entities=[], domains=["light"])
+    assert info.all_states_lifecycle is False
+    assert info.rate_limit == template.DOMAIN_STATES_RATE_LIMIT
+
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('entity_id', 'in', ['switch.outlet']) | list | count }}",
+    )
+    assert_result_info(info, 1, entities=["switch.outlet"])
+    assert info.rate_limit is None
+
+    # Templates that may iterate over other states still track all states
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('domain', 'in', 'light') | list | count }}",
+    )
+    assert_result_info(info, 1, entities=[], all_states=True)
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('domain', 'eq', 'light') | list | count }}"
+        " {{ expand(states) | count }}",
+    )
+    assert_result_info(
+        info, "1 2", entities=["light.kitchen", "switch.outlet"], all_states=True
+    )
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('domain', 'eq', 'light') | list | count }}",
+        {"states": [State("switch.outlet", "on")]},
+    )
+    assert_result_info(info, 0, entities=[], all_states=False)
+
+
+def test_template_static_dependencies() -> None:
+    """Test extracting the states a template references without rendering it."""
+    static = template.template_static_dependencies(
+        "{{ states('sensor.one') }} {{ 'sensor.two' | states }}"
+        "{{ is_state('binary_sensor.one', 'on') }}"
+        "{{ 'binary_sensor.two' is has_value }}"
+        "{{ state_attr('light.one', 'brightness') }}"
+        "{{ states.light.two.state }} {{ states['light.three'] }}"
+        "{{ states.switch | list }} {{ states[variable] }}"
+        "{{ states(variable) }} {{ is_state(variable, 'on') }}"
+    )
+    assert static.entities == {
+        "sensor.one",
+        "sensor.two",
+        "binary_sensor.one",
+        "binary_sensor.two",
+        "light.one",
+        "light.two",
+        "light.three",
+    }
+    assert static.domains == {"switch"}
+    assert static.covers_all_states is True
+
+    for template_str in (
+        "{{ states | count }}",
+        "{{ states | list }}",
+        "{% for state in states %}{{ state }}{% endfor %}",
+        "{% set all = states %}{{ all | list }}",
+        "{{ states | selectattr('domain', 'search', 'light') | list }}",
+        "{{ states | rejectattr('domain', 'eq', 'light') | list }}",
+        "{{ states | selectattr('domain', 'eq', variable) | list }}",
+        "{% include 'other' %}",
+    ):
+        assert (
+            template.template_static_dependencies(template_str).covers_all_states
+            is False
+        )
+
+    static = template.template_static_dependencies("{{ states(")
+    assert static.entities == frozenset()
+    assert static.covers_all_states is False
+
+
+def test_render_error_tracks_referenced_entities(hass: HomeAssistant) -> None:
+    """Test a template failing to render tracks the entities it references."""
+    info = render_to_info(
+        hass, "{{ undefined_function() }}{{ states('sensor.temperature') | float }}"
+    )
+    with pytest.raises(TemplateError):
+        info.result()
+    assert info.entities == {"sensor.temperature"}
+
+
 def test_iterating_domain_states(hass: HomeAssistant) -> None:
     """Test iterating domain states."""
     tmpl_str = "{% for state in states.sensor %}{{ state.state }}{% endfor %}"
@@ -246,6 +341,115 @@ def test_iterating_domain_states(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "tmpl_str",
+    [
+        "{{ states.sensor | selectattr('state', 'eq', 'on') | list | count }}",
+        "{{ states.sensor | map(attribute='state') | map('float', 0) | sum }}",
+        "{{ states.sensor | selectattr('attributes.unit', 'eq', 'W')"
+        " | map(attribute='state') | map('int', 0) | max }}",
+        "{{ states.sensor | rejectattr('state', 'in', ['unavailable', 'unknown'])"
+        " | map(attribute='entity_id') | join(', ') }}"
+        " {{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+    ],
+)
+def test_iterating_domain_states_incrementally(
+    hass: HomeAssistant, tmpl_str: str
+) -> None:
+    """Test templates iterating domain states only render changed states again."""
+    for number in range(5):
+        hass.states.async_set(f"sensor.number_{number}", number, {"unit": "W"})
+    hass.states.async_set("light.kitchen", "on")
+
+    tmpl = template.Template(tmpl_str, hass)
+    info = tmpl.async_render_to_info()
+    assert tmpl._incremental_render
+    assert info.result() == template.Template(tmpl_str, hass).async_render()
+    assert "sensor" in info.domains
+
+    for entity_id, state in (
+        ("sensor.number_1", "on"),
+        ("sensor.number_2", "unavailable"),
+        ("sensor.number_5", "7"),
+        ("light.kitchen", "off"),
+    ):
+        hass.states.async_set(entity_id, state, {"unit": "W"})
+        with patch(
+            "homeassistant.helpers.template._template_state_no_collect",
+            wraps=template._template_state_no_collect,
+        ) as template_state_no_collect:
+            info = tmpl.async_render_to_info()
+        domain = entity_id.split(".")[0]
+        assert template_state_no_collect.call_count == (f"states.{domain}" in tmpl_str)
+        assert info.result() == template.Template(tmpl_str, hass).async_render()
+
+    hass.states.async_remove("sensor.number_0")
+    info = tmpl.async_render_to_info()
+    assert info.result() == template.Template(tmpl_str, hass).async_render()
+
+
+@pytest.mark.parametrize(
+    "tmpl_str",
+    [
+        "{{ states.sensor | first }}",
+        "{{ states.sensor | selectattr('state', 'eq', on) | list | count }}",
+        "{{ states.sensor | selectattr('entity_id', 'is_state', 'on') | list }}",
+        "{{ states.sensor | map('state_attr', 'unit') | list }}",
+        "{{ states.sensor | sort(attribute='state') | list }}",
+        "{{ states.sensor | selectattr('state', 'eq', 'on') | count }}",
+        "{% set states = [] %}{{ states.sensor | list | count }}",
+        "{% macro count() %}{{ states.sensor | list | count }}{% endmacro %}"
+        "{{ count() }}",
+    ],
+)
+def test_iterating_domain_states_not_incrementally(
+    hass: HomeAssistant, tmpl_str: str
+) -> None:
+    """Test templates that cannot iterate domain states incrementally."""
+    tmpl = template.Template(tmpl_str, hass)
+    tmpl.async_render_to_info()
+    assert tmpl._incremental_render is False
+
+
+def test_render_stats(hass: HomeAssistant) -> None:
+    """Test the render times of a template are recorded."""
+    tmpl = template.Template("{{ states('sensor.temperature') }}", hass)
+    tmpl.async_render()
+    # Only the render times of templates that are tracked are recorded
+    assert tmpl.render_stats is None
+
+    tmpl.enable_render_stats()
+    for _ in range(3):
+        tmpl.async_render()
+    tmpl_error = template.Template("{{ 1 / 0 }}", hass)
+    tmpl_error.enable_render_stats()
+    with pytest.raises(TemplateError):
+        tmpl_error.async_render()
+    assert tmpl_error.render_stats.renders == 1
+
+    render_stats = tmpl.render_stats
+    assert render_stats.renders == 3
+    assert render_stats.total_time > 0
+    assert render_stats.as_dict() == {
+        "renders": 3,
+        "total_time": render_stats.total_time,
+        "average_time": render_stats.total_time / 3,
+        "p99_time": render_stats.percentile(99),
+    }
+
+    render_stats = template.RenderStats()
+    assert render_stats.percentile(99) == 0.0
+    for render_time in range(1, 101):
+        render_stats.add(render_time)
+    assert render_stats.percentile(50) == 50
+    assert render_stats.percentile(99) == 99
+    assert render_stats.percentile(100) == 100
+    for _ in range(template.RENDER_TIME_SAMPLES):
+        render_stats.add(1)
+    assert render_stats.percentile(99) == 1
+    assert render_stats.renders == 100 + template.RENDER_TIME_SAMPLES
+
+
 async def test_import(hass: HomeAssistant) -> None:
     """Test that imports work from the config/custom_templates folder."""
     await template.async_load_custom_templates(hass)
@@ -4096,6 +4300,30 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared between environments."""
+    template_string = "{{ 'shared' ~ ' compiled' ~ ' code' }}"
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    hits, misses = template.COMPILED_TEMPLATE_LRU.get_stats()
+
+    # Environments for a custom log function reuse the compiled code
+    log_env = template.TemplateEnvironment(hass, False, False, lambda *args: None)
+    assert log_env.compile(template_string) is tpl._compiled_code
+    assert template.COMPILED_TEMPLATE_LRU.get_stats() == (hits + 1, misses)
+
+    # The code is kept after the template is gone
+    del tpl
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    assert log_env.compile(template_string) is tpl._compiled_code
+
+    # Limited templates are compiled on their own
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    assert limited_env.compile(template_string) is not tpl._compiled_code
+    assert template.COMPILED_TEMPLATE_LRU.get_stats()[1] == misses + 1
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -622,6 +622,13 @@ def test_event_as_dict() -> None:
     assert event.as_dict() == expected
 
 
+def test_state_last_updated_timestamp() -> None:
+    """Test the last updated timestamp of a state."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    state = ha.State("light.kitchen", "on", last_updated=last_time)
+    assert state.last_updated_timestamp == last_time.timestamp()
+
+
 def test_state_as_dict() -> None:
     """Test a State as dictionary."""
     last_time = datetime(1984, 12, 8, 12, 0, 0)
@@ -796,6 +803,139 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners are routed by entity_id and domain."""
+    entity_calls = []
+    domain_calls = []
+
+    @ha.callback
+    def entity_listener(event):
+        """Mock entity listener."""
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event):
+        """Mock domain listener."""
+        domain_calls.append(event)
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub_entity = hass.bus.async_listen_keyed(
+        "test", ["light.Kitchen", "switch.porch"], entity_listener
+    )
+    unsub_domain = hass.bus.async_listen_keyed("test", "light", domain_listener)
+
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+    assert hass.bus.async_keyed_listeners()["test"] == {
+        "light.kitchen": 1,
+        "switch.porch": 1,
+        "light": 1,
+    }
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": "switch.garage"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in entity_calls] == ["light.kitchen"]
+    assert [event.data["entity_id"] for event in domain_calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+
+    unsub_entity()
+    assert hass.bus.async_keyed_listeners()["test"] == {"light": 1}
+    unsub_domain()
+    assert "test" not in hass.bus.async_keyed_listeners()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 1
+    assert len(domain_calls) == 2
+
+
+async def test_eventbus_keyed_listener_entity_id_and_domain(
+    hass: HomeAssistant,
+) -> None:
+    """Test a listener keyed on an entity_id and its domain is called once."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", ["light.kitchen", "light", "light"], listener
+    )
+    assert hass.bus.async_keyed_listeners()["test"] == {
+        "light.kitchen": 1,
+        "light": 1,
+    }
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+    unsub()
+
+
+async def test_eventbus_keyed_listener_run_immediately(hass: HomeAssistant) -> None:
+    """Test keyed listeners can be called immediately."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "light.kitchen", listener, run_immediately=True
+    )
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 1
+    unsub()
+
+    async def coro_listener(event):
+        """Mock coroutine listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(
+            "test", "light.kitchen", coro_listener, run_immediately=True
+        )
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "light.kitchen", listener)
+
+
+async def test_eventbus_dispatch_stats(hass: HomeAssistant) -> None:
+    """Test collecting dispatch statistics."""
+    unsub = hass.bus.async_listen("test", ha.callback(lambda event: None))
+
+    hass.bus.async_fire("test")
+    assert hass.bus.async_dispatch_stats() == {}
+
+    hass.bus.async_set_dispatch_stats(True)
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("no_listeners")
+    await hass.async_block_till_done()
+
+    stats = hass.bus.async_dispatch_stats()
+    assert stats["test"]["fired"] == 2
+    assert stats["test"]["listeners"] >= 2
+    assert stats["test"]["dispatch_time"] >= stats["test"]["max_dispatch_time"]
+    assert stats["no_listeners"]["fired"] == 1
+
+    hass.bus.async_set_dispatch_stats(False)
+    assert hass.bus.async_dispatch_stats() == {}
+    unsub()
+
+
 async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     """Test we can call events immediately."""
     calls = []
@@ -1112,6 +1252,79 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test unchanged attributes are shared with the new state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    assert state2.state == "off"
+    assert state2.attributes is state.attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 200})
+    state3 = hass.states.get("light.bowl")
+    assert state3.attributes == {"brightness": 200}
+    assert state3.attributes is not state2.attributes
+
+
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "off")
+    bowl = hass.states.get("light.bowl")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 200}, False, None),
+            ("light.kitchen", "off", None, False, None),
+            ("switch.porch", "on", None, False, context),
+            ("switch.porch", "off", None, False, context),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "switch.porch",
+    ]
+    assert events[0].data["old_state"] is bowl
+    assert events[0].data["new_state"].attributes == {"brightness": 200}
+    assert events[0].data["new_state"].last_changed == bowl.last_changed
+    assert events[1].data["old_state"] is None
+    assert events[1].data["new_state"].state == "off"
+    assert events[1].context is context
+    assert events[0].context is not context
+    assert events[0].time_fired == events[1].time_fired
+    assert hass.states.get("switch.porch").state == "off"
+    assert hass.states.async_entity_ids("switch") == ["switch.porch"]
+
+
+async def test_statemachine_set_many_invalid_state(hass: HomeAssistant) -> None:
+    """Test an invalid state doesn't prevent the valid states from being written."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ("light.bowl", "on", None, False, None),
+                ("light.kitchen", "x" * 256, None, False, None),
+                ("light.porch", "off", None, False, None),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.kitchen") is None
+    assert hass.states.get("light.porch").state == "off"
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.porch",
+    ]
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
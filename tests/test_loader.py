@@ -6,6 +6,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import HomeAssistant, callback
 
 from .common import MockModule, async_get_persistent_notifications, mock_integration
@@ -733,3 +734,61 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_manifest_snapshot(hass: HomeAssistant, tmp_path) -> None:
+    """Test manifests are only read again when they were modified."""
+    components_path = tmp_path / "components"
+    manifest_path = components_path / "comp" / "manifest.json"
+    manifest_path.parent.mkdir(parents=True)
+    manifest_path.write_text('{"domain": "comp"}')
+    snapshot_path = str(tmp_path / ".storage" / loader.MANIFEST_SNAPSHOT_FILE)
+
+    snapshot = loader.ManifestSnapshot(snapshot_path)
+    assert snapshot.read_json(manifest_path) == {"domain": "comp"}
+    assert snapshot.sub_directories(components_path) == ["comp"]
+    snapshot.save()
+
+    snapshot = loader.ManifestSnapshot(snapshot_path)
+    snapshot.load()
+    with patch("pathlib.Path.read_bytes", side_effect=OSError), patch(
+        "pathlib.Path.iterdir", side_effect=OSError
+    ):
+        assert snapshot.read_json(manifest_path) == {"domain": "comp"}
+        assert snapshot.sub_directories(components_path) == ["comp"]
+    assert snapshot.read_json(components_path / "missing" / "manifest.json") is None
+
+    manifest_path.write_text('{"domain": "comp", "name": "Comp"}')
+    assert snapshot.read_json(manifest_path) == {"domain": "comp", "name": "Comp"}
+    manifest_path.unlink()
+    assert snapshot.read_json(manifest_path) is None
+    snapshot.save()
+
+    # The snapshot is rebuilt for another version of Home Assistant
+    with patch("homeassistant.loader.__version__", "0.1"):
+        snapshot = loader.ManifestSnapshot(snapshot_path)
+        snapshot.load()
+    assert snapshot._files == {}
+    assert snapshot._dirs == {}
+
+
+async def test_integrations_resolved_from_manifest_snapshot(
+    hass: HomeAssistant,
+) -> None:
+    """Test integrations are resolved with the manifest snapshot."""
+    with patch("homeassistant.loader.ManifestSnapshot.load"):
+        await loader.async_load_manifest_snapshot(hass)
+    snapshot = hass.data[loader.DATA_MANIFEST_SNAPSHOT]
+
+    integration = await loader.async_get_integration(hass, "hue")
+    descriptions = await loader.async_get_integration_descriptions(hass)
+    assert descriptions["core"]["integration"]["philips"]["name"] == "Philips"
+    assert str(integration.file_path / "manifest.json") in snapshot._files
+    assert any(path.endswith("integrations.json") for path in snapshot._files)
+
+    with patch("homeassistant.loader.write_utf8_file") as mock_write:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+    assert mock_write.call_args[0][0] == hass.config.path(
+        ".storage", loader.MANIFEST_SNAPSHOT_FILE
+    )